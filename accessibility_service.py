@@ -1,6 +1,10 @@
 import os
 import io
+import hashlib
 import logging
+import threading
+import functools
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from gtts import gTTS
 from pydub import AudioSegment
@@ -8,11 +12,41 @@ import tempfile
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rendered voice clips kept in memory
+TTS_CACHE_SIZE = 256
+
+@functools.lru_cache(maxsize=4096)
+def _high_contrast_format(text: str) -> str:
+    """Apply high-contrast formatting to text (pure, memoized)"""
+    # Use bold and clear separators for better visibility
+    lines = text.split('\n')
+    formatted_lines = []
+    
+    for line in lines:
+        if line.strip():
+            # Make headers and important text bold
+            if line.startswith('#') or line.isupper() or ':' in line:
+                formatted_lines.append(f"**{line.strip()}**")
+            else:
+                formatted_lines.append(line)
+        else:
+            formatted_lines.append(line)
+    
+    # Add clear section separators
+    formatted_text = '\n'.join(formatted_lines)
+    
+    # Add accessibility markers
+    return f"🔹 **ACCESSIBLE MODE** 🔹\n\n{formatted_text}\n\n━━━━━━━━━━━━━━━━━━━━"
+
 class AccessibilityService:
     def __init__(self):
         self.user_preferences = {}  # Store accessibility preferences per user
         self.temp_dir = tempfile.gettempdir()
         
+        # Rendered voice clips keyed by digest of (language, text), LRU-evicted
+        self._tts_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._tts_cache_lock = threading.Lock()
+        
     def toggle_accessibility_mode(self, user_id: str) -> Dict[str, Any]:
         """Toggle accessibility mode for a user"""
         if user_id not in self.user_preferences:
@@ -79,7 +113,46 @@ class AccessibilityService:
         except Exception as e:
             logger.error(f"Error in text-to-speech conversion: {e}")
             return None
-    
+
+    def text_to_speech_bytes(self, text: str, language: str = 'en') -> Optional[bytes]:
+        """Convert text to speech and return OGG/Opus voice bytes without touching disk"""
+        cache_key = hashlib.blake2b(f"{language}\0{text}".encode('utf-8'), digest_size=16).digest()
+        with self._tts_cache_lock:
+            cached = self._tts_cache.get(cache_key)
+            if cached is not None:
+                self._tts_cache.move_to_end(cache_key)
+                return cached
+        
+        try:
+            # Clean and prepare text
+            clean_text = self._clean_text_for_tts(text)
+            if not clean_text:
+                return None
+
+            # Render MP3 straight into memory
+            mp3_buffer = io.BytesIO()
+            gTTS(text=clean_text, lang=language, slow=False).write_to_fp(mp3_buffer)
+            mp3_buffer.seek(0)
+
+            # Optimize audio for voice messages
+            audio = AudioSegment.from_file(mp3_buffer, format="mp3")
+            audio = audio.set_frame_rate(16000).set_channels(1)
+
+            voice_buffer = io.BytesIO()
+            audio.export(voice_buffer, format="ogg", codec="libopus")
+            voice_bytes = voice_buffer.getvalue()
+            
+            with self._tts_cache_lock:
+                self._tts_cache[cache_key] = voice_bytes
+                if len(self._tts_cache) > TTS_CACHE_SIZE:
+                    self._tts_cache.popitem(last=False)
+            
+            return voice_bytes
+
+        except Exception as e:
+            logger.error(f"Error in text-to-speech conversion: {e}")
+            return None
+
     def format_accessible_text(self, text: str, user_id: str) -> str:
         """Format text for accessibility (high contrast, clear structure)"""
         if user_id not in self.user_preferences or not self.user_preferences[user_id].get('high_contrast', False):
@@ -91,27 +164,7 @@ class AccessibilityService:
     
     def _apply_high_contrast_formatting(self, text: str) -> str:
         """Apply high-contrast formatting to text"""
-        # Use bold and clear separators for better visibility
-        lines = text.split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            if line.strip():
-                # Make headers and important text bold
-                if line.startswith('#') or line.isupper() or ':' in line:
-                    formatted_lines.append(f"**{line.strip()}**")
-                else:
-                    formatted_lines.append(line)
-            else:
-                formatted_lines.append(line)
-        
-        # Add clear section separators
-        formatted_text = '\n'.join(formatted_lines)
-        
-        # Add accessibility markers
-        formatted_text = f"🔹 **ACCESSIBLE MODE** 🔹\n\n{formatted_text}\n\n━━━━━━━━━━━━━━━━━━━━"
-        
-        return formatted_text
+        return _high_contrast_format(text)
     
     def _clean_text_for_tts(self, text: str) -> str:
         """Clean text for text-to-speech conversion"""
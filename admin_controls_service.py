@@ -366,7 +366,7 @@ class AdminControlsService:
             
             # Send notification to group
             try:
-                await context.bot.send_message(chat_id=chat_id, text=warning_msg)
+                await context.bot.send_message(chat_id=chat_id, text=warning_msg, parse_mode=None)
             except Exception as e:
                 logger.error(f"Could not send warning message: {e}")
             
@@ -1,12 +1,20 @@
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import wikipedia
 import base64
 from googletrans import Translator, LANGUAGES
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from config import GEMINI_API_KEY
 
+# Shared session so Gemini and CoinGecko calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.1)))
+
 def gemini_chat(prompt):
     url = f"https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY}"
     headers = {"Content-Type": "application/json"}
@@ -16,9 +24,29 @@ def gemini_chat(prompt):
         }]
     }
 
-    response = requests.post(url, headers=headers, json=data)
+    response = _SESSION.post(url, headers=headers, json=data)
     return response.json()
 
+def gemini_chat_stream(prompt) -> Iterator[str]:
+    """Yield the text fragments of a Gemini reply as they arrive (server-sent events)"""
+    url = f"https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash:streamGenerateContent?alt=sse&key={GEMINI_API_KEY}"
+    headers = {"Content-Type": "application/json"}
+    data = {
+        "contents": [{
+            "parts": [{"text": prompt}]
+        }]
+    }
+    
+    with _SESSION.post(url, headers=headers, json=data, stream=True) as response:
+        response.raise_for_status()
+        for event in response.iter_lines(decode_unicode=True):
+            if not event or not event.startswith("data:"):
+                continue
+            for candidate in json.loads(event[5:]).get('candidates', [])[:1]:
+                for part in candidate.get('content', {}).get('parts', []):
+                    if part.get('text'):
+                        yield part['text']
+
 def gemini_vision_analyze(image_path: str, prompt: str = "Describe what you see in this image in detail"):
     """Analyze image using Gemini Vision API"""
     try:
@@ -43,7 +71,7 @@ def gemini_vision_analyze(image_path: str, prompt: str = "Describe what you see
             }]
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = _SESSION.post(url, headers=headers, json=data)
         result = response.json()
         
         if 'candidates' in result and len(result['candidates']) > 0:
@@ -54,6 +82,11 @@ def gemini_vision_analyze(image_path: str, prompt: str = "Describe what you see
     except Exception as e:
         return f"Error analyzing image: {str(e)}"
 
+# Marker lines separating the answers of a batched prompt
+_SECTION_RE = re.compile(r'^[\s*#]*===\s*SECTION (\d+)\s*===[\s*]*$', re.MULTILINE)
+
+CHAT_PREAMBLE = "You are a helpful AI assistant in a Telegram bot. Provide concise, accurate, and friendly responses. Keep responses under 1000 characters when possible.\n\nUser: "
+
 class AIServices:
     def __init__(self):
         # Initialize translator per request to avoid connection issues
@@ -61,10 +94,9 @@ class AIServices:
         wikipedia.set_lang("en")
     
     def chat_with_ai(self, message: str, user_id: str) -> str:
-        """Chat with Gemini AI (default)"""
+        """Chat with Gemini AI (default); reuses the module's pooled HTTP session"""
         try:
-            prompt = f"You are a helpful AI assistant in a Telegram bot. Provide concise, accurate, and friendly responses. Keep responses under 1000 characters when possible.\n\nUser: {message}"
-            response = gemini_chat(prompt)
+            response = gemini_chat(CHAT_PREAMBLE + message)
             
             # Extract text from response
             if 'candidates' in response and len(response['candidates']) > 0:
@@ -76,6 +108,46 @@ class AIServices:
         except Exception as e:
             return f"❌ Gemini Error: {str(e)}"
     
+    def stream_chat(self, message: str, user_id: str) -> Iterator[str]:
+        """Stream a chat_with_ai reply line by line; request errors propagate to the caller"""
+        pending = ""
+        for fragment in gemini_chat_stream(CHAT_PREAMBLE + message):
+            pending += fragment
+            *lines, pending = pending.split('\n')
+            yield from lines
+        if pending:
+            yield pending
+    
+    def chat_with_ai_batch(self, prompts: List[str], user_id: str) -> List[str]:
+        """Answer several independent prompts with one Gemini call, falling back to one call each if the reply can't be split"""
+        if len(prompts) == 1:
+            return [self.chat_with_ai(prompts[0], user_id)]
+        
+        sections = "\n\n".join(f"===SECTION {i}===\n{prompt}" for i, prompt in enumerate(prompts, 1))
+        combined = (
+            f"Answer each of the following {len(prompts)} requests separately. "
+            "Begin each answer with its marker line exactly as written (e.g. ===SECTION 1===) "
+            "and write nothing before the first marker. "
+            "Keep each answer under 1000 characters when possible.\n\n" + sections
+        )
+        # Sent without CHAT_PREAMBLE, whose length limit would otherwise cover all answers together.
+        # If the batched call itself fails, every prompt gets the error rather than a retry that would fail too.
+        try:
+            response = gemini_chat(combined)
+            if not response.get('candidates'):
+                return ["I'm having trouble processing your request right now."] * len(prompts)
+            reply = response['candidates'][0]['content']['parts'][0]['text']
+        except Exception as e:
+            return [f"❌ Gemini Error: {str(e)}"] * len(prompts)
+        
+        # reply splits into [preamble, n1, answer1, n2, answer2, ...]
+        parts = _SECTION_RE.split(reply)
+        answers = {int(num): text.strip() for num, text in zip(parts[1::2], parts[2::2])}
+        if all(answers.get(i) for i in range(1, len(prompts) + 1)):
+            return [answers[i] for i in range(1, len(prompts) + 1)]
+        with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+            return list(pool.map(lambda prompt: self.chat_with_ai(prompt, user_id), prompts))
+    
     def chat_with_gemini(self, message: str, user_id: str) -> str:
         """Chat with Google Gemini with humor and personality"""
         try:
@@ -238,13 +310,11 @@ Question: {question}"""
     def get_crypto_price(self, symbol: str) -> str:
         """Get current cryptocurrency price and basic info"""
         try:
-            import requests
-            
             # Use CoinGecko API (free, no API key required)
             symbol = symbol.lower()
             url = f"https://api.coingecko.com/api/v3/simple/price?ids={symbol}&vs_currencies=usd&include_24hr_change=true&include_market_cap=true"
             
-            response = requests.get(url, timeout=10)
+            response = _SESSION.get(url, timeout=10)
             
             if response.status_code != 200:
                 # Try with common symbol mappings
@@ -268,7 +338,7 @@ Question: {question}"""
                 
                 if symbol in symbol_map:
                     url = f"https://api.coingecko.com/api/v3/simple/price?ids={symbol_map[symbol]}&vs_currencies=usd&include_24hr_change=true&include_market_cap=true"
-                    response = requests.get(url, timeout=10)
+                    response = _SESSION.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -354,7 +424,6 @@ Be realistic and mention this is speculative analysis, not financial advice. Use
             
             for symbol in symbols[:10]:  # Limit to 10 coins
                 try:
-                    import requests
                     symbol_lower = symbol.lower()
                     
                     # Symbol mapping for common coins
@@ -368,7 +437,7 @@ Be realistic and mention this is speculative analysis, not financial advice. Use
                     coin_id = symbol_map.get(symbol_lower, symbol_lower)
                     url = f"https://api.coingecko.com/api/v3/simple/price?ids={coin_id}&vs_currencies=usd&include_24hr_change=true"
                     
-                    response = requests.get(url, timeout=10)
+                    response = _SESSION.get(url, timeout=10)
                     if response.status_code == 200:
                         data = response.json()
                         if data:
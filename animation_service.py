@@ -3,7 +3,6 @@ import random
 from typing import List, Dict, Any
 from telegram import Update, Bot
 from telegram.ext import ContextTypes
-from telegram.constants import ParseMode
 import logging
 
 logger = logging.getLogger(__name__)
@@ -105,7 +104,7 @@ class AnimationService:
             mascot_msg = random.choice(mascot_messages)
             
             # Send initial message
-            message = await update.message.reply_text(f"{mascot_msg}\n{frames[0]}")
+            message = await update.message.reply_text(f"{mascot_msg}\n{frames[0]}", parse_mode=None)
             message_id = message.message_id
             
             # Animate for specified duration
@@ -126,7 +125,7 @@ class AnimationService:
                     await context.bot.edit_message_text(
                         chat_id=update.effective_chat.id,
                         message_id=message_id,
-                        text=animated_text
+                        text=animated_text, parse_mode=None
                     )
                 except Exception:
                     # If edit fails, continue animation
@@ -153,7 +152,7 @@ class AnimationService:
                                    text: str, delay: float = 0.1) -> None:
         """Show typewriter effect for text"""
         try:
-            message = await update.message.reply_text("✍️ Preparing your message...")
+            message = await update.message.reply_text("✍️ Preparing your message...", parse_mode=None)
             message_id = message.message_id
             
             displayed_text = ""
@@ -167,8 +166,7 @@ class AnimationService:
                     await context.bot.edit_message_text(
                         chat_id=update.effective_chat.id,
                         message_id=message_id,
-                        text=cursor_text,
-                        parse_mode=ParseMode.MARKDOWN
+                        text=cursor_text
                     )
                 except Exception:
                     pass
@@ -179,8 +177,7 @@ class AnimationService:
             await context.bot.edit_message_text(
                 chat_id=update.effective_chat.id,
                 message_id=message_id,
-                text=displayed_text,
-                parse_mode=ParseMode.MARKDOWN
+                text=displayed_text
             )
             
         except Exception as e:
@@ -199,10 +196,10 @@ class AnimationService:
                 await context.bot.edit_message_text(
                     chat_id=update.effective_chat.id,
                     message_id=message_id,
-                    text=final_text
+                    text=final_text, parse_mode=None
                 )
             else:
-                await update.message.reply_text(final_text)
+                await update.message.reply_text(final_text, parse_mode=None)
                 
         except Exception as e:
             logger.error(f"Success animation error: {e}")
@@ -223,10 +220,10 @@ class AnimationService:
                 await context.bot.edit_message_text(
                     chat_id=update.effective_chat.id,
                     message_id=message_id,
-                    text=final_text
+                    text=final_text, parse_mode=None
                 )
             else:
-                await update.message.reply_text(final_text)
+                await update.message.reply_text(final_text, parse_mode=None)
                 
         except Exception as e:
             logger.error(f"Error animation error: {e}")
@@ -246,14 +243,14 @@ class AnimationService:
             
             # Animated entrance
             frames = ['🌟', '✨', '💫', '⭐', '🌟']
-            message = await update.message.reply_text(frames[0])
+            message = await update.message.reply_text(frames[0], parse_mode=None)
             message_id = message.message_id
             
             for frame in frames:
                 await context.bot.edit_message_text(
                     chat_id=update.effective_chat.id,
                     message_id=message_id,
-                    text=f"{frame} Loading {self.mascot_name}... {frame}"
+                    text=f"{frame} Loading {self.mascot_name}... {frame}", parse_mode=None
                 )
                 await asyncio.sleep(0.3)
             
@@ -261,7 +258,7 @@ class AnimationService:
             await context.bot.edit_message_text(
                 chat_id=update.effective_chat.id,
                 message_id=message_id,
-                text=greeting
+                text=greeting, parse_mode=None
             )
             
         except Exception as e:
@@ -282,7 +279,7 @@ class AnimationService:
             ]
             
             action = random.choice(actions)
-            await update.message.reply_text(action)
+            await update.message.reply_text(action, parse_mode=None)
             
         except Exception as e:
             logger.error(f"Random action error: {e}")
@@ -298,7 +295,7 @@ class AnimationService:
                                      seconds: int = 5, action: str = "magic") -> int:
         """Show countdown animation with mascot"""
         try:
-            message = await update.message.reply_text(f"⏰ {self.mascot_name} starting countdown...")
+            message = await update.message.reply_text(f"⏰ {self.mascot_name} starting countdown...", parse_mode=None)
             message_id = message.message_id
             
             for i in range(seconds, 0, -1):
@@ -308,7 +305,7 @@ class AnimationService:
                 await context.bot.edit_message_text(
                     chat_id=update.effective_chat.id,
                     message_id=message_id,
-                    text=countdown_text
+                    text=countdown_text, parse_mode=None
                 )
                 await asyncio.sleep(1)
             
@@ -317,7 +314,7 @@ class AnimationService:
             await context.bot.edit_message_text(
                 chat_id=update.effective_chat.id,
                 message_id=message_id,
-                text=blast_text
+                text=blast_text, parse_mode=None
             )
             
             return message_id
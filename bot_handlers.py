@@ -1,12 +1,23 @@
 import os
+import io
+import sys
 import asyncio
 import time
 import logging
+import functools
+from contextlib import asynccontextmanager
+from collections import deque
 # yt_dlp removed - download functionality disabled
 from datetime import datetime, timedelta
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from telegram import Update, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
+from telegram.error import BadRequest, TimedOut
 from ai_services import ai_services
 from utils import UserDatabase, RateLimiter, AdminMessageHandler, escape_markdown
 from config import ADMIN_USER_ID, COMMANDS, SUPPORTED_LANGUAGES
@@ -31,7 +42,7 @@ from professional_tools_service import professional_tools_service
 from advanced_content_service import advanced_content_service
 from blockchain_web3_service import blockchain_web3_service
 from ai_agent_automation_service import ai_agent_automation_service
-from character_customization_service import character_service
+from character_customization_service import get_character_service
 from contextual_help_service import contextual_help_service
 from null_safety_utils import (
     safe_get_user_id, safe_get_username, safe_get_first_name,
@@ -56,6 +67,530 @@ realtime_service = None  # Will be initialized with bot instance
 group_surveillance = None  # Will be initialized with bot instance
 admin_controls = None  # Will be initialized with bot instance
 
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight
+_background_tasks = set()
+
+def _on_background_done(task):
+    """Release a finished background task and log (not raise) its failure"""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Background task failed: {task.exception()}")
+
+def _spawn_background(coro):
+    """Schedule a coroutine without awaiting it"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+# Follow-up messages for long outputs are paced per chat and capped bot-wide
+CHAT_SEND_INTERVAL = 1.0
+_SEND_SEMAPHORE = asyncio.Semaphore(25)
+_chat_send_queues = {}
+
+async def _chat_send_worker(bot, chat_id, queue):
+    """Drain one chat's queue at most one message per CHAT_SEND_INTERVAL"""
+    while True:
+        try:
+            text, parse_mode = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            del _chat_send_queues[chat_id]
+            return
+        try:
+            async with _SEND_SEMAPHORE:
+                await bot.send_message(chat_id=chat_id, text=text, parse_mode=parse_mode)
+        except Exception as e:
+            logger.error(f"Queued send to chat {chat_id} failed: {e}")
+        await asyncio.sleep(CHAT_SEND_INTERVAL)
+
+def _enqueue_chat_messages(bot, chat_id, texts, parse_mode=ParseMode.MARKDOWN):
+    """Queue follow-up messages for a chat, starting its worker if idle"""
+    queue = _chat_send_queues.get(chat_id)
+    start_worker = queue is None
+    if start_worker:
+        queue = _chat_send_queues[chat_id] = asyncio.Queue()
+    for text in texts:
+        queue.put_nowait((text, parse_mode))
+    if start_worker:
+        _spawn_background(_chat_send_worker(bot, chat_id, queue))
+
+def _chunk(text, size=4000):
+    """Yield successive slices of at most size chars, breaking at a space when one is near the end"""
+    i, length = 0, len(text)
+    while i < length:
+        j = min(i + size, length)
+        if j < length:
+            space = text.rfind(' ', i + size // 2, j)
+            if space != -1:
+                j = space + 1
+        yield text[i:j]
+        i = j
+
+# Bounds concurrent content/game generation calls running in worker threads
+_LLM_SEM = asyncio.Semaphore(8)
+
+async def _run_llm(func, *args):
+    """Run a blocking content/game service call in a worker thread under _LLM_SEM"""
+    async with _LLM_SEM:
+        return await asyncio.to_thread(func, *args)
+
+# Telegram shows a chat action for about 5 seconds, so it is refreshed a little sooner
+CHAT_ACTION_REFRESH = 4.0
+
+async def _chat_action_keepalive(bot, chat_id, action):
+    while True:
+        try:
+            await bot.send_chat_action(chat_id=chat_id, action=action)
+        except Exception as e:
+            logger.debug(f"send_chat_action failed for chat {chat_id}: {e}")
+        await asyncio.sleep(CHAT_ACTION_REFRESH)
+
+@asynccontextmanager
+async def _typing(bot, chat_id, action="typing"):
+    """Keep a chat action visible for as long as the block runs"""
+    task = asyncio.create_task(_chat_action_keepalive(bot, chat_id, action))
+    try:
+        yield
+    finally:
+        task.cancel()
+
+# enhanced_vision_service pulls in PIL/OCR dependencies, so it is imported on first /ocr;
+# None until tried, False if the import failed
+_vision_service = None
+
+def _vision():
+    """Return the enhanced vision service, importing it once; None if unavailable"""
+    global _vision_service
+    if _vision_service is None:
+        try:
+            from enhanced_vision_service import enhanced_vision_service
+            _vision_service = enhanced_vision_service
+        except ImportError:
+            _vision_service = False
+    return _vision_service or None
+
+# Canonical (interned) spellings of the coin symbols users ask for most
+SYMBOL_CANONICAL = {s: sys.intern(s) for s in (
+    'btc', 'eth', 'ada', 'sol', 'bnb', 'xrp', 'dot', 'doge', 'avax', 'matic',
+    'link', 'uni', 'ltc', 'atom', 'icp', 'bitcoin', 'ethereum', 'cardano',
+    'solana', 'binancecoin', 'ripple', 'polkadot', 'dogecoin'
+)}
+
+# Coins shown on the /live feed
+LIVE_FEED_COINS = ("bitcoin", "ethereum", "cardano", "solana", "binancecoin")
+
+ADMIN_USER_ID_INT = int(ADMIN_USER_ID)
+
+# Dialling prefix -> country code for /free_sms
+_PHONE_PREFIX_TO_CC = {'+44': 'UK', '+49': 'DE', '+1': 'US'}
+_PHONE_PREFIX_LENS = sorted({len(prefix) for prefix in _PHONE_PREFIX_TO_CC}, reverse=True)
+
+# Minimum seconds between progress edits of a status message (Telegram flood limit)
+DEFAULT_STREAMING_EDIT_INTERVAL = 0.8
+
+# Identical admin button presses within this many seconds are handled once
+ADMIN_CALLBACK_COALESCE_WINDOW = 0.4
+
+# (chat_id, message_id, action) of admin panel edits currently being rendered
+_INFLIGHT_EDITS = set()
+
+def _is_admin(update):
+    """Check whether the update comes from the bot administrator"""
+    return update.effective_user.id == ADMIN_USER_ID_INT
+
+# Seconds a group member's status is reused by /settings before asking Telegram again
+CHAT_MEMBER_STATUS_TTL = 60
+_ADMIN_STATUS_CACHE = {}
+
+async def _get_chat_member_status(bot, chat_id, user_id):
+    """Return a member's status in a chat, cached per (chat_id, user_id) for CHAT_MEMBER_STATUS_TTL"""
+    key = (chat_id, user_id)
+    now = time.monotonic()
+    entry = _ADMIN_STATUS_CACHE.get(key)
+    if entry and now - entry[0] < CHAT_MEMBER_STATUS_TTL:
+        return entry[1]
+    chat_member = await bot.get_chat_member(chat_id, user_id)
+    if len(_ADMIN_STATUS_CACHE) >= 1024:
+        _ADMIN_STATUS_CACHE.clear()
+    _ADMIN_STATUS_CACHE[key] = (now, chat_member.status)
+    return chat_member.status
+
+def _canonical_symbol(raw):
+    """Lowercase a coin symbol once and return its interned form"""
+    lowered = raw.lower()
+    return SYMBOL_CANONICAL.get(lowered) or sys.intern(lowered)
+
+# Static /character and /help_bubbles texts
+CHARACTER_INFO_TEMPLATE = (
+    "🎭 **Your BotBuddy Character**\n\n"
+    "**Current:** {name}\n"
+    "**Style:** {description}\n\n"
+    "**Custom Expressions:** {expressions_count}\n"
+    "**Last Updated:** {last_updated}\n\n"
+    "**Available Characters:**\n"
+)
+
+CHARACTER_USAGE_HELP = (
+    "\n**Usage:**\n"
+    "• `/character set <type>` - Change character\n"
+    "• `/character preview <type>` - Preview character\n"
+    "• `/character customize <mood> <emoji>` - Add custom emoji\n"
+    "• `/character reset` - Reset to default\n"
+)
+
+CHARACTER_INVALID_CMD = (
+    "❌ Invalid command usage.\n\n"
+    "**Available commands:**\n"
+    "• `/character` - Show current character\n"
+    "• `/character set <type>` - Change character\n"
+    "• `/character preview <type>` - Preview character\n"
+    "• `/character customize <mood> <emoji>` - Add custom emoji\n"
+    "• `/character reset` - Reset to default"
+)
+
+HELP_BUBBLES_INFO_TEMPLATE = (
+    "💡 **Contextual Help System**\n\n"
+    "Smart help bubbles that appear when you need guidance!\n\n"
+    "**Your Help Stats:**\n"
+    "• Total helps received: {total_helps}\n"
+    "• Different scenarios: {scenario_count}\n\n"
+    "**Features:**\n"
+    "• Personality-matched help messages\n"
+    "• Context-aware assistance\n"
+    "• Smart cooldown system\n"
+    "• Witty explanations based on your character\n\n"
+    "**Commands:**\n"
+    "• `/help_bubbles stats` - View detailed statistics\n"
+    "• `/help_bubbles reset` - Reset help history\n"
+    "• `/help_bubbles demo` - See personality examples\n"
+)
+
+HELP_BUBBLES_INVALID = (
+    "❌ Invalid command usage.\n\n"
+    "**Available commands:**\n"
+    "• `/help_bubbles` - Show help system info\n"
+    "• `/help_bubbles stats` - View statistics\n"
+    "• `/help_bubbles reset` - Reset history\n"
+    "• `/help_bubbles demo` - See personality examples"
+)
+
+# Static admin panel pages (pre-rendered HTML)
+ADMIN_BROADCAST_TEXT = """📢 <b>BROADCAST SYSTEM</b>
+
+Send messages to all users or specific groups.
+
+<b>Usage:</b>
+• <code>/broadcast Your message here</code> - Send to all users
+• Rate limit: ∞ Unlimited broadcasts
+• Delivery tracking included
+
+<b>Recent Broadcasts:</b>
+• All messages delivered successfully
+• No failed deliveries reported"""
+
+ADMIN_MESSAGES_TEXT = """💬 <b>MESSAGE MANAGEMENT</b>
+
+View and respond to user messages.
+
+<b>Commands:</b>
+• <code>/logs</code> - View all user activity
+• <code>/reply &lt;user_id&gt; &lt;message&gt;</code> - Respond to users
+• All messages automatically logged
+
+<b>Recent Activity:</b>
+• All user interactions monitored
+• Complete message history available
+• Real-time logging active"""
+
+ADMIN_BAN_MUTE_TEXT = """🚫 <b>BAN &amp; MUTE CONTROLS</b>
+
+Quick moderation actions:
+
+<b>Commands:</b>
+• <code>/ban &lt;user_id&gt; [reason]</code> - Ban user
+• <code>/mute &lt;user_id&gt; [minutes] [reason]</code> - Mute user
+• <code>/unban &lt;user_id&gt;</code> - Remove ban
+• <code>/unmute &lt;user_id&gt;</code> - Remove mute
+
+<b>Auto-Moderation:</b>
+• Spam detection: ✅ Active
+• Link blocking: ✅ Active
+• Word filtering: ✅ Active"""
+
+ADMIN_LOGS_TEXT = """📝 <b>SYSTEM LOGS</b>
+
+Access all system logs and user activity.
+
+<b>Available Logs:</b>
+• User activity logs (secret)
+• Group surveillance data
+• SMS delivery logs
+• Moderation action logs
+• System error logs
+
+<b>Usage:</b>
+• <code>/logs</code> - View recent user activity
+• All data automatically captured"""
+
+ADMIN_MAIN_TEMPLATE = """🔐 <b>ADMIN CONTROL PANEL</b>
+
+Welcome to the comprehensive admin dashboard. All bot features and controls are accessible here.
+
+<b>Current Status:</b>
+• Total Users: {user_count}
+• Active Surveillance: ✅ Monitoring all groups
+• SMS Service: {sms_status}
+• Moderation: ✅ Auto-moderation active
+• Rate Limits: ∞ Unlimited for all features
+
+Click any button below to access admin features:"""
+
+ADMIN_SETTINGS_TEMPLATE = """⚙️ <b>SYSTEM SETTINGS</b>
+
+Current Configuration:
+
+<b>Rate Limits:</b>
+• Messages: ∞ Unlimited
+• Downloads: ∞ Unlimited
+• Broadcasts: ∞ Unlimited
+• SMS: ∞ Unlimited
+
+<b>Services:</b>
+• AI Chat: ✅ Gemini Active
+• Surveillance: ✅ All Groups
+• Moderation: ✅ Auto-Active
+• SMS Service: {sms_status}"""
+
+ADMIN_SYSTEM_TEXT = """🔄 <b>SYSTEM STATUS</b>
+
+<b>Bot Status:</b> ✅ Online and operational
+<b>Uptime:</b> Continuous monitoring active
+<b>Services:</b> All systems functional
+
+<b>Components:</b>
+• Telegram API: ✅ Connected
+• AI Services: ✅ Gemini Online
+• Database: ✅ Operational
+• File Storage: ✅ Available
+• Surveillance: ✅ Active
+• Moderation: ✅ Running
+
+<b>Performance:</b>
+• Response Time: &lt; 1 second
+• Success Rate: 99.9%
+• Error Rate: &lt; 0.1%"""
+
+# Admin panel keyboards (immutable, shared across requests)
+ADMIN_PANEL_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📊 Bot Statistics", callback_data="admin_stats"),
+        InlineKeyboardButton("📱 SMS Service", callback_data="admin_sms")
+    ],
+    [
+        InlineKeyboardButton("🕵️ Surveillance", callback_data="admin_surveillance"),
+        InlineKeyboardButton("🛡️ Moderation", callback_data="admin_moderation")
+    ],
+    [
+        InlineKeyboardButton("📢 Broadcast", callback_data="admin_broadcast"),
+        InlineKeyboardButton("💬 Messages", callback_data="admin_messages")
+    ],
+    [
+        InlineKeyboardButton("🚫 Ban/Mute", callback_data="admin_ban_mute"),
+        InlineKeyboardButton("📝 Logs", callback_data="admin_logs")
+    ],
+    [
+        InlineKeyboardButton("⚙️ Settings", callback_data="admin_settings"),
+        InlineKeyboardButton("🔄 System", callback_data="admin_system")
+    ]
+])
+
+# "Back" row shared by every admin sub-panel keyboard
+ADMIN_BACK_ROW = (InlineKeyboardButton("🔙 Back", callback_data="admin_main"),)
+
+ADMIN_BACK_KEYBOARD = InlineKeyboardMarkup([ADMIN_BACK_ROW])
+
+ADMIN_BACK_TO_PANEL_KEYBOARD = InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back to Panel", callback_data="admin_main")]])
+
+ADMIN_SMS_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📱 Send SMS", callback_data="admin_sms_send")],
+    [InlineKeyboardButton("📊 View Stats", callback_data="admin_sms_stats")],
+    [InlineKeyboardButton("🌍 Countries", callback_data="admin_sms_countries")],
+    ADMIN_BACK_ROW
+])
+
+ADMIN_SURVEILLANCE_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Data", callback_data="admin_surv_data")],
+    [InlineKeyboardButton("🔍 Search Messages", callback_data="admin_surv_search")],
+    ADMIN_BACK_ROW
+])
+
+ADMIN_MODERATION_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🚫 Ban User", callback_data="admin_mod_ban")],
+    [InlineKeyboardButton("🔇 Mute User", callback_data="admin_mod_mute")],
+    [InlineKeyboardButton("📝 Banned Words", callback_data="admin_mod_words")],
+    ADMIN_BACK_ROW
+])
+
+# Response templates for the content and game commands
+_MEME_TEMPLATE = (
+    "🎭 **Custom Meme Generated!**\n\n"
+    "**Template:** {template}\n"
+    "**Your Topic:** {topic}\n\n"
+    "**Meme Content:**\n{content}..."
+)
+_OCR_TEMPLATE = (
+    "🔍 **OCR Text Extraction Results**\n\n"
+    "**Extracted Text:**\n```\n{text}\n```\n\n"
+    "**Word Count:** {word_count}\n"
+    "**Confidence:** {confidence:.1f}%\n"
+    "**Languages Detected:** {languages}\n"
+    "**Text Regions:** {text_regions}"
+)
+_OCR_NO_TEXT = (
+    "🔍 **OCR Text Extraction Results**\n\n"
+    "No text detected in the image. The image might not contain readable text or the text might be too blurry."
+)
+_STORY_TEMPLATE = "📖 **Generated Story ({genre} - {word_count} words)**\n\n{story}"
+_WORKOUT_TEMPLATE = (
+    "🏋️ **Personalized Workout Plan**\n\n"
+    "**Profile:** {profile}\n"
+    "**Goals:** {goals}\n"
+    "**Duration:** {duration}\n\n"
+    "{plan}"
+)
+_RECIPE_TEMPLATE = "🍽️ **Custom {cuisine} Recipe**\n\n{recipe}"
+_TRIVIA_TEMPLATE = (
+    "🎮 **Trivia Game Started!**\n\n"
+    "**Category:** {cat}\n"
+    "**Difficulty:** {diff}\n"
+    "**Question {qn}/{qt}**\n\n"
+    "**{question}**\n\n"
+    "{options_block}\n"
+    "\nReply with A, B, C, or D to answer!"
+)
+_WORDGAME_TEMPLATE = (
+    "🎮 **{title} Game**\n\n"
+    "**Instructions:** {instructions}\n\n"
+    "{details}"
+    "Send your response to play!"
+)
+# Word game result key -> detail block (first matching key wins)
+_WORDGAME_DETAILS = (
+    ('starting_word', "**Starting Word:** {starting_word}\n\n"),
+    ('scrambled_word', "**Scrambled Word:** `{scrambled_word}`\n"
+                       "**Word Length:** {word_length} letters\n"
+                       "**Difficulty:** {difficulty}\n\n"),
+    ('target_word', "**Find words that rhyme with:** {target_word}\n\n"),
+    ('story_start', "**Story so far:**\n{story_start}\n\n")
+)
+
+# /settings feature allowlist and usage text
+_AVAILABLE_FEATURES = frozenset(group_settings_service.get_available_features())
+
+_SETTINGS_HELP = (
+    "📝 **Usage:**\n"
+    "`/settings` - Show current settings\n"
+    "`/settings <feature> on` - Enable feature\n"
+    "`/settings <feature> off` - Disable feature\n\n"
+    "**Available features:**\n"
+    "• auto_responses - AI auto-responses\n"
+    "• media_downloads - Media downloads\n"
+    "• translation - Language translation\n"
+    "• crypto_updates - Crypto price updates\n"
+    "• accessibility_features - Accessibility support\n"
+    "• voice_transcription - Voice transcription\n"
+    "• spam_protection - Spam protection\n"
+    "• word_filtering - Word filtering\n"
+    "• new_member_screening - New member screening\n"
+    "• auto_moderation - Auto moderation\n"
+    "• welcome_messages - Welcome messages"
+)
+
+# Fixed admin pages: callback data -> (HTML text, reply markup)
+_ADMIN_STATIC = {
+    "admin_broadcast": (ADMIN_BROADCAST_TEXT, ADMIN_BACK_KEYBOARD),
+    "admin_messages": (ADMIN_MESSAGES_TEXT, ADMIN_BACK_KEYBOARD),
+    "admin_ban_mute": (ADMIN_BAN_MUTE_TEXT, ADMIN_BACK_KEYBOARD),
+    "admin_logs": (ADMIN_LOGS_TEXT, ADMIN_BACK_KEYBOARD),
+    "admin_system": (ADMIN_SYSTEM_TEXT, ADMIN_BACK_KEYBOARD)
+}
+
+# Character/mood pairs shown by /personality
+PERSONALITY_SHOWCASE = (
+    ("cheerful", "greeting"),
+    ("cool", "working"),
+    ("energetic", "success"),
+    ("zen", "thinking"),
+    ("funny", "error"),
+    ("professional", "greeting")
+)
+
+_PERSONALITY_SHOWCASE_CACHE = None
+
+def _build_personality_showcase():
+    """Render the /personality showcase once from the character templates"""
+    global _PERSONALITY_SHOWCASE_CACHE
+    parts = ["🎭 **BotBuddy Personality Showcase**\n\n"]
+    
+    for char_type, mood in PERSONALITY_SHOWCASE:
+        temp_char = get_character_service().character_templates[char_type]
+        expressions = temp_char["expressions"][mood]
+        phrases = temp_char["phrases"][mood]
+        
+        emoji = expressions[0] if expressions else "🤖"
+        phrase = phrases[0] if phrases else "Hello!"
+        
+        parts.append(f"**{temp_char['name']}:**\n{emoji} *{phrase}*\n\n")
+    
+    parts.append("Use `/character set <type>` to choose your personality!")
+    response = "".join(parts)
+    _PERSONALITY_SHOWCASE_CACHE = response
+    return response
+
+# Scenarios shown by /help_bubbles demo
+HELP_DEMO_SCENARIOS = (
+    ("command_not_found", "typing invalid command"),
+    ("download_no_url", "using download without URL"),
+    ("error_recovery", "when something goes wrong")
+)
+
+@functools.lru_cache(maxsize=1)
+def _render_help_demo():
+    """Render the /help_bubbles demo from the help and character templates"""
+    parts = ["🎭 **Help Personality Demo**\n\n",
+             "See how help messages adapt to your character:\n\n"]
+    
+    for scenario, description in HELP_DEMO_SCENARIOS:
+        parts.append(f"**{description.title()}:**\n")
+        
+        # Get help for different character types
+        help_templates = contextual_help_service.help_scenarios[scenario]['help_templates']
+        for char_type in ["cheerful", "cool", "funny"]:
+            if char_type in help_templates:
+                example_help = help_templates[char_type][0]
+                char_name = get_character_service().character_templates[char_type]['name']
+                parts.append(f"• *{char_name}:* {example_help}\n")
+        
+        parts.append("\n")
+    
+    parts.append("Use `/character set <type>` to change your personality!")
+    return "".join(parts)
+
+@functools.lru_cache(maxsize=1)
+def _character_rows():
+    """(character id, "`id` - Name") pairs for the /character listing"""
+    return tuple(
+        (char_id, f"`{char_id}` - {char['name']}")
+        for char_id, char in get_character_service().get_available_characters().items()
+    )
+
+def clear_personality_cache():
+    """Drop cached showcase/demo renders after character templates change"""
+    global _PERSONALITY_SHOWCASE_CACHE
+    _PERSONALITY_SHOWCASE_CACHE = None
+    _render_help_demo.cache_clear()
+    _character_rows.cache_clear()
+
 class BotHandlers:
     def __init__(self):
         # Download functionality removed per user request
@@ -67,6 +602,32 @@ class BotHandlers:
         self.accessibility_service = accessibility_service
         self.image_analysis_service = image_service
         self.voice_service = voice_service
+        
+        # Subcommand dispatch tables: name -> (minimum args incl. subcommand, handler)
+        self._character_subcommands = {
+            "set": (2, self._char_set),
+            "preview": (2, self._char_preview),
+            "customize": (3, self._char_customize),
+            "reset": (1, self._char_reset)
+        }
+        self._help_bubbles_subcommands = {
+            "stats": (1, self._help_bubbles_stats),
+            "reset": (1, self._help_bubbles_reset),
+            "demo": (1, self._help_bubbles_demo)
+        }
+        
+        # user_id -> (callback data, monotonic time) of the last admin button press
+        self._last_callback = {}
+        
+        # Admin panel callback data -> async renderer returning (text, reply_markup, parse_mode)
+        self._admin_actions = {
+            "admin_main": self._render_admin_main,
+            "admin_stats": self._render_admin_stats,
+            "admin_sms": self._render_admin_sms,
+            "admin_surveillance": self._render_admin_surveillance,
+            "admin_moderation": self._render_admin_moderation,
+            "admin_settings": self._render_admin_settings
+        }
     
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
@@ -132,7 +693,7 @@ Ready to explore? Let's get started! 🚀
         """
         
         if update and update.message:
-            await update.message.reply_text(welcome_message, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(welcome_message)
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
@@ -196,7 +757,7 @@ Use `/contact <your message>` to reach admin for support
 **Everything is simple, powerful, and helpful!**
         """
         
-        await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(help_text)
     
     async def chat_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /chat command"""
@@ -204,7 +765,7 @@ Use `/contact <your message>` to reach admin for support
         
         # Rate limiting
         if not rate_limiter.check_rate_limit(user_id, "messages"):
-            await update.message.reply_text("⏳ Please wait before sending another message. Rate limit: 10 messages per minute.")
+            await update.message.reply_text("⏳ Please wait before sending another message. Rate limit: 10 messages per minute.", parse_mode=None)
             return
         
         user_db.update_user_activity(user_id)
@@ -223,7 +784,7 @@ Ask anything - math, science, coding, creative writing, problem solving!
 • Gemini Pro (Google AI) - Advanced AI for all your questions
 
 Type your message after the command and enjoy unlimited chatting!
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
         message = " ".join(context.args)
@@ -235,14 +796,14 @@ Type your message after the command and enjoy unlimited chatting!
         response = ai_services.chat_with_ai(message, user_id)
         response = f"🤖 **Gemini AI Response:**\n\n{response}"
         
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(response)
     
     async def wiki_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /wiki command"""
         user_id = str(update.effective_user.id)
         
         if not rate_limiter.check_rate_limit(user_id, "messages"):
-            await update.message.reply_text("⏳ Please wait before sending another message.")
+            await update.message.reply_text("⏳ Please wait before sending another message.", parse_mode=None)
             return
         
         user_db.update_user_activity(user_id)
@@ -259,21 +820,21 @@ Type your message after the command and enjoy unlimited chatting!
 • `/wiki Climate change`
 
 Type your search query after the command!
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
         query = " ".join(context.args)
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
         response = ai_services.search_wikipedia(query)
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=False)
+        await update.message.reply_text(response, disable_web_page_preview=False)
     
     async def study_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /study command for educational Q&A"""
         user_id = str(update.effective_user.id)
         
         if not rate_limiter.check_rate_limit(user_id, "messages"):
-            await update.message.reply_text("⏳ Please wait before sending another message.")
+            await update.message.reply_text("⏳ Please wait before sending another message.", parse_mode=None)
             return
         
         user_db.update_user_activity(user_id)
@@ -291,14 +852,14 @@ Type your search query after the command!
 • `/study What caused World War 1?`
 
 Perfect for homework help and learning! 📚
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
         question = " ".join(context.args)
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
         response = ai_services.educational_qa(question)
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(response)
     
     async def download_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /download command - REMOVED"""
@@ -317,8 +878,7 @@ Perfect for homework help and learning! 📚
             "• Cryptocurrency Analysis\n"
             "• Content Generation\n"
             "• Games & Entertainment\n\n"
-            "Type /help to see all available commands.",
-            parse_mode=ParseMode.MARKDOWN
+            "Type /help to see all available commands."
         )
         return
 
@@ -327,7 +887,7 @@ Perfect for homework help and learning! 📚
         user_id = str(update.effective_user.id)
         
         if not rate_limiter.check_rate_limit(user_id, "messages"):
-            await update.message.reply_text("⏳ Please wait before sending another message.")
+            await update.message.reply_text("⏳ Please wait before sending another message.", parse_mode=None)
             return
         
         user_db.update_user_activity(user_id)
@@ -335,7 +895,7 @@ Perfect for homework help and learning! 📚
         if not context.args:
             # Show supported languages
             response = ai_services.get_supported_languages()
-            await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(response)
             return
         
         if len(context.args) < 2:
@@ -362,7 +922,7 @@ Perfect for homework help and learning! 📚
 • `zh` - Chinese
 
 Use `/translate` without arguments to see all supported languages.
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
         target_lang = context.args[0].lower()
@@ -371,7 +931,7 @@ Use `/translate` without arguments to see all supported languages.
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
         response = ai_services.translate_text(text, target_lang)
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(response)
     
     async def accessibility_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /accessibility command"""
@@ -400,7 +960,7 @@ Your messages will now be formatted for better accessibility!"""
 Accessibility features have been turned off.
 Use /accessibility again to re-enable them."""
         
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(response)
     
     async def speak_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /speak command"""
@@ -415,7 +975,7 @@ Use /accessibility again to re-enable them."""
 • `/speak Hello, this is a test`
 • `/speak The weather is beautiful today`
 
-The bot will convert your text to an audio message.""", parse_mode=ParseMode.MARKDOWN)
+The bot will convert your text to an audio message.""")
             return
         
         text = " ".join(context.args)
@@ -424,42 +984,39 @@ The bot will convert your text to an audio message.""", parse_mode=ParseMode.MAR
         user_prefs = accessibility_service.get_user_preferences(user_id)
         language = user_prefs.get('tts_language', 'en')
         
-        status_msg = await update.message.reply_text("🔊 **Converting text to speech...**")
+        status_msg = await update.message.reply_text("🔊 **Converting text to speech...**", parse_mode=None)
         
         # Convert text to speech
-        audio_file = accessibility_service.text_to_speech(text, language)
+        audio_bytes = await asyncio.to_thread(accessibility_service.text_to_speech_bytes, text, language)
         
-        if audio_file and os.path.exists(audio_file):
+        if audio_bytes:
             try:
-                # Send as voice message
-                with open(audio_file, 'rb') as voice:
-                    await context.bot.send_voice(
-                        chat_id=update.effective_chat.id,
-                        voice=voice,
-                        caption=f"🔊 **Text-to-Speech**\n\n_{text[:100]}{'...' if len(text) > 100 else ''}_",
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                
-                # Clean up the audio file
-                os.remove(audio_file)
+                # Send as voice message straight from memory
+                voice = io.BytesIO(audio_bytes)
+                voice.name = "voice.ogg"
+                await context.bot.send_voice(
+                    chat_id=update.effective_chat.id,
+                    voice=voice,
+                    caption=f"🔊 **Text-to-Speech**\n\n_{text[:100]}{'...' if len(text) > 100 else ''}_"
+                )
                 await status_msg.delete()
                 
             except Exception as e:
-                await status_msg.edit_text(f"❌ **Error sending voice message**\n\n{str(e)}")
+                await status_msg.edit_text(f"❌ **Error sending voice message**\n\n{str(e)}", parse_mode=None)
         else:
-            await status_msg.edit_text("❌ **Text-to-speech conversion failed**\n\nPlease try again with different text.")
+            await status_msg.edit_text("❌ **Text-to-speech conversion failed**\n\nPlease try again with different text.", parse_mode=None)
     
     async def broadcast_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /broadcast command (admin only)"""
         user_id = str(update.effective_user.id)
         
         # Check if user is admin
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ This command is only available to administrators.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ This command is only available to administrators.", parse_mode=None)
             return
         
         if not rate_limiter.check_rate_limit(user_id, "broadcasts"):
-            await update.message.reply_text("⏳ Broadcast limit reached. Please wait (5 broadcasts per day).")
+            await update.message.reply_text("⏳ Broadcast limit reached. Please wait (5 broadcasts per day).", parse_mode=None)
             return
         
         if not context.args:
@@ -475,13 +1032,13 @@ The bot will convert your text to an audio message.""", parse_mode=ParseMode.MAR
 `/broadcast Hello everyone! New feature available.`
 
 **Note:** Messages will be sent to all registered users.
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
         message = " ".join(context.args)
         users = user_db.get_all_users()
         
-        status_msg = await update.message.reply_text(f"📢 **Broadcasting...**\n\n👥 Sending to {len(users)} users...")
+        status_msg = await update.message.reply_text(f"📢 **Broadcasting...**\n\n👥 Sending to {len(users)} users...", parse_mode=None)
         
         sent_count = 0
         failed_count = 0
@@ -490,8 +1047,7 @@ The bot will convert your text to an audio message.""", parse_mode=ParseMode.MAR
             try:
                 await context.bot.send_message(
                     chat_id=int(user_id),
-                    text=f"📢 **Broadcast Message**\n\n{message}",
-                    parse_mode=ParseMode.MARKDOWN
+                    text=f"📢 **Broadcast Message**\n\n{message}"
                 )
                 sent_count += 1
                 await asyncio.sleep(0.1)  # Rate limiting
@@ -506,7 +1062,7 @@ The bot will convert your text to an audio message.""", parse_mode=ParseMode.MAR
 👥 Total: {len(users)}
 
 **Message:** {message[:100]}{'...' if len(message) > 100 else ''}
-        """, parse_mode=ParseMode.MARKDOWN)
+        """)
     
     async def contact_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /contact command"""
@@ -525,7 +1081,7 @@ The bot will convert your text to an audio message.""", parse_mode=ParseMode.MAR
 `/contact I'm having trouble with the download feature`
 
 Your message will be forwarded to the bot administrator who will get back to you soon.
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
         message = " ".join(context.args)
@@ -550,8 +1106,7 @@ Your message will be forwarded to the bot administrator who will get back to you
             
             await context.bot.send_message(
                 chat_id=ADMIN_USER_ID,
-                text=admin_message,
-                parse_mode=ParseMode.MARKDOWN
+                text=admin_message
             )
             
             await update.message.reply_text("""
@@ -560,17 +1115,16 @@ Your message will be forwarded to the bot administrator who will get back to you
 Your message has been forwarded to the bot administrator. You should receive a response soon.
 
 Thank you for contacting us! 🙏
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             
         except Exception as e:
-            await update.message.reply_text(f"❌ Failed to send message to admin: {str(e)}")
+            await update.message.reply_text(f"❌ Failed to send message to admin: {str(e)}", parse_mode=None)
     
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /stats command (admin only)"""
-        user_id = str(update.effective_user.id)
         
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ This command is only available to administrators.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ This command is only available to administrators.", parse_mode=None)
             return
         
         stats = user_db.get_user_stats()
@@ -592,14 +1146,12 @@ Thank you for contacting us! 🙏
 Last database update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """
         
-        await update.message.reply_text(stats_text, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(stats_text)
     
     async def reply_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /reply command (admin only)"""
-        user_id = str(update.effective_user.id)
-        
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ This command is only available to administrators.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ This command is only available to administrators.", parse_mode=None)
             return
         
         if len(context.args) < 2:
@@ -610,7 +1162,7 @@ Last database update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 **Example:**
 `/reply 123456789 Thank you for your message. The issue has been resolved.`
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
         target_user_id = context.args[0]
@@ -619,21 +1171,20 @@ Last database update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         try:
             await context.bot.send_message(
                 chat_id=int(target_user_id),
-                text=f"📞 **Admin Reply**\n\n{reply_message}",
-                parse_mode=ParseMode.MARKDOWN
+                text=f"📞 **Admin Reply**\n\n{reply_message}"
             )
             
-            await update.message.reply_text(f"✅ Reply sent to user {target_user_id}")
+            await update.message.reply_text(f"✅ Reply sent to user {target_user_id}", parse_mode=None)
             
         except Exception as e:
-            await update.message.reply_text(f"❌ Failed to send reply: {str(e)}")
+            await update.message.reply_text(f"❌ Failed to send reply: {str(e)}", parse_mode=None)
     async def logs_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /logs command (admin only) - view secret user activity"""
         user_id = str(update.effective_user.id)
         
         # Check if user is admin
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ This command is only available to administrators.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ This command is only available to administrators.", parse_mode=None)
             return
         
         import json
@@ -642,7 +1193,7 @@ Last database update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         log_file = "secret_user_logs.json"
         
         if not os.path.exists(log_file):
-            await update.message.reply_text("📋 No user activity logs found.")
+            await update.message.reply_text("📋 No user activity logs found.", parse_mode=None)
             return
         
         try:
@@ -650,7 +1201,7 @@ Last database update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                 logs = json.load(f)
             
             if not logs:
-                await update.message.reply_text("📋 No user activity recorded yet.")
+                await update.message.reply_text("📋 No user activity recorded yet.", parse_mode=None)
                 return
             
             # Get recent logs (last 10)
@@ -731,10 +1282,10 @@ Last database update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             response += f"🕵️ All activity secretly monitored"
             
             # Send as plain text to avoid parsing issues
-            await update.message.reply_text(response)
+            await update.message.reply_text(response, parse_mode=None)
             
         except Exception as e:
-            await update.message.reply_text(f"❌ Error reading logs: {str(e)}")
+            await update.message.reply_text(f"❌ Error reading logs: {str(e)}", parse_mode=None)
 
     async def crypto_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /crypto command - get cryptocurrency prices"""
@@ -758,17 +1309,17 @@ Last database update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 `/portfolio btc eth ada sol` - Portfolio view
 
 **Supported coins:** BTC, ETH, ADA, SOL, BNB, XRP, DOT, DOGE, AVAX, MATIC, LINK, UNI, LTC, ATOM, ICP and many more!
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
-        symbol = context.args[0]
+        symbol = _canonical_symbol(context.args[0])
         
         try:
             await update.message.reply_chat_action(action="typing")
             price_data = ai_services.get_crypto_price(symbol)
-            await update.message.reply_text(price_data, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(price_data)
         except Exception as e:
-            await update.message.reply_text(f"❌ Error fetching crypto data: {str(e)}")
+            await update.message.reply_text(f"❌ Error fetching crypto data: {str(e)}", parse_mode=None)
 
     async def cryptopredict_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /cryptopredict command - AI-powered price predictions"""
@@ -793,17 +1344,17 @@ Get AI-powered market analysis including:
 • Risk evaluation
 
 ⚠️ Educational purposes only, not financial advice!
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
-        symbol = context.args[0]
+        symbol = _canonical_symbol(context.args[0])
         
         try:
             await update.message.reply_chat_action(action="typing")
             prediction = ai_services.get_crypto_prediction(symbol)
-            await update.message.reply_text(prediction, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(prediction)
         except Exception as e:
-            await update.message.reply_text(f"❌ Error generating prediction: {str(e)}")
+            await update.message.reply_text(f"❌ Error generating prediction: {str(e)}", parse_mode=None)
 
     async def portfolio_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /portfolio command - track multiple cryptocurrencies"""
@@ -826,17 +1377,17 @@ Track up to 10 cryptocurrencies at once with:
 • Portfolio overview
 
 **Popular symbols:** BTC, ETH, ADA, SOL, BNB, XRP, DOT, DOGE, AVAX, MATIC
-            """, parse_mode=ParseMode.MARKDOWN)
+            """)
             return
         
-        symbols = context.args
+        symbols = [_canonical_symbol(s) for s in context.args]
         
         try:
             await update.message.reply_chat_action(action="typing")
             portfolio_data = ai_services.get_crypto_portfolio(symbols)
-            await update.message.reply_text(portfolio_data, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(portfolio_data)
         except Exception as e:
-            await update.message.reply_text(f"❌ Error fetching portfolio data: {str(e)}")
+            await update.message.reply_text(f"❌ Error fetching portfolio data: {str(e)}", parse_mode=None)
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle all messages - auto-respond with Gemini AI and secretly log everything"""
@@ -857,7 +1408,7 @@ Track up to 10 cryptocurrencies at once with:
                     return  # Message was handled by moderation system
         
         if not rate_limiter.check_rate_limit(user_id, "messages"):
-            await update.message.reply_text("⏳ Please slow down. Rate limit: 15 messages per minute.")
+            await update.message.reply_text("⏳ Please slow down. Rate limit: 15 messages per minute.", parse_mode=None)
             return
         
         user_db.update_user_activity(user_id)
@@ -877,10 +1428,9 @@ Track up to 10 cryptocurrencies at once with:
                 'what\'s in', 'whats in'
             ])
             
-            if is_media_question and hasattr(context, 'user_data') and user_id in context.user_data:
-                # Check if user recently sent media (within last 5 messages)
-                user_data = context.user_data.get(user_id, {})
-                recent_media = user_data.get('recent_media', [])
+            if is_media_question:
+                # Check if user recently sent media (last 3 items kept)
+                recent_media = context.user_data.get('recent_media')
                 
                 if recent_media:
                     # Get the most recent media file
@@ -888,72 +1438,67 @@ Track up to 10 cryptocurrencies at once with:
                     media_path = latest_media.get('file_path')
                     media_type = latest_media.get('type')
                     
-                    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+                    _spawn_background(context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"))
                     
                     if media_type == 'photo' and media_path and os.path.exists(media_path):
                         # Analyze the image with user's question
-                        response = ai_services.analyze_image(media_path, message.text)
+                        response = await asyncio.to_thread(ai_services.analyze_image, media_path, message.text)
                     elif media_type == 'video' and media_path:
                         # Analyze video (placeholder for now)
-                        response = ai_services.analyze_video_frame(media_path, message.text)
+                        response = await asyncio.to_thread(ai_services.analyze_video_frame, media_path, message.text)
                     else:
                         # Fall back to regular AI response
-                        response = ai_services.chat_with_ai(message.text, user_id)
+                        response = await asyncio.to_thread(ai_services.chat_with_ai, message.text, user_id)
                     
                     # Apply accessibility formatting
                     formatted_response = accessibility_service.format_accessible_text(response, user_id)
-                    await update.message.reply_text(formatted_response, parse_mode=ParseMode.MARKDOWN)
+                    await update.message.reply_text(formatted_response)
                     
                     # Send TTS if enabled
                     if accessibility_service.should_auto_tts(user_id):
-                        audio_file = accessibility_service.text_to_speech(response)
-                        if audio_file and os.path.exists(audio_file):
+                        audio_bytes = await asyncio.to_thread(accessibility_service.text_to_speech_bytes, response)
+                        if audio_bytes:
                             try:
-                                with open(audio_file, 'rb') as voice:
-                                    await context.bot.send_voice(
-                                        chat_id=update.effective_chat.id,
-                                        voice=voice,
-                                        caption="🔊 Audio version of response"
-                                    )
-                                os.remove(audio_file)
+                                voice = io.BytesIO(audio_bytes)
+                                voice.name = "voice.ogg"
+                                await context.bot.send_voice(
+                                    chat_id=update.effective_chat.id,
+                                    voice=voice,
+                                    caption="🔊 Audio version of response", parse_mode=None
+                                )
                             except Exception:
                                 pass
                     return
             
             # Regular text message - auto-respond with Gemini AI
-            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-            response = ai_services.chat_with_ai(message.text, user_id)
+            _spawn_background(context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"))
+            response = await asyncio.to_thread(ai_services.chat_with_ai, message.text, user_id)
             
             # Apply accessibility formatting if enabled
             formatted_response = accessibility_service.format_accessible_text(response, user_id)
-            await update.message.reply_text(formatted_response, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(formatted_response)
             
             # Send TTS audio if auto-TTS is enabled
             if accessibility_service.should_auto_tts(user_id):
-                audio_file = accessibility_service.text_to_speech(response)
-                if audio_file and os.path.exists(audio_file):
+                audio_bytes = await asyncio.to_thread(accessibility_service.text_to_speech_bytes, response)
+                if audio_bytes:
                     try:
-                        with open(audio_file, 'rb') as voice:
-                            await context.bot.send_voice(
-                                chat_id=update.effective_chat.id,
-                                voice=voice,
-                                caption="🔊 Audio version of response"
-                            )
-                        os.remove(audio_file)
+                        voice = io.BytesIO(audio_bytes)
+                        voice.name = "voice.ogg"
+                        await context.bot.send_voice(
+                            chat_id=update.effective_chat.id,
+                            voice=voice,
+                            caption="🔊 Audio version of response", parse_mode=None
+                        )
                     except Exception:
                         pass  # Silently fail if TTS fails
             
         elif message.photo:
             # Handle photo uploads with vision analysis capability
-            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+            _spawn_background(context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"))
             
             # Store media info for potential analysis
-            if not hasattr(context, 'user_data'):
-                context.user_data = {}
-            if user_id not in context.user_data:
-                context.user_data[user_id] = {}
-            if 'recent_media' not in context.user_data[user_id]:
-                context.user_data[user_id]['recent_media'] = []
+            recent_media = context.user_data.setdefault('recent_media', deque(maxlen=3))
             
             # Get the downloaded file path from surveillance system
             try:
@@ -970,34 +1515,28 @@ Track up to 10 cryptocurrencies at once with:
                     latest_photo = recent_photos[-1]
                     file_path = latest_photo.get('media_info', {}).get('file_path', '')
                     
-                    # Store for potential analysis
-                    context.user_data[user_id]['recent_media'].append({
+                    # Store for potential analysis (deques keep only last 3 items)
+                    entry = {
                         'type': 'photo',
                         'file_path': file_path,
                         'timestamp': latest_photo.get('timestamp')
-                    })
-                    
-                    # Keep only last 3 media items
-                    context.user_data[user_id]['recent_media'] = context.user_data[user_id]['recent_media'][-3:]
+                    }
+                    recent_media.append(entry)
+                    context.user_data.setdefault('recent_photos', deque(maxlen=3)).append(entry)
                     
             except Exception:
                 pass  # Continue even if we can't access logs
             
             # Provide response about photo
-            response = ai_services.chat_with_ai("User sent a photo. Ask them what they'd like to know about it!", user_id)
-            await update.message.reply_text(f"📸 {response}\n\n💡 *Tip: Ask me 'What's in this image?' or 'Describe this photo' for detailed analysis!*", parse_mode=ParseMode.MARKDOWN)
+            response = await asyncio.to_thread(ai_services.chat_with_ai, "User sent a photo. Ask them what they'd like to know about it!", user_id)
+            await update.message.reply_text(f"📸 {response}\n\n💡 *Tip: Ask me 'What's in this image?' or 'Describe this photo' for detailed analysis!*")
             
         elif message.video:
             # Handle video uploads with future analysis capability
-            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+            _spawn_background(context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"))
             
             # Store media info for potential analysis
-            if not hasattr(context, 'user_data'):
-                context.user_data = {}
-            if user_id not in context.user_data:
-                context.user_data[user_id] = {}
-            if 'recent_media' not in context.user_data[user_id]:
-                context.user_data[user_id]['recent_media'] = []
+            recent_media = context.user_data.setdefault('recent_media', deque(maxlen=3))
             
             # Get the downloaded file path from surveillance system
             try:
@@ -1012,31 +1551,29 @@ Track up to 10 cryptocurrencies at once with:
                     latest_video = recent_videos[-1]
                     file_path = latest_video.get('media_info', {}).get('file_path', '')
                     
-                    context.user_data[user_id]['recent_media'].append({
+                    recent_media.append({
                         'type': 'video',
                         'file_path': file_path,
                         'timestamp': latest_video.get('timestamp')
                     })
                     
-                    context.user_data[user_id]['recent_media'] = context.user_data[user_id]['recent_media'][-3:]
-                    
             except Exception:
                 pass
             
-            response = ai_services.chat_with_ai("User sent a video. Ask them what they'd like to know about it!", user_id) 
-            await update.message.reply_text(f"🎥 {response}\n\n💡 *Tip: Ask me 'What's in this video?' for analysis (coming soon)!*", parse_mode=ParseMode.MARKDOWN)
+            response = await asyncio.to_thread(ai_services.chat_with_ai, "User sent a video. Ask them what they'd like to know about it!", user_id)
+            await update.message.reply_text(f"🎥 {response}\n\n💡 *Tip: Ask me 'What's in this video?' for analysis (coming soon)!*")
             
         elif message.document:
             # Handle document uploads
-            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-            response = ai_services.chat_with_ai("User sent a document. Respond naturally about files.", user_id)
-            await update.message.reply_text(f"📄 {response}", parse_mode=ParseMode.MARKDOWN)
+            _spawn_background(context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"))
+            response = await asyncio.to_thread(ai_services.chat_with_ai, "User sent a document. Respond naturally about files.", user_id)
+            await update.message.reply_text(f"📄 {response}")
             
         elif message.audio or message.voice:
             # Handle audio uploads
-            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-            response = ai_services.chat_with_ai("User sent audio. Respond naturally about audio.", user_id)
-            await update.message.reply_text(f"🎵 {response}", parse_mode=ParseMode.MARKDOWN)
+            _spawn_background(context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"))
+            response = await asyncio.to_thread(ai_services.chat_with_ai, "User sent audio. Respond naturally about audio.", user_id)
+            await update.message.reply_text(f"🎵 {response}")
     
     async def _log_user_activity(self, user, message, context):
         """Secretly log all user activity without their knowledge"""
@@ -1065,10 +1602,11 @@ Track up to 10 cryptocurrencies at once with:
                 pass
         
         # Create detailed log entry with all user information
+        now_iso = datetime.now().isoformat()
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "time": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": now_iso,
+            "date": now_iso[:10],
+            "time": now_iso[11:19],
             "user_details": {
                 "user_id": str(user.id),
                 "username": user.username,
@@ -1103,8 +1641,12 @@ Track up to 10 cryptocurrencies at once with:
         
         # Save logs secretly
         try:
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(log_file, 'wb') as f:
+                    f.write(orjson.dumps(logs))
+            else:
+                with open(log_file, 'w', encoding='utf-8') as f:
+                    json.dump(logs, f, ensure_ascii=False, separators=(',', ':'))
         except:
             pass  # Fail silently
     
@@ -1150,22 +1692,12 @@ Track up to 10 cryptocurrencies at once with:
         
         return None
     
+    # Message kinds in detection priority order
+    _KINDS = ("text", "photo", "video", "document", "audio", "voice")
+
     def _get_message_type(self, message):
         """Determine message type"""
-        if message.text:
-            return "text"
-        elif message.photo:
-            return "photo"
-        elif message.video:
-            return "video"
-        elif message.document:
-            return "document"
-        elif message.audio:
-            return "audio"
-        elif message.voice:
-            return "voice"
-        else:
-            return "other"
+        return next((kind for kind in self._KINDS if getattr(message, kind, None)), "other")
     
     def _get_detailed_media_info(self, message):
         """Extract comprehensive media information"""
@@ -1277,19 +1809,18 @@ Track up to 10 cryptocurrencies at once with:
             }
         return None
 
-    def _get_media_info(self, message):
-        """Extract basic media information for compatibility"""
-        return self._get_detailed_media_info(message)
+    # Basic media information, kept for compatibility
+    _get_media_info = _get_detailed_media_info
 
     async def alert_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /alert command - Set price alerts"""
         global realtime_service
         if not realtime_service:
-            await update.message.reply_text("❌ Real-time service not available.")
+            await update.message.reply_text("❌ Real-time service not available.", parse_mode=None)
             return
             
         if not rate_limiter.check_rate_limit(str(update.effective_user.id), "general"):
-            await update.message.reply_text("⏱️ Please wait before sending another message.")
+            await update.message.reply_text("⏱️ Please wait before sending another message.", parse_mode=None)
             return
 
         try:
@@ -1300,16 +1831,16 @@ Track up to 10 cryptocurrencies at once with:
                     "**Examples:**\n"
                     "• `/alert btc above 70000` - Alert when Bitcoin goes above $70,000\n"
                     "• `/alert eth below 2500` - Alert when Ethereum drops below $2,500\n\n"
-                    "You'll get instant notifications when your price targets are hit!"
+                    "You'll get instant notifications when your price targets are hit!", parse_mode=None
                 )
                 return
 
-            symbol = context.args[0].lower()
+            symbol = _canonical_symbol(context.args[0])
             alert_type = context.args[1].lower()
             target_price = float(context.args[2])
             
             if alert_type not in ["above", "below"]:
-                await update.message.reply_text("❌ Alert type must be 'above' or 'below'")
+                await update.message.reply_text("❌ Alert type must be 'above' or 'below'", parse_mode=None)
                 return
 
             user_id = str(update.effective_user.id)
@@ -1323,17 +1854,17 @@ Track up to 10 cryptocurrencies at once with:
             else:
                 response = "❌ Failed to set price alert. Please try again."
             
-            await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(response)
             
         except ValueError:
-            await update.message.reply_text("❌ Invalid price. Please enter a valid number.")
+            await update.message.reply_text("❌ Invalid price. Please enter a valid number.", parse_mode=None)
         except Exception as e:
-            await update.message.reply_text(f"❌ Error setting alert: {str(e)}")
+            await update.message.reply_text(f"❌ Error setting alert: {str(e)}", parse_mode=None)
 
     async def live_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /live command - Show live data feeds"""
         if not rate_limiter.check_rate_limit(str(update.effective_user.id), "general"):
-            await update.message.reply_text("⏱️ Please wait before sending another message.")
+            await update.message.reply_text("⏱️ Please wait before sending another message.", parse_mode=None)
             return
 
         try:
@@ -1341,9 +1872,7 @@ Track up to 10 cryptocurrencies at once with:
             
             # Get real-time crypto prices
             crypto_data = []
-            major_coins = ["bitcoin", "ethereum", "cardano", "solana", "binancecoin"]
-            
-            for coin in major_coins:
+            for coin in LIVE_FEED_COINS:
                 try:
                     price_info = ai_services.get_crypto_price(coin)
                     if "Error" not in price_info:
@@ -1370,157 +1899,131 @@ Track up to 10 cryptocurrencies at once with:
             response += "📈 **Crypto Market:** Always Open 24/7\n\n"
             response += "Use `/alert`, `/newsfeed`, `/weather` for real-time notifications!"
             
-            await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(response)
             
         except Exception as e:
-            await update.message.reply_text(f"❌ Error getting live data: {str(e)}")
+            await update.message.reply_text(f"❌ Error getting live data: {str(e)}", parse_mode=None)
 
     async def subscriptions_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /subscriptions command - Show user's active subscriptions"""
         global realtime_service
         if not realtime_service:
-            await update.message.reply_text("❌ Real-time service not available.")
+            await update.message.reply_text("❌ Real-time service not available.", parse_mode=None)
             return
             
         if not rate_limiter.check_rate_limit(str(update.effective_user.id), "general"):
-            await update.message.reply_text("⏱️ Please wait before sending another message.")
+            await update.message.reply_text("⏱️ Please wait before sending another message.", parse_mode=None)
             return
 
         try:
             user_id = str(update.effective_user.id)
             subscriptions_info = realtime_service.get_user_subscriptions_info(user_id)
-            await update.message.reply_text(subscriptions_info, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(subscriptions_info)
             
         except Exception as e:
-            await update.message.reply_text(f"❌ Error getting subscriptions: {str(e)}")
+            await update.message.reply_text(f"❌ Error getting subscriptions: {str(e)}", parse_mode=None)
 
     async def character_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /character command - Character customization"""
         user_id = str(update.effective_user.id)
         
         # Check user access level
-        if not user_access_service.check_access(user_id, 'basic'):
-            await update.message.reply_text("❌ Command not found.")
+        if not user_access_service.check_access_cached(user_id, 'basic'):
+            await update.message.reply_text("❌ Command not found.", parse_mode=None)
             return
         
         args = context.args
         if not args:
             # Show current character info
-            char_info = character_service.get_user_character_info(user_id)
+            char_info = get_character_service().get_user_character_info(user_id)
             current = char_info['current_character']
             
-            response = f"🎭 **Your BotBuddy Character**\n\n"
-            response += f"**Current:** {current['name']}\n"
-            response += f"**Style:** {current['description']}\n\n"
-            response += f"**Custom Expressions:** {char_info['expressions_count']}\n"
-            response += f"**Last Updated:** {char_info['last_updated']}\n\n"
+            parts = [CHARACTER_INFO_TEMPLATE.format_map({
+                'name': current['name'],
+                'description': current['description'],
+                'expressions_count': char_info['expressions_count'],
+                'last_updated': char_info['last_updated']
+            })]
             
             # Show available characters
-            response += "**Available Characters:**\n"
-            for char_id, char in character_service.get_available_characters().items():
-                indicator = "✅" if char_id == char_info['character_type'] else "🔸"
-                response += f"{indicator} `{char_id}` - {char['name']}\n"
+            current_type = char_info['character_type']
+            parts.extend(
+                f"{'✅' if char_id == current_type else '🔸'} {row}\n"
+                for char_id, row in _character_rows()
+            )
             
-            response += f"\n**Usage:**\n"
-            response += f"• `/character set <type>` - Change character\n"
-            response += f"• `/character preview <type>` - Preview character\n"
-            response += f"• `/character customize <mood> <emoji>` - Add custom emoji\n"
-            response += f"• `/character reset` - Reset to default\n"
+            parts.append(CHARACTER_USAGE_HELP)
+            response = "".join(parts)
             
-            await update.message.reply_text(response, parse_mode='Markdown')
+            await update.message.reply_text(response)
             return
         
-        subcommand = args[0].lower()
-        
-        if subcommand == "set" and len(args) > 1:
-            character_type = args[1].lower()
-            result = character_service.set_user_character(user_id, character_type)
-            
-            if result['success']:
-                # Show character message
-                char_message = character_service.get_character_message(user_id, 'greeting')
-                await update.message.reply_text(
-                    f"✅ {result['message']}\n\n{char_message}"
-                )
-            else:
-                await update.message.reply_text(f"❌ {result['error']}")
-        
-        elif subcommand == "preview" and len(args) > 1:
-            character_type = args[1].lower()
-            preview = character_service.create_mood_preview(character_type)
-            await update.message.reply_text(preview, parse_mode='Markdown')
-        
-        elif subcommand == "customize" and len(args) > 2:
-            mood = args[1].lower()
-            emoji = args[2]
-            result = character_service.customize_expression(user_id, mood, emoji)
-            
-            if result['success']:
-                await update.message.reply_text(f"✅ {result['message']}")
-            else:
-                await update.message.reply_text(f"❌ {result['message']}")
+        entry = self._character_subcommands.get(args[0].lower())
+        if entry and len(args) >= entry[0]:
+            await entry[1](update, user_id, args)
+        else:
+            await update.message.reply_text(CHARACTER_INVALID_CMD, parse_mode=None)
+
+    async def _char_set(self, update, user_id, args):
+        """/character set <type>"""
+        character_type = args[1].lower()
+        result = get_character_service().set_user_character(user_id, character_type)
         
-        elif subcommand == "reset":
-            result = character_service.reset_character(user_id)
-            char_message = character_service.get_character_message(user_id, 'greeting')
+        if result['success']:
+            # Show character message
+            char_message = get_character_service().get_character_message(user_id, 'greeting')
             await update.message.reply_text(
-                f"✅ {result['message']}\n\n{char_message}"
+                f"✅ {result['message']}\n\n{char_message}", parse_mode=None
             )
+        else:
+            await update.message.reply_text(f"❌ {result['error']}", parse_mode=None)
+
+    async def _char_preview(self, update, user_id, args):
+        """/character preview <type>"""
+        character_type = args[1].lower()
+        preview = get_character_service().create_mood_preview(character_type)
+        await update.message.reply_text(preview)
+
+    async def _char_customize(self, update, user_id, args):
+        """/character customize <mood> <emoji>"""
+        mood = args[1].lower()
+        emoji = args[2]
+        result = get_character_service().customize_expression(user_id, mood, emoji)
         
+        if result['success']:
+            await update.message.reply_text(f"✅ {result['message']}", parse_mode=None)
         else:
-            await update.message.reply_text(
-                "❌ Invalid command usage.\n\n"
-                "**Available commands:**\n"
-                "• `/character` - Show current character\n"
-                "• `/character set <type>` - Change character\n"
-                "• `/character preview <type>` - Preview character\n"
-                "• `/character customize <mood> <emoji>` - Add custom emoji\n"
-                "• `/character reset` - Reset to default"
-            )
+            await update.message.reply_text(f"❌ {result['message']}", parse_mode=None)
+
+    async def _char_reset(self, update, user_id, args):
+        """/character reset"""
+        result = get_character_service().reset_character(user_id)
+        await update.message.reply_text(
+            f"✅ {result['message']}\n\n{result['greeting']}", parse_mode=None
+        )
 
     async def personality_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /personality command - Quick personality showcase"""
         user_id = str(update.effective_user.id)
         
         # Check user access level
-        if not user_access_service.check_access(user_id, 'basic'):
-            await update.message.reply_text("❌ Command not found.")
+        if not user_access_service.check_access_cached(user_id, 'basic'):
+            await update.message.reply_text("❌ Command not found.", parse_mode=None)
             return
         
-        # Show personality examples
-        personalities = [
-            ("cheerful", "greeting"),
-            ("cool", "working"),
-            ("energetic", "success"),
-            ("zen", "thinking"),
-            ("funny", "error"),
-            ("professional", "greeting")
-        ]
-        
-        response = "🎭 **BotBuddy Personality Showcase**\n\n"
-        
-        for char_type, mood in personalities:
-            # Temporarily set character and get message
-            temp_char = character_service.character_templates[char_type]
-            expressions = temp_char["expressions"][mood]
-            phrases = temp_char["phrases"][mood]
-            
-            emoji = expressions[0] if expressions else "🤖"
-            phrase = phrases[0] if phrases else "Hello!"
-            
-            response += f"**{temp_char['name']}:**\n"
-            response += f"{emoji} *{phrase}*\n\n"
-        
-        response += "Use `/character set <type>` to choose your personality!"
-        await update.message.reply_text(response, parse_mode='Markdown')
+        # Show personality examples (rendered once, templates are static)
+        response = _PERSONALITY_SHOWCASE_CACHE
+        if response is None:
+            response = _build_personality_showcase()
+        await update.message.reply_text(response)
 
     async def help_bubbles_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help_bubbles command - Contextual help system management"""
         user_id = str(update.effective_user.id)
         
         # Check user access level
-        if not user_access_service.check_access(user_id, 'basic'):
-            await update.message.reply_text("❌ Command not found.")
+        if not user_access_service.check_access_cached(user_id, 'basic'):
+            await update.message.reply_text("❌ Command not found.", parse_mode=None)
             return
         
         args = context.args
@@ -1528,105 +2031,64 @@ Track up to 10 cryptocurrencies at once with:
             # Show help stats and options
             stats = contextual_help_service.get_user_help_stats(user_id)
             
-            response = f"💡 **Contextual Help System**\n\n"
-            response += f"Smart help bubbles that appear when you need guidance!\n\n"
-            response += f"**Your Help Stats:**\n"
-            response += f"• Total helps received: {stats['total_helps']}\n"
-            response += f"• Different scenarios: {len(stats['scenarios'])}\n\n"
-            
-            response += f"**Features:**\n"
-            response += f"• Personality-matched help messages\n"
-            response += f"• Context-aware assistance\n"
-            response += f"• Smart cooldown system\n"
-            response += f"• Witty explanations based on your character\n\n"
+            response = HELP_BUBBLES_INFO_TEMPLATE.format_map({
+                'total_helps': stats['total_helps'],
+                'scenario_count': len(stats['scenarios'])
+            })
             
-            response += f"**Commands:**\n"
-            response += f"• `/help_bubbles stats` - View detailed statistics\n"
-            response += f"• `/help_bubbles reset` - Reset help history\n"
-            response += f"• `/help_bubbles demo` - See personality examples\n"
-            
-            await update.message.reply_text(response, parse_mode='Markdown')
+            await update.message.reply_text(response)
             return
         
-        subcommand = args[0].lower()
+        entry = self._help_bubbles_subcommands.get(args[0].lower())
+        if entry and len(args) >= entry[0]:
+            await entry[1](update, user_id, args)
+        else:
+            await update.message.reply_text(HELP_BUBBLES_INVALID, parse_mode=None)
+
+    async def _help_bubbles_stats(self, update, user_id, args):
+        """/help_bubbles stats"""
+        stats = contextual_help_service.get_user_help_stats(user_id)
         
-        if subcommand == "stats":
-            stats = contextual_help_service.get_user_help_stats(user_id)
-            
-            response = f"📊 **Your Help Statistics**\n\n"
-            response += f"**Total Help Messages:** {stats['total_helps']}\n\n"
-            
-            if stats['scenarios']:
-                response += f"**Help by Scenario:**\n"
-                for scenario, count in stats['scenarios'].items():
-                    scenario_name = scenario.replace('_', ' ').title()
-                    response += f"• {scenario_name}: {count}\n"
-            else:
-                response += f"No help interactions yet! Use commands and I'll provide contextual assistance.\n"
-            
-            await update.message.reply_text(response, parse_mode='Markdown')
-        
-        elif subcommand == "reset":
-            success = contextual_help_service.reset_user_help_history(user_id)
-            if success:
-                char_message = character_service.get_character_message(user_id, 'success')
-                await update.message.reply_text(
-                    f"✅ Help history reset successfully!\n\n{char_message}"
-                )
-            else:
-                await update.message.reply_text("ℹ️ No help history to reset.")
-        
-        elif subcommand == "demo":
-            # Show how help changes with different personalities
-            demo_scenarios = [
-                ("command_not_found", "typing invalid command"),
-                ("download_no_url", "using download without URL"),
-                ("error_recovery", "when something goes wrong")
-            ]
-            
-            response = f"🎭 **Help Personality Demo**\n\n"
-            response += f"See how help messages adapt to your character:\n\n"
-            
-            for scenario, description in demo_scenarios:
-                response += f"**{description.title()}:**\n"
-                
-                # Get help for different character types
-                for char_type in ["cheerful", "cool", "funny"]:
-                    help_templates = contextual_help_service.help_scenarios[scenario]['help_templates']
-                    if char_type in help_templates:
-                        example_help = help_templates[char_type][0]
-                        char_name = character_service.character_templates[char_type]['name']
-                        response += f"• *{char_name}:* {example_help}\n"
-                
-                response += f"\n"
-            
-            response += f"Use `/character set <type>` to change your personality!"
-            await update.message.reply_text(response, parse_mode='Markdown')
+        parts = [f"📊 **Your Help Statistics**\n\n**Total Help Messages:** {stats['total_helps']}\n\n"]
         
+        if stats['scenarios']:
+            parts.append("**Help by Scenario:**\n")
+            for scenario, count in stats['scenarios'].items():
+                scenario_name = scenario.replace('_', ' ').title()
+                parts.append(f"• {scenario_name}: {count}\n")
         else:
+            parts.append("No help interactions yet! Use commands and I'll provide contextual assistance.\n")
+        
+        await update.message.reply_text("".join(parts))
+
+    async def _help_bubbles_reset(self, update, user_id, args):
+        """/help_bubbles reset"""
+        success = contextual_help_service.reset_user_help_history(user_id)
+        if success:
+            char_message = get_character_service().get_character_message(user_id, 'success')
             await update.message.reply_text(
-                "❌ Invalid command usage.\n\n"
-                "**Available commands:**\n"
-                "• `/help_bubbles` - Show help system info\n"
-                "• `/help_bubbles stats` - View statistics\n"
-                "• `/help_bubbles reset` - Reset history\n"
-                "• `/help_bubbles demo` - See personality examples"
+                f"✅ Help history reset successfully!\n\n{char_message}", parse_mode=None
             )
+        else:
+            await update.message.reply_text("ℹ️ No help history to reset.", parse_mode=None)
+
+    async def _help_bubbles_demo(self, update, user_id, args):
+        """/help_bubbles demo - show how help changes with different personalities"""
+        await update.message.reply_text(_render_help_demo())
     
     async def sms_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /sms command - Send SMS to any country (admin only)"""
-        user_id = str(update.effective_user.id)
         
         # Check if user is admin
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Admin access required for SMS messaging.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Admin access required for SMS messaging.", parse_mode=None)
             return
         
         try:
             # Check if SMS service is configured
             if not sms_service.is_service_configured():
                 setup_msg = sms_service.get_setup_instructions()
-                await update.message.reply_text(setup_msg, parse_mode=ParseMode.MARKDOWN)
+                await update.message.reply_text(setup_msg)
                 return
             
             # Parse command arguments
@@ -1655,7 +2117,7 @@ Track up to 10 cryptocurrencies at once with:
 • `/sms +447700900123 UK Your verification code is 123456`
 
 💡 Supports unlimited SMS to any country worldwide!"""
-                await update.message.reply_text(usage_msg, parse_mode=ParseMode.MARKDOWN)
+                await update.message.reply_text(usage_msg)
                 return
             
             # Extract phone number and message
@@ -1665,7 +2127,7 @@ Track up to 10 cryptocurrencies at once with:
             country_code = None
             message_start_idx = 1
             
-            if len(args) > 2 and len(args[1]) <= 3 and args[1].upper() in sms_service.country_codes:
+            if len(args) > 2 and len(args[1]) <= 3 and args[1].upper() in sms_service.country_codes_frozen:
                 country_code = args[1]
                 message_start_idx = 2
             
@@ -1673,11 +2135,11 @@ Track up to 10 cryptocurrencies at once with:
             message = " ".join(args[message_start_idx:])
             
             if not message:
-                await update.message.reply_text("❌ Please provide a message to send.")
+                await update.message.reply_text("❌ Please provide a message to send.", parse_mode=None)
                 return
             
             # Send status message
-            status_msg = await update.message.reply_text("📱 Sending SMS...")
+            status_msg = await update.message.reply_text("📱 Sending SMS...", parse_mode=None)
             
             # Send SMS
             result = await sms_service.send_sms(phone_number, message, country_code)
@@ -1692,7 +2154,7 @@ Track up to 10 cryptocurrencies at once with:
 📊 **Status:** {result['status']}
 
 Message delivered to international SMS gateway!"""
-                await status_msg.edit_text(success_msg, parse_mode=ParseMode.MARKDOWN)
+                await status_msg.edit_text(success_msg)
             else:
                 error_msg = f"""❌ **SMS Failed to Send**
 
@@ -1700,25 +2162,24 @@ Message delivered to international SMS gateway!"""
 ❌ **Error:** {result['error']}
 
 Please check the phone number format and try again."""
-                await status_msg.edit_text(error_msg, parse_mode=ParseMode.MARKDOWN)
+                await status_msg.edit_text(error_msg)
         
         except Exception as e:
-            await update.message.reply_text(f"❌ Error sending SMS: {str(e)}")
+            await update.message.reply_text(f"❌ Error sending SMS: {str(e)}", parse_mode=None)
     
     async def sms_bulk_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /sms_bulk command - Send SMS to multiple numbers (admin only)"""
-        user_id = str(update.effective_user.id)
         
         # Check if user is admin
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Admin access required for bulk SMS.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Admin access required for bulk SMS.", parse_mode=None)
             return
         
         try:
             # Check if SMS service is configured
             if not sms_service.is_service_configured():
                 setup_msg = sms_service.get_setup_instructions()
-                await update.message.reply_text(setup_msg, parse_mode=ParseMode.MARKDOWN)
+                await update.message.reply_text(setup_msg)
                 return
             
             # Parse command arguments
@@ -1736,7 +2197,7 @@ Please check the phone number format and try again."""
 `/sms_bulk +14155552671,+8801712345678,+447700900123 Important announcement for all users!`
 
 💡 Send to unlimited numbers simultaneously!"""
-                await update.message.reply_text(usage_msg, parse_mode=ParseMode.MARKDOWN)
+                await update.message.reply_text(usage_msg)
                 return
             
             # Extract phone numbers and message
@@ -1744,32 +2205,46 @@ Please check the phone number format and try again."""
             message = " ".join(args[1:])
             
             if not message:
-                await update.message.reply_text("❌ Please provide a message to send.")
+                await update.message.reply_text("❌ Please provide a message to send.", parse_mode=None)
                 return
             
-            # Parse phone numbers
-            recipients = []
-            phone_entries = phone_numbers_str.split(',')
-            
-            for entry in phone_entries:
-                entry = entry.strip()
-                if ':' in entry:
-                    # Format: +1234567890:US
-                    phone, country = entry.split(':', 1)
-                    recipients.append({"phone": phone.strip(), "country": country.strip()})
-                else:
-                    # Format: +1234567890
-                    recipients.append({"phone": entry.strip(), "country": ""})
+            # Parse phone numbers: +1234567890 or +1234567890:US
+            recipients = [
+                {"phone": phone.strip(), "country": country.strip()}
+                for entry in phone_numbers_str.split(',')
+                for phone, _, country in (entry.partition(':'),)
+            ]
             
             if not recipients:
-                await update.message.reply_text("❌ No valid phone numbers found.")
+                await update.message.reply_text("❌ No valid phone numbers found.", parse_mode=None)
                 return
             
             # Send status message
-            status_msg = await update.message.reply_text(f"📱 Sending bulk SMS to {len(recipients)} recipients...")
-            
-            # Send bulk SMS
-            result = await sms_service.send_bulk_sms(recipients, message)
+            status_msg = await update.message.reply_text(f"📱 Sending bulk SMS to {len(recipients)} recipients...", parse_mode=None)
+            
+            # Send bulk SMS, coalescing progress into periodic status edits
+            total = len(recipients)
+            done = [0]
+            
+            def on_progress():
+                done[0] += 1
+            
+            async def progress_ticker():
+                shown = 0
+                while True:
+                    await asyncio.sleep(DEFAULT_STREAMING_EDIT_INTERVAL)
+                    if done[0] != shown:
+                        shown = done[0]
+                        try:
+                            await status_msg.edit_text(f"📱 {shown}/{total} sent...", parse_mode=None)
+                        except Exception:
+                            pass
+            
+            ticker = asyncio.create_task(progress_ticker())
+            try:
+                result = await sms_service.send_bulk_sms(recipients, message, on_progress=on_progress)
+            finally:
+                ticker.cancel()
             
             # Format results
             results_msg = f"""📊 **Bulk SMS Results**
@@ -1780,42 +2255,42 @@ Please check the phone number format and try again."""
 
 **Details:**"""
             
-            for detail in result['details'][:10]:  # Show first 10 results
-                status_icon = "✅" if detail['status'] == 'sent' else "❌"
-                results_msg += f"\n{status_icon} {detail['phone']}"
-            
-            if len(result['details']) > 10:
-                results_msg += f"\n... and {len(result['details']) - 10} more recipients"
+            # Show first 10 results
+            details = result['details']
+            lines = [results_msg]
+            lines.extend(f"{'✅' if d['status'] == 'sent' else '❌'} {d['phone']}" for d in details[:10])
+            if len(details) > 10:
+                lines.append(f"... and {len(details) - 10} more recipients")
+            results_msg = "\n".join(lines)
             
-            await status_msg.edit_text(results_msg, parse_mode=ParseMode.MARKDOWN)
+            await status_msg.edit_text(results_msg)
         
         except Exception as e:
-            await update.message.reply_text(f"❌ Error sending bulk SMS: {str(e)}")
+            await update.message.reply_text(f"❌ Error sending bulk SMS: {str(e)}", parse_mode=None)
     
     async def sms_stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /sms_stats command - View SMS statistics (admin only)"""
-        user_id = str(update.effective_user.id)
         
         # Check if user is admin
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Admin access required for SMS statistics.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Admin access required for SMS statistics.", parse_mode=None)
             return
         
         try:
             stats = sms_service.get_sms_statistics()
-            await update.message.reply_text(stats, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(stats)
         
         except Exception as e:
-            await update.message.reply_text(f"❌ Error getting SMS statistics: {str(e)}")
+            await update.message.reply_text(f"❌ Error getting SMS statistics: {str(e)}", parse_mode=None)
     
     async def sms_countries_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /sms_countries command - View supported country codes"""
         try:
             countries = sms_service.get_country_codes_list()
-            await update.message.reply_text(countries, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(countries)
         
         except Exception as e:
-            await update.message.reply_text(f"❌ Error getting country codes: {str(e)}")
+            await update.message.reply_text(f"❌ Error getting country codes: {str(e)}", parse_mode=None)
     
     async def free_sms_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /free_sms command - Send free SMS"""
@@ -1845,7 +2320,7 @@ Please check the phone number format and try again."""
 • Daily usage tracking
 
 Use `/free_sms_countries` to see all supported regions."""
-            await update.message.reply_text(usage_msg, parse_mode=ParseMode.MARKDOWN)
+            await update.message.reply_text(usage_msg)
             return
         
         phone = args[0]
@@ -1854,16 +2329,15 @@ Use `/free_sms_countries` to see all supported regions."""
         # Show loading animation
         loading_message_id = await animation_service.show_loading_animation(update, context, 'tech', 2)
         
-        # Determine country code from phone number
-        country_code = 'US'  # Default
-        if phone.startswith('+44'):
-            country_code = 'UK'
-        elif phone.startswith('+49'):
-            country_code = 'DE'
-        elif phone.startswith('+1'):
-            country_code = 'US'
+        # Determine country code from phone number (longest prefix wins)
+        for length in _PHONE_PREFIX_LENS:
+            country_code = _PHONE_PREFIX_TO_CC.get(phone[:length])
+            if country_code:
+                break
+        else:
+            country_code = 'US'  # Default
         
-        result = free_sms_service.send_free_sms(phone, message, country_code)
+        result = await free_sms_service.send_free_sms_async(phone, message, country_code)
         
         if result['success']:
             success_msg = f"""✅ **SMS Sent Successfully!**
@@ -1877,9 +2351,9 @@ Use `/free_sms_countries` to see all supported regions."""
             
             if loading_message_id:
                 await animation_service.show_success_animation(update, context, loading_message_id)
-                await update.message.reply_text(success_msg, parse_mode=ParseMode.MARKDOWN)
+                await update.message.reply_text(success_msg)
             else:
-                await update.message.reply_text(success_msg, parse_mode=ParseMode.MARKDOWN)
+                await update.message.reply_text(success_msg)
         else:
             error_msg = f"""❌ **SMS Failed**
 
@@ -1892,350 +2366,141 @@ Use `/free_sms_countries` to see all supported regions."""
             if loading_message_id:
                 await animation_service.show_error_animation(update, context, loading_message_id, result['error'])
             else:
-                await update.message.reply_text(error_msg, parse_mode=ParseMode.MARKDOWN)
+                await update.message.reply_text(error_msg)
 
     async def free_sms_stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /free_sms_stats command - View free SMS statistics"""
         stats = free_sms_service.get_free_sms_statistics()
-        await update.message.reply_text(stats, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(stats)
 
     async def free_sms_countries_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /free_sms_countries command - View supported countries"""
         countries = free_sms_service.get_supported_countries_free()
-        await update.message.reply_text(countries, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text(countries)
     
     async def admin_panel_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /admin command - Complete admin control panel (admin only)"""
-        user_id = str(update.effective_user.id)
         
         # Check if user is admin
-        if int(user_id) != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Command not found.")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Command not found.", parse_mode=None)
             return
         
         try:
-            # Create comprehensive admin panel with inline buttons
-            keyboard = [
-                [
-                    InlineKeyboardButton("📊 Bot Statistics", callback_data="admin_stats"),
-                    InlineKeyboardButton("📱 SMS Service", callback_data="admin_sms")
-                ],
-                [
-                    InlineKeyboardButton("🕵️ Surveillance", callback_data="admin_surveillance"),
-                    InlineKeyboardButton("🛡️ Moderation", callback_data="admin_moderation")
-                ],
-                [
-                    InlineKeyboardButton("📢 Broadcast", callback_data="admin_broadcast"),
-                    InlineKeyboardButton("💬 Messages", callback_data="admin_messages")
-                ],
-                [
-                    InlineKeyboardButton("🚫 Ban/Mute", callback_data="admin_ban_mute"),
-                    InlineKeyboardButton("📝 Logs", callback_data="admin_logs")
-                ],
-                [
-                    InlineKeyboardButton("⚙️ Settings", callback_data="admin_settings"),
-                    InlineKeyboardButton("🔄 System", callback_data="admin_system")
-                ]
-            ]
-            
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            admin_message = f"""🔐 **ADMIN CONTROL PANEL**
-
-Welcome to the comprehensive admin dashboard. All bot features and controls are accessible here.
-
-**Current Status:**
-• Total Users: {len(user_db.data.get('users', {}))}
-• Active Surveillance: ✅ Monitoring all groups
-• SMS Service: {'✅ Configured' if sms_service.is_service_configured() else '❌ Setup required'}
-• Moderation: ✅ Auto-moderation active
-• Rate Limits: ∞ Unlimited for all features
-
-Click any button below to access admin features:"""
-
+            admin_message, reply_markup, parse_mode = await self._render_admin_main()
             await update.message.reply_text(
                 admin_message, 
                 reply_markup=reply_markup, 
-                parse_mode=ParseMode.MARKDOWN
+                parse_mode=parse_mode
             )
         
         except Exception as e:
-            await update.message.reply_text(f"❌ Error loading admin panel: {str(e)}")
+            await update.message.reply_text(f"❌ Error loading admin panel: {str(e)}", parse_mode=None)
     
     async def handle_admin_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle admin panel button callbacks"""
         query = update.callback_query
-        user_id = str(query.from_user.id)
         
         # Check if user is admin
-        if int(user_id) != ADMIN_USER_ID:
+        if not _is_admin(update):
             await query.answer("❌ Unauthorized access.", show_alert=True)
             return
         
         await query.answer()
         
+        # Drop a repeated press of the same button within the coalescing window
+        now = time.monotonic()
+        prev = self._last_callback.get(query.from_user.id)
+        if prev and prev[0] == query.data and now - prev[1] < ADMIN_CALLBACK_COALESCE_WINDOW:
+            return
+        self._last_callback[query.from_user.id] = (query.data, now)
+        
+        # Drop the press if the same edit of this message is still being rendered
+        edit_key = (query.message.chat_id, query.message.message_id, query.data)
+        if edit_key in _INFLIGHT_EDITS:
+            return
+        _INFLIGHT_EDITS.add(edit_key)
+        
         try:
-            action = query.data
+            static_page = _ADMIN_STATIC.get(query.data)
+            if static_page:
+                text, reply_markup = static_page
+                await query.edit_message_text(text, reply_markup=reply_markup, parse_mode=ParseMode.HTML)
+                return
             
-            if action == "admin_stats":
-                # Bot statistics
-                stats_msg = f"""📊 **BOT STATISTICS**
+            handler = self._admin_actions.get(query.data)
+            if handler:
+                text, reply_markup, parse_mode = await handler()
+                await query.edit_message_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+        
+        except BadRequest as e:
+            # Re-rendering an unchanged page is not an error
+            if "message is not modified" not in str(e).lower():
+                await query.edit_message_text(
+                    f"❌ Error in admin panel: {str(e)}", reply_markup=ADMIN_BACK_TO_PANEL_KEYBOARD, parse_mode=None
+                )
+        except Exception as e:
+            error_msg = f"❌ Error in admin panel: {str(e)}"
+            await query.edit_message_text(error_msg, reply_markup=ADMIN_BACK_TO_PANEL_KEYBOARD, parse_mode=None)
+        finally:
+            _INFLIGHT_EDITS.discard(edit_key)
+
+    async def _render_admin_main(self):
+        """Main admin control panel"""
+        admin_message = ADMIN_MAIN_TEMPLATE.format(
+            user_count=user_db.user_count,
+            sms_status='✅ Configured' if sms_service.is_service_configured() else '❌ Setup required'
+        )
+        return admin_message, ADMIN_PANEL_KEYBOARD, ParseMode.HTML
 
-👥 **Users:** {len(user_db.data.get('users', {}))}
-📱 **SMS Sent:** {sms_service.sms_logs['statistics']['total_sent']}
-🌍 **Countries Reached:** {len(sms_service.sms_logs['statistics']['countries_reached'])}
-🛡️ **Violations Blocked:** {admin_controls.admin_settings.get('total_violations', 0) if admin_controls else 0}
-🕵️ **Messages Logged:** {len(group_surveillance.group_logs.get('messages', [])) if group_surveillance else 0}
+    async def _render_admin_stats(self):
+        """Bot statistics panel"""
+        stats_msg = f"""📊 <b>BOT STATISTICS</b>
 
-**Recent Activity:**
+👥 <b>Users:</b> {user_db.user_count}
+📱 <b>SMS Sent:</b> {sms_service.sms_logs['statistics']['total_sent']}
+🌍 <b>Countries Reached:</b> {len(sms_service.sms_logs['statistics']['countries_reached'])}
+🛡️ <b>Violations Blocked:</b> {admin_controls.admin_settings.get('total_violations', 0) if admin_controls else 0}
+🕵️ <b>Messages Logged:</b> {len(group_surveillance.group_logs.get('messages', [])) if group_surveillance else 0}
+
+<b>Recent Activity:</b>
 • Active surveillance in all groups
 • Automatic moderation protecting users
 • Real-time monitoring operational
 • All systems functioning normally"""
-                
-                keyboard = [[InlineKeyboardButton("🔙 Back to Panel", callback_data="admin_main")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(stats_msg, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_sms":
-                # SMS service panel
-                if sms_service.is_service_configured():
-                    sms_stats = sms_service.get_sms_statistics()
-                    keyboard = [
-                        [InlineKeyboardButton("📱 Send SMS", callback_data="admin_sms_send")],
-                        [InlineKeyboardButton("📊 View Stats", callback_data="admin_sms_stats")],
-                        [InlineKeyboardButton("🌍 Countries", callback_data="admin_sms_countries")],
-                        [InlineKeyboardButton("🔙 Back", callback_data="admin_main")]
-                    ]
-                else:
-                    sms_stats = sms_service.get_setup_instructions()
-                    keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_main")]]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(sms_stats, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_surveillance":
-                # Surveillance panel
-                if group_surveillance:
-                    surveillance_summary = group_surveillance.get_group_surveillance_summary()
-                else:
-                    surveillance_summary = "🕵️ **Group Surveillance**\n\nSurveillance system ready to monitor groups."
-                
-                keyboard = [
-                    [InlineKeyboardButton("📊 View Data", callback_data="admin_surv_data")],
-                    [InlineKeyboardButton("🔍 Search Messages", callback_data="admin_surv_search")],
-                    [InlineKeyboardButton("🔙 Back", callback_data="admin_main")]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(surveillance_summary, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_moderation":
-                # Moderation panel
-                if admin_controls:
-                    mod_stats = admin_controls.get_moderation_stats()
-                else:
-                    mod_stats = "🛡️ **Moderation System**\n\nModeration tools ready for group management."
-                
-                keyboard = [
-                    [InlineKeyboardButton("🚫 Ban User", callback_data="admin_mod_ban")],
-                    [InlineKeyboardButton("🔇 Mute User", callback_data="admin_mod_mute")],
-                    [InlineKeyboardButton("📝 Banned Words", callback_data="admin_mod_words")],
-                    [InlineKeyboardButton("🔙 Back", callback_data="admin_main")]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(mod_stats, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_broadcast":
-                # Broadcast panel
-                broadcast_msg = """📢 **BROADCAST SYSTEM**
-
-Send messages to all users or specific groups.
-
-**Usage:**
-• `/broadcast Your message here` - Send to all users
-• Rate limit: ∞ Unlimited broadcasts
-• Delivery tracking included
-
-**Recent Broadcasts:**
-• All messages delivered successfully
-• No failed deliveries reported"""
-                
-                keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_main")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(broadcast_msg, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_messages":
-                # Messages panel
-                messages_msg = """💬 **MESSAGE MANAGEMENT**
-
-View and respond to user messages.
-
-**Commands:**
-• `/logs` - View all user activity
-• `/reply <user_id> <message>` - Respond to users
-• All messages automatically logged
-
-**Recent Activity:**
-• All user interactions monitored
-• Complete message history available
-• Real-time logging active"""
-                
-                keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_main")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(messages_msg, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_ban_mute":
-                # Ban/Mute quick actions
-                ban_mute_msg = """🚫 **BAN & MUTE CONTROLS**
-
-Quick moderation actions:
-
-**Commands:**
-• `/ban <user_id> [reason]` - Ban user
-• `/mute <user_id> [minutes] [reason]` - Mute user
-• `/unban <user_id>` - Remove ban
-• `/unmute <user_id>` - Remove mute
-
-**Auto-Moderation:**
-• Spam detection: ✅ Active
-• Link blocking: ✅ Active
-• Word filtering: ✅ Active"""
-                
-                keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_main")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(ban_mute_msg, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_logs":
-                # Logs panel
-                logs_msg = """📝 **SYSTEM LOGS**
-
-Access all system logs and user activity.
-
-**Available Logs:**
-• User activity logs (secret)
-• Group surveillance data
-• SMS delivery logs
-• Moderation action logs
-• System error logs
-
-**Usage:**
-• `/logs` - View recent user activity
-• All data automatically captured"""
-                
-                keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_main")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(logs_msg, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_settings":
-                # Settings panel
-                settings_msg = """⚙️ **SYSTEM SETTINGS**
-
-Current Configuration:
-
-**Rate Limits:**
-• Messages: ∞ Unlimited
-• Downloads: ∞ Unlimited
-• Broadcasts: ∞ Unlimited
-• SMS: ∞ Unlimited
-
-**Services:**
-• AI Chat: ✅ Gemini Active
-• Surveillance: ✅ All Groups
-• Moderation: ✅ Auto-Active
-• SMS Service: {'✅ Configured' if sms_service.is_service_configured() else '❌ Setup Required'}"""
-                
-                keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_main")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(settings_msg, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_system":
-                # System panel
-                system_msg = """🔄 **SYSTEM STATUS**
-
-**Bot Status:** ✅ Online and operational
-**Uptime:** Continuous monitoring active
-**Services:** All systems functional
-
-**Components:**
-• Telegram API: ✅ Connected
-• AI Services: ✅ Gemini Online
-• Database: ✅ Operational
-• File Storage: ✅ Available
-• Surveillance: ✅ Active
-• Moderation: ✅ Running
-
-**Performance:**
-• Response Time: < 1 second
-• Success Rate: 99.9%
-• Error Rate: < 0.1%"""
-                
-                keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_main")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await query.edit_message_text(system_msg, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            
-            elif action == "admin_main":
-                # Return to main admin panel
-                keyboard = [
-                    [
-                        InlineKeyboardButton("📊 Bot Statistics", callback_data="admin_stats"),
-                        InlineKeyboardButton("📱 SMS Service", callback_data="admin_sms")
-                    ],
-                    [
-                        InlineKeyboardButton("🕵️ Surveillance", callback_data="admin_surveillance"),
-                        InlineKeyboardButton("🛡️ Moderation", callback_data="admin_moderation")
-                    ],
-                    [
-                        InlineKeyboardButton("📢 Broadcast", callback_data="admin_broadcast"),
-                        InlineKeyboardButton("💬 Messages", callback_data="admin_messages")
-                    ],
-                    [
-                        InlineKeyboardButton("🚫 Ban/Mute", callback_data="admin_ban_mute"),
-                        InlineKeyboardButton("📝 Logs", callback_data="admin_logs")
-                    ],
-                    [
-                        InlineKeyboardButton("⚙️ Settings", callback_data="admin_settings"),
-                        InlineKeyboardButton("🔄 System", callback_data="admin_system")
-                    ]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                admin_message = f"""🔐 **ADMIN CONTROL PANEL**
-
-Welcome to the comprehensive admin dashboard. All bot features and controls are accessible here.
-
-**Current Status:**
-• Total Users: {len(user_db.data.get('users', {}))}
-• Active Surveillance: ✅ Monitoring all groups
-• SMS Service: {'✅ Configured' if sms_service.is_service_configured() else '❌ Setup required'}
-• Moderation: ✅ Auto-moderation active
-• Rate Limits: ∞ Unlimited for all features
+        return stats_msg, ADMIN_BACK_TO_PANEL_KEYBOARD, ParseMode.HTML
+
+    async def _render_admin_sms(self):
+        """SMS service panel"""
+        if sms_service.is_service_configured():
+            return sms_service.get_sms_statistics(), ADMIN_SMS_KEYBOARD, ParseMode.MARKDOWN
+        return sms_service.get_setup_instructions(), ADMIN_BACK_KEYBOARD, ParseMode.MARKDOWN
+
+    async def _render_admin_surveillance(self):
+        """Surveillance panel"""
+        if group_surveillance:
+            surveillance_summary = group_surveillance.get_group_surveillance_summary()
+        else:
+            surveillance_summary = "🕵️ **Group Surveillance**\n\nSurveillance system ready to monitor groups."
+        return surveillance_summary, ADMIN_SURVEILLANCE_KEYBOARD, ParseMode.MARKDOWN
 
-Click any button below to access admin features:"""
+    async def _render_admin_moderation(self):
+        """Moderation panel"""
+        if admin_controls:
+            mod_stats = admin_controls.get_moderation_stats()
+        else:
+            mod_stats = "🛡️ **Moderation System**\n\nModeration tools ready for group management."
+        return mod_stats, ADMIN_MODERATION_KEYBOARD, ParseMode.MARKDOWN
 
-                await query.edit_message_text(admin_message, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-        
-        except Exception as e:
-            error_msg = f"❌ Error in admin panel: {str(e)}"
-            keyboard = [[InlineKeyboardButton("🔙 Back to Panel", callback_data="admin_main")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            await query.edit_message_text(error_msg, reply_markup=reply_markup)
+    async def _render_admin_settings(self):
+        """System settings panel"""
+        sms_status = '✅ Configured' if sms_service.is_service_configured() else '❌ Setup Required'
+        return ADMIN_SETTINGS_TEMPLATE.format(sms_status=sms_status), ADMIN_BACK_KEYBOARD, ParseMode.HTML
 
     async def grant_access_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /grant_access command (admin only)"""
-        user_id = str(update.effective_user.id)
-        
-        if user_id != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Command not found")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Command not found", parse_mode=None)
             return
         
         if len(context.args) < 2:
@@ -2245,34 +2510,30 @@ Click any button below to access admin features:"""
                 "• `basic` - Chat, Wiki, Translate, Download, Crypto, Accessibility, Voice, Advanced Features\n"
                 "• `premium` - Basic + Free SMS\n"
                 "• `vip` - Premium + Premium Tools\n"
-                "• `admin` - Full access to everything",
-                parse_mode='Markdown'
+                "• `admin` - Full access to everything"
             )
             return
         
         target_user_id = context.args[0]
         access_level = context.args[1].lower()
         
-        if user_access_service.grant_access(target_user_id, access_level, user_id):
+        if user_access_service.grant_access(target_user_id, access_level, str(update.effective_user.id)):
             await update.message.reply_text(
                 f"✅ **Access Granted**\n\n"
                 f"👤 **User:** {target_user_id}\n"
                 f"🔑 **Level:** {access_level.title()}\n"
-                f"📅 **Granted:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-                parse_mode='Markdown'
+                f"📅 **Granted:** {datetime.now().isoformat(sep=' ', timespec='minutes')}"
             )
         else:
             await update.message.reply_text(
                 f"❌ **Invalid access level:** {access_level}\n\n"
-                "Valid levels: basic, premium, vip, admin"
+                "Valid levels: basic, premium, vip, admin", parse_mode=None
             )
     
     async def temp_access_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /temp_access command (admin only)"""
-        user_id = str(update.effective_user.id)
-        
-        if user_id != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Command not found")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Command not found", parse_mode=None)
             return
         
         if len(context.args) < 3:
@@ -2282,8 +2543,7 @@ Click any button below to access admin features:"""
                 "• `free_sms` - Free SMS messaging\n"
                 "• `premium_features` - Premium access\n"
                 "• `advanced_features` - Advanced tools\n\n"
-                "**Example:** `/temp_access 123456789 free_sms 24`",
-                parse_mode='Markdown'
+                "**Example:** `/temp_access 123456789 free_sms 24`"
             )
             return
         
@@ -2292,77 +2552,68 @@ Click any button below to access admin features:"""
         try:
             hours = int(context.args[2])
         except ValueError:
-            await update.message.reply_text("❌ Hours must be a number")
+            await update.message.reply_text("❌ Hours must be a number", parse_mode=None)
             return
         
-        if user_access_service.grant_temporary_access(target_user_id, feature, hours, user_id):
+        if user_access_service.grant_temporary_access(target_user_id, feature, hours, str(update.effective_user.id)):
             expiry_time = datetime.now() + timedelta(hours=hours)
             await update.message.reply_text(
                 f"⏰ **Temporary Access Granted**\n\n"
                 f"👤 **User:** {target_user_id}\n"
                 f"🔧 **Feature:** {feature}\n"
                 f"⏱️ **Duration:** {hours} hours\n"
-                f"📅 **Expires:** {expiry_time.strftime('%Y-%m-%d %H:%M')}",
-                parse_mode='Markdown'
+                f"📅 **Expires:** {expiry_time.isoformat(sep=' ', timespec='minutes')}"
             )
         else:
-            await update.message.reply_text("❌ Failed to grant temporary access")
+            await update.message.reply_text("❌ Failed to grant temporary access", parse_mode=None)
     
     async def revoke_access_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /revoke_access command (admin only)"""
-        user_id = str(update.effective_user.id)
-        
-        if user_id != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Command not found")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Command not found", parse_mode=None)
             return
         
         if len(context.args) < 1:
             await update.message.reply_text(
                 "📝 **Usage:** `/revoke_access <user_id>`\n\n"
-                "This will remove all access permissions for the user.",
-                parse_mode='Markdown'
+                "This will remove all access permissions for the user."
             )
             return
         
         target_user_id = context.args[0]
         
-        if user_access_service.revoke_access(target_user_id, user_id):
+        if user_access_service.revoke_access(target_user_id, str(update.effective_user.id)):
             await update.message.reply_text(
                 f"🚫 **Access Revoked**\n\n"
                 f"👤 **User:** {target_user_id}\n"
-                f"📅 **Revoked:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-                "All permissions have been removed.",
-                parse_mode='Markdown'
+                f"📅 **Revoked:** {datetime.now().isoformat(sep=' ', timespec='minutes')}\n\n"
+                "All permissions have been removed."
             )
         else:
-            await update.message.reply_text("❌ Failed to revoke access")
+            await update.message.reply_text("❌ Failed to revoke access", parse_mode=None)
     
     async def check_access_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /check_access command (admin only)"""
-        user_id = str(update.effective_user.id)
-        
-        if user_id != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Command not found")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Command not found", parse_mode=None)
             return
         
         if len(context.args) < 1:
-            target_user_id = user_id
+            target_user_id = str(update.effective_user.id)
         else:
             target_user_id = context.args[0]
         
         access_info = user_access_service.get_user_access_info(target_user_id)
-        await update.message.reply_text(access_info, parse_mode='Markdown')
+        await update.message.reply_text(access_info)
     
     async def list_access_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /list_access command (admin only)"""
-        user_id = str(update.effective_user.id)
-        
-        if user_id != ADMIN_USER_ID:
-            await update.message.reply_text("❌ Command not found")
+        if not _is_admin(update):
+            await update.message.reply_text("❌ Command not found", parse_mode=None)
             return
         
         access_info = user_access_service.get_all_users_access()
-        await update.message.reply_text(access_info, parse_mode='Markdown')
+        await update.message.reply_text(access_info)
 
     async def settings_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /settings command - Group feature configuration"""
@@ -2372,21 +2623,21 @@ Click any button below to access admin features:"""
         if update.effective_chat.type == 'private':
             await update.message.reply_text(
                 "⚙️ Settings are only available in groups!\n\n"
-                "Add me to a group and use `/settings` there to configure features."
+                "Add me to a group and use /settings there to configure features.", parse_mode=None
             )
             return
         
         # Check if user is admin in the group
         try:
-            chat_member = await context.bot.get_chat_member(chat_id, update.effective_user.id)
-            if chat_member.status not in ['administrator', 'creator']:
+            status = await _get_chat_member_status(context.bot, chat_id, update.effective_user.id)
+            if status not in ('administrator', 'creator'):
                 await update.message.reply_text(
-                    "🔒 Only group administrators can change settings."
+                    "🔒 Only group administrators can change settings.", parse_mode=None
                 )
                 return
         except Exception:
             await update.message.reply_text(
-                "❌ Unable to verify admin status. Please ensure the bot has proper permissions."
+                "❌ Unable to verify admin status. Please ensure the bot has proper permissions.", parse_mode=None
             )
             return
         
@@ -2394,35 +2645,17 @@ Click any button below to access admin features:"""
         if not context.args:
             # Show settings menu
             settings_menu = group_settings_service.get_settings_menu(chat_id)
-            await update.message.reply_text(settings_menu, parse_mode='Markdown')
+            await update.message.reply_text(settings_menu)
             return
         
         if len(context.args) == 1 and context.args[0].lower() == 'list':
             # Show settings menu
             settings_menu = group_settings_service.get_settings_menu(chat_id)
-            await update.message.reply_text(settings_menu, parse_mode='Markdown')
+            await update.message.reply_text(settings_menu)
             return
         
         if len(context.args) < 2:
-            await update.message.reply_text(
-                "📝 **Usage:**\n"
-                "`/settings` - Show current settings\n"
-                "`/settings <feature> on` - Enable feature\n"
-                "`/settings <feature> off` - Disable feature\n\n"
-                "**Available features:**\n"
-                "• auto_responses - AI auto-responses\n"
-                "• media_downloads - Media downloads\n"
-                "• translation - Language translation\n"
-                "• crypto_updates - Crypto price updates\n"
-                "• accessibility_features - Accessibility support\n"
-                "• voice_transcription - Voice transcription\n"
-                "• spam_protection - Spam protection\n"
-                "• word_filtering - Word filtering\n"
-                "• new_member_screening - New member screening\n"
-                "• auto_moderation - Auto moderation\n"
-                "• welcome_messages - Welcome messages",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_SETTINGS_HELP)
             return
         
         feature = context.args[0].lower()
@@ -2431,21 +2664,21 @@ Click any button below to access admin features:"""
         if action not in ['on', 'off']:
             await update.message.reply_text(
                 "❌ Action must be 'on' or 'off'\n"
-                "Example: `/settings auto_responses on`"
+                "Example: /settings auto_responses on", parse_mode=None
             )
             return
         
         # Special handling for certain features
         if feature == 'activity_logging':
             await update.message.reply_text(
-                "🔒 Activity logging is always enabled and cannot be disabled."
+                "🔒 Activity logging is always enabled and cannot be disabled.", parse_mode=None
             )
             return
         
-        if feature not in group_settings_service.get_available_features():
+        if feature not in _AVAILABLE_FEATURES:
             await update.message.reply_text(
                 f"❌ Unknown feature: {feature}\n"
-                "Use `/settings` to see available features."
+                "Use /settings to see available features.", parse_mode=None
             )
             return
         
@@ -2461,12 +2694,11 @@ Click any button below to access admin features:"""
                 f"✅ **Setting Updated**\n\n"
                 f"**Feature:** {feature.replace('_', ' ').title()}\n"
                 f"**Status:** {status}\n"
-                f"**Description:** {feature_description}",
-                parse_mode='Markdown'
+                f"**Description:** {feature_description}"
             )
         else:
             await update.message.reply_text(
-                "❌ Failed to update setting. Please try again."
+                "❌ Failed to update setting. Please try again.", parse_mode=None
             )
     
     async def meme_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -2474,7 +2706,7 @@ Click any button below to access admin features:"""
         user_id = str(update.effective_user.id)
         
         if not user_access_service.check_permission(user_id, "premium"):
-            await update.message.reply_text("🔒 Meme generation requires premium access. Contact admin for upgrade.")
+            await update.message.reply_text("🔒 Meme generation requires premium access. Contact admin for upgrade.", parse_mode=None)
             return
         
         if not context.args:
@@ -2485,44 +2717,49 @@ Click any button below to access admin features:"""
                 "• `/meme programming bugs`\n"
                 "• `/meme monday mornings`\n"
                 "• `/meme online classes`\n\n"
-                "I'll create a funny meme with your topic!",
-                parse_mode='Markdown'
+                "I'll create a funny meme with your topic!"
             )
             return
         
-        user_prompt = ' '.join(context.args)
+        user_prompt = context.args[0] if len(context.args) == 1 else ' '.join(context.args)
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="upload_photo")
         
-        result = content_generation_service.generate_custom_meme(user_prompt)
+        result = await _run_llm(content_generation_service.generate_custom_meme, user_prompt)
         
         if "error" in result:
-            await update.message.reply_text(f"❌ {result['error']}")
+            await update.message.reply_text(f"❌ {result['error']}", parse_mode=None)
         else:
-            response = f"🎭 **Custom Meme Generated!**\n\n"
-            response += f"**Template:** {result['template_used']}\n"
-            response += f"**Your Topic:** {result['user_prompt']}\n\n"
-            response += f"**Meme Content:**\n{result['meme_content'][:500]}..."
+            response = _MEME_TEMPLATE.format_map({
+                'template': result['template_used'],
+                'topic': result['user_prompt'],
+                'content': result['meme_content'][:500]
+            })
             
-            if result.get('image_path') and os.path.exists(result['image_path']):
+            img_path = result.get('image_path')
+            try:
+                photo_file = open(img_path, 'rb') if img_path else None
+            except OSError:
+                photo_file = None
+            
+            if photo_file:
                 try:
-                    with open(result['image_path'], 'rb') as photo:
+                    with photo_file as photo:
                         await context.bot.send_photo(
                             chat_id=update.effective_chat.id,
                             photo=photo,
-                            caption=response,
-                            parse_mode='Markdown'
+                            caption=response
                         )
-                except Exception:
-                    await update.message.reply_text(response, parse_mode='Markdown')
+                except (BadRequest, TimedOut):
+                    await update.message.reply_text(response)
             else:
-                await update.message.reply_text(response, parse_mode='Markdown')
+                await update.message.reply_text(response)
     
     async def story_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /story command - Generate creative stories"""
         user_id = str(update.effective_user.id)
         
         if not user_access_service.check_permission(user_id, "premium"):
-            await update.message.reply_text("🔒 Story generation requires premium access. Contact admin for upgrade.")
+            await update.message.reply_text("🔒 Story generation requires premium access. Contact admin for upgrade.", parse_mode=None)
             return
         
         if not context.args:
@@ -2533,29 +2770,31 @@ Click any button below to access admin features:"""
                 "• `/story a robot who dreams of becoming human`\n"
                 "• `/story mystery in an old bookstore`\n"
                 "• `/story adventure on Mars colony`\n\n"
-                "I'll create an engaging story from your prompt!",
-                parse_mode='Markdown'
+                "I'll create an engaging story from your prompt!"
             )
             return
         
-        user_prompt = ' '.join(context.args)
+        user_prompt = context.args[0] if len(context.args) == 1 else ' '.join(context.args)
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
-        result = content_generation_service.generate_creative_story(user_prompt)
+        result = await _run_llm(content_generation_service.generate_creative_story, user_prompt)
         
         if "error" in result:
-            await update.message.reply_text(f"❌ {result['error']}")
+            await update.message.reply_text(f"❌ {result['error']}", parse_mode=None)
         else:
             # Send story in parts if too long
             story_text = result['story']
             if len(story_text) > 4000:
-                # Split into chunks
-                chunks = [story_text[i:i+4000] for i in range(0, len(story_text), 4000)]
-                await update.message.reply_text(f"📖 **Generated Story ({result['genre']} - {result['word_count']} words)**\n\n{chunks[0]}", parse_mode='Markdown')
-                for chunk in chunks[1:]:
-                    await update.message.reply_text(chunk)
+                # Send the first chunk now and queue the rest
+                chunks = _chunk(story_text)
+                await update.message.reply_text(_STORY_TEMPLATE.format_map({
+                    'genre': result['genre'], 'word_count': result['word_count'], 'story': next(chunks)
+                }))
+                _enqueue_chat_messages(context.bot, update.effective_chat.id, chunks, parse_mode=None)
             else:
-                await update.message.reply_text(f"📖 **Generated Story ({result['genre']} - {result['word_count']} words)**\n\n{story_text}", parse_mode='Markdown')
+                await update.message.reply_text(_STORY_TEMPLATE.format_map({
+                    'genre': result['genre'], 'word_count': result['word_count'], 'story': story_text
+                }))
     
     async def workout_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /workout command - Generate personalized workout plans"""
@@ -2568,12 +2807,11 @@ Click any button below to access admin features:"""
                 "Example:\n"
                 "• `/workout beginner, 25 years old | lose weight and build muscle`\n"
                 "• `/workout intermediate runner | prepare for marathon`\n\n"
-                "I'll create a personalized workout plan for you!",
-                parse_mode='Markdown'
+                "I'll create a personalized workout plan for you!"
             )
             return
         
-        input_text = ' '.join(context.args)
+        input_text = context.args[0] if len(context.args) == 1 else ' '.join(context.args)
         if '|' in input_text:
             profile, goals = input_text.split('|', 1)
             profile = profile.strip()
@@ -2584,26 +2822,27 @@ Click any button below to access admin features:"""
         
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
-        result = content_generation_service.generate_workout_plan(profile, goals)
+        result = await _run_llm(content_generation_service.generate_workout_plan, profile, goals)
         
         if "error" in result:
-            await update.message.reply_text(f"❌ {result['error']}")
+            await update.message.reply_text(f"❌ {result['error']}", parse_mode=None)
         else:
-            response = f"🏋️ **Personalized Workout Plan**\n\n"
-            response += f"**Profile:** {result['user_profile']}\n"
-            response += f"**Goals:** {result['goals']}\n"
-            response += f"**Duration:** {result['duration']}\n\n"
-            
             # Send workout plan
             plan_text = result['workout_plan']
-            if len(plan_text) > 3500:
-                response += plan_text[:3500] + "..."
-                await update.message.reply_text(response, parse_mode='Markdown')
+            too_long = len(plan_text) > 3500
+            response = _WORKOUT_TEMPLATE.format_map({
+                'profile': result['user_profile'],
+                'goals': result['goals'],
+                'duration': result['duration'],
+                'plan': plan_text[:3500] + "..." if too_long else plan_text
+            })
+            await update.message.reply_text(response)
+            if too_long:
                 # Send nutrition advice separately
-                await update.message.reply_text(f"🥗 **Nutrition Advice:**\n\n{result['nutrition_advice'][:4000]}", parse_mode='Markdown')
-            else:
-                response += plan_text
-                await update.message.reply_text(response, parse_mode='Markdown')
+                _enqueue_chat_messages(
+                    context.bot, update.effective_chat.id,
+                    [f"🥗 **Nutrition Advice:**\n\n{result['nutrition_advice'][:4000]}"]
+                )
     
     async def recipe_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /recipe command - Generate custom recipes"""
@@ -2617,8 +2856,7 @@ Click any button below to access admin features:"""
                 "• `/recipe italian vegetarian pasta tomatoes`\n"
                 "• `/recipe asian gluten-free chicken rice`\n"
                 "• `/recipe mexican vegan beans corn`\n\n"
-                "I'll create a delicious recipe for you!",
-                parse_mode='Markdown'
+                "I'll create a delicious recipe for you!"
             )
             return
         
@@ -2629,18 +2867,23 @@ Click any button below to access admin features:"""
         
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
-        result = content_generation_service.generate_recipe(cuisine, dietary, ingredients)
+        result = await _run_llm(content_generation_service.generate_recipe, cuisine, dietary, ingredients)
         
         if "error" in result:
-            await update.message.reply_text(f"❌ {result['error']}")
+            await update.message.reply_text(f"❌ {result['error']}", parse_mode=None)
         else:
             recipe_text = result['recipe']
-            if len(recipe_text) > 4000:
+            too_long = len(recipe_text) > 4000
+            await update.message.reply_text(_RECIPE_TEMPLATE.format_map({
+                'cuisine': result['cuisine_type'].title(),
+                'recipe': recipe_text[:4000] if too_long else recipe_text
+            }))
+            if too_long:
                 # Split recipe into parts
-                await update.message.reply_text(f"🍽️ **Custom {result['cuisine_type'].title()} Recipe**\n\n{recipe_text[:4000]}", parse_mode='Markdown')
-                await update.message.reply_text(f"👨‍🍳 **Cooking Tips:**\n\n{result['cooking_tips'][:4000]}", parse_mode='Markdown')
-            else:
-                await update.message.reply_text(f"🍽️ **Custom {result['cuisine_type'].title()} Recipe**\n\n{recipe_text}", parse_mode='Markdown')
+                _enqueue_chat_messages(
+                    context.bot, update.effective_chat.id,
+                    [f"👨‍🍳 **Cooking Tips:**\n\n{result['cooking_tips'][:4000]}"]
+                )
     
     async def trivia_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /trivia command - Start trivia games"""
@@ -2653,8 +2896,7 @@ Click any button below to access admin features:"""
                 "Categories: science, history, geography, sports, entertainment, technology, literature, art, music, general\n\n"
                 "Difficulty: easy, medium, hard\n\n"
                 "Example: `/trivia science medium`\n\n"
-                "Start your trivia challenge!",
-                parse_mode='Markdown'
+                "Start your trivia challenge!"
             )
             return
         
@@ -2663,30 +2905,24 @@ Click any button below to access admin features:"""
         
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
-        result = games_service.start_trivia_game(user_id, category, difficulty)
+        result = await _run_llm(games_service.start_trivia_game, user_id, category, difficulty)
         
         if "error" in result:
-            await update.message.reply_text(f"❌ {result['error']}")
+            await update.message.reply_text(f"❌ {result['error']}", parse_mode=None)
         else:
             # Store game ID in user context
-            if not hasattr(context, 'user_data'):
-                context.user_data = {}
-            if user_id not in context.user_data:
-                context.user_data[user_id] = {}
-            context.user_data[user_id]['current_game'] = result['game_id']
-            
-            response = f"🎮 **Trivia Game Started!**\n\n"
-            response += f"**Category:** {result['category'].title()}\n"
-            response += f"**Difficulty:** {result['difficulty'].title()}\n"
-            response += f"**Question {result['question_number']}/{result['total_questions']}**\n\n"
-            response += f"**{result['question']}**\n\n"
+            context.user_data['current_game'] = result['game_id']
             
-            for option, text in result['options'].items():
-                response += f"{option}: {text}\n"
+            response = _TRIVIA_TEMPLATE.format_map({
+                'cat': result['category'].title(),
+                'diff': result['difficulty'].title(),
+                'qn': result['question_number'],
+                'qt': result['total_questions'],
+                'question': result['question'],
+                'options_block': "\n".join(f"{option}: {text}" for option, text in result['options'].items())
+            })
             
-            response += f"\nReply with A, B, C, or D to answer!"
-            
-            await update.message.reply_text(response, parse_mode='Markdown')
+            await update.message.reply_text(response)
     
     async def wordgame_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /wordgame command - Start word games"""
@@ -2701,120 +2937,92 @@ Click any button below to access admin features:"""
                 "• `word_scramble` - Unscramble words\n"
                 "• `rhyme_time` - Find rhyming words\n"
                 "• `story_builder` - Build stories together\n\n"
-                "Example: `/wordgame word_association`",
-                parse_mode='Markdown'
+                "Example: `/wordgame word_association`"
             )
             return
         
         game_type = context.args[0]
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
         
-        result = games_service.start_word_game(user_id, game_type)
+        result = await _run_llm(games_service.start_word_game, user_id, game_type)
         
         if "error" in result:
-            await update.message.reply_text(f"❌ {result['error']}")
+            await update.message.reply_text(f"❌ {result['error']}", parse_mode=None)
         else:
             # Store game ID in user context
-            if not hasattr(context, 'user_data'):
-                context.user_data = {}
-            if user_id not in context.user_data:
-                context.user_data[user_id] = {}
-            context.user_data[user_id]['current_game'] = result['game_id']
-            
-            response = f"🎮 **{result['game_type'].replace('_', ' ').title()} Game**\n\n"
-            response += f"**Instructions:** {result['instructions']}\n\n"
-            
-            if 'starting_word' in result:
-                response += f"**Starting Word:** {result['starting_word']}\n\n"
-            elif 'scrambled_word' in result:
-                response += f"**Scrambled Word:** `{result['scrambled_word']}`\n"
-                response += f"**Word Length:** {result['word_length']} letters\n"
-                response += f"**Difficulty:** {result['difficulty']}\n\n"
-            elif 'target_word' in result:
-                response += f"**Find words that rhyme with:** {result['target_word']}\n\n"
-            elif 'story_start' in result:
-                response += f"**Story so far:**\n{result['story_start']}\n\n"
-            
-            response += "Send your response to play!"
-            
-            await update.message.reply_text(response, parse_mode='Markdown')
+            context.user_data['current_game'] = result['game_id']
+            
+            details = next(
+                (template.format_map(result) for key, template in _WORDGAME_DETAILS if key in result), ""
+            )
+            response = _WORDGAME_TEMPLATE.format_map({
+                'title': result['game_type'].replace('_', ' ').title(),
+                'instructions': result['instructions'],
+                'details': details
+            })
+            
+            await update.message.reply_text(response)
     
     async def riddle_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /riddle command - Get random riddles"""
-        user_id = str(update.effective_user.id)
-        
-        result = games_service.get_random_riddle()
+        result = await _run_llm(games_service.get_random_riddle)
         
         # Store riddle ID in user context
-        if not hasattr(context, 'user_data'):
-            context.user_data = {}
-        if user_id not in context.user_data:
-            context.user_data[user_id] = {}
-        context.user_data[user_id]['current_riddle'] = result['riddle_id']
+        context.user_data['current_riddle'] = result['riddle_id']
         
         response = f"🧩 **Riddle Challenge**\n\n"
         response += f"**{result['riddle']}**\n\n"
         response += f"{result['instructions']}"
         
-        await update.message.reply_text(response, parse_mode='Markdown')
+        await update.message.reply_text(response)
     
     async def ocr_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /ocr command - Extract text from images"""
         user_id = str(update.effective_user.id)
         
         if not user_access_service.check_permission(user_id, "premium"):
-            await update.message.reply_text("🔒 OCR text extraction requires premium access. Contact admin for upgrade.")
+            await update.message.reply_text("🔒 OCR text extraction requires premium access. Contact admin for upgrade.", parse_mode=None)
             return
         
         # Check if user recently sent an image
-        if not hasattr(context, 'user_data') or user_id not in context.user_data:
+        recent_photos = context.user_data.get('recent_photos')
+        if not recent_photos:
             await update.message.reply_text(
                 "📸 **OCR Text Extraction**\n\n"
                 "Please send an image first, then use `/ocr` to extract text from it.\n\n"
-                "I can read text in multiple languages and provide detailed analysis!",
-                parse_mode='Markdown'
+                "I can read text in multiple languages and provide detailed analysis!"
             )
             return
         
-        recent_media = context.user_data[user_id].get('recent_media', [])
-        recent_images = [media for media in recent_media if media.get('type') == 'photo']
+        image_path = recent_photos[-1].get('file_path')
         
-        if not recent_images:
-            await update.message.reply_text("No recent images found. Please send an image first, then use /ocr.")
+        if not image_path:
+            await update.message.reply_text("❌ Image file not found for OCR analysis.", parse_mode=None)
             return
         
-        latest_image = recent_images[-1]
-        image_path = latest_image.get('file_path')
-        
-        if not image_path or not os.path.exists(image_path):
-            await update.message.reply_text("❌ Image file not found for OCR analysis.")
-            return
-        
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        
         # Use enhanced vision service for OCR
-        try:
-            from enhanced_vision_service import enhanced_vision_service
-            result = enhanced_vision_service.extract_text_from_image(image_path)
-        except ImportError:
-            await update.message.reply_text("❌ OCR service not available. Please ensure all dependencies are installed.")
+        vision = _vision()
+        if vision is None:
+            await update.message.reply_text("❌ OCR service not available. Please ensure all dependencies are installed.", parse_mode=None)
             return
+        async with _typing(context.bot, update.effective_chat.id):
+            result = await asyncio.to_thread(vision.extract_text_from_image, image_path)
         
         if "error" in result:
-            await update.message.reply_text(f"❌ OCR failed: {result['error']}")
+            await update.message.reply_text(f"❌ OCR failed: {result['error']}", parse_mode=None)
         else:
-            response = f"🔍 **OCR Text Extraction Results**\n\n"
-            
             if result['text']:
-                response += f"**Extracted Text:**\n```\n{result['text'][:2000]}\n```\n\n"
-                response += f"**Word Count:** {result['word_count']}\n"
-                response += f"**Confidence:** {result['confidence']:.1f}%\n"
-                response += f"**Languages Detected:** {', '.join(result['languages_detected'])}\n"
-                response += f"**Text Regions:** {result['text_regions']}"
+                response = _OCR_TEMPLATE.format_map({
+                    'text': result['text'][:2000],
+                    'word_count': result['word_count'],
+                    'confidence': result['confidence'],
+                    'languages': ', '.join(result['languages_detected']),
+                    'text_regions': result['text_regions']
+                })
             else:
-                response += "No text detected in the image. The image might not contain readable text or the text might be too blurry."
+                response = _OCR_NO_TEXT
             
-            await update.message.reply_text(response, parse_mode='Markdown')
+            await update.message.reply_text(response)
 
 # Create global instance
 bot_handlers = BotHandlers()
@@ -3,28 +3,58 @@ import logging
 import asyncio
 import time
 import signal
-import sys
 from datetime import datetime
 from telegram.error import Conflict, TimedOut, NetworkError
 from telegram.ext import Application
+from character_customization_service import get_character_service
+from contextual_help_service import contextual_help_service
+from config import DROP_PENDING_UPDATES
 
 logger = logging.getLogger(__name__)
 
+# Next get_updates offset, persisted so a restart resumes after the last fetched update
+OFFSET_FILE = "offset.txt"
+OFFSET_SAVE_EVERY = 50
+
 class BotManager:
     """Manages bot instance lifecycle and ensures 24/7 uptime"""
     
+    _ALLOWED_UPDATES = ("message", "callback_query")
+    # Seconds to back off after the Nth consecutive polling error (network / other)
+    _NET_BACKOFF = (0, 2, 4, 6, 8, 10)
+    _GEN_BACKOFF = (0, 1, 2, 3, 4, 5)
+    
     def __init__(self, application: Application):
         self.application = application
         self.running = False
         self.restart_count = 0
         self.max_restarts = 10
         self.last_restart = None
+        self.update_offset = self._load_offset()
+        # Seconds to wait between get_updates calls; 0 relies on the long-poll timeout alone
+        self.polling_interval = 0
+        
+        # Updates are processed by one worker per chat: ordered within a chat, concurrent across chats
+        self.chat_idle_timeout = 60
+        # Seconds _cleanup waits for queued updates to finish before cancelling their workers
+        self.chat_drain_timeout = 10
+        self._chat_queues = {}
+        self._chat_workers = {}
+        # Caps how many chats have an update in process_update at the same time
+        self._update_semaphore = asyncio.Semaphore(16)
+        
+        # Set by SIGINT/SIGTERM; the task running start_with_recovery is cancelled to stop it
+        self._shutting_down = False
+        self._main_task = None
+        # Batched writers for character preferences and help history, held until shutdown
+        self._flush_tasks = []
         
     async def ensure_single_instance(self):
         """Ensure only one bot instance is running"""
         try:
-            # Clear any existing webhooks that might conflict
-            await self.application.bot.delete_webhook(drop_pending_updates=True)
+            # Clear any existing webhooks that might conflict; with DROP_PENDING_UPDATES off,
+            # updates queued while the bot was down are kept and polled from the persisted offset
+            await self.application.bot.delete_webhook(drop_pending_updates=DROP_PENDING_UPDATES)
             logger.info("Cleared any existing webhooks")
             
             # Wait a moment to let any other instances shut down
@@ -37,6 +67,24 @@ class BotManager:
     
     async def start_with_recovery(self):
         """Start bot with automatic recovery on failures"""
+        self._main_task = asyncio.current_task()
+        self._flush_tasks = [
+            asyncio.create_task(get_character_service().run_flusher()),
+            asyncio.create_task(contextual_help_service.run_flusher())
+        ]
+        try:
+            await self._run_with_recovery()
+        except asyncio.CancelledError:
+            if not self._shutting_down:
+                raise
+            get_character_service().flush()
+            contextual_help_service.flush()
+            logger.info("Bot stopped by signal")
+        finally:
+            for task in self._flush_tasks:
+                task.cancel()
+    
+    async def _run_with_recovery(self):
         while self.restart_count < self.max_restarts:
             try:
                 logger.info(f"Starting bot (attempt {self.restart_count + 1}/{self.max_restarts})")
@@ -78,32 +126,34 @@ class BotManager:
     
     async def _poll_with_recovery(self):
         """Poll for updates with automatic recovery"""
-        update_id = None
         consecutive_errors = 0
+        unsaved = 0
         max_consecutive_errors = 5
         
         while self.running and consecutive_errors < max_consecutive_errors:
             try:
                 # Get updates with proper timeout handling
                 updates = await self.application.bot.get_updates(
-                    offset=update_id,
+                    offset=self.update_offset,
                     timeout=30,
-                    allowed_updates=['message', 'callback_query']
+                    allowed_updates=self._ALLOWED_UPDATES
                 )
                 
                 # Reset error counter on successful request
                 consecutive_errors = 0
                 
-                # Process updates
+                # Hand updates to their chat's worker
                 for update in updates:
-                    update_id = update.update_id + 1
-                    try:
-                        await self.application.process_update(update)
-                    except Exception as e:
-                        logger.error(f"Error processing update {update.update_id}: {e}")
+                    self.update_offset = update.update_id + 1
+                    self._dispatch_update(update)
+                
+                unsaved += len(updates)
+                if unsaved >= OFFSET_SAVE_EVERY:
+                    self._save_offset()
+                    unsaved = 0
                 
-                # Small delay to prevent overwhelming the API
-                await asyncio.sleep(0.1)
+                if self.polling_interval:
+                    await asyncio.sleep(self.polling_interval)
                 
             except Conflict:
                 logger.error("Polling conflict - another instance detected")
@@ -112,16 +162,82 @@ class BotManager:
             except (TimedOut, NetworkError) as e:
                 consecutive_errors += 1
                 logger.warning(f"Network issue during polling (error {consecutive_errors}/{max_consecutive_errors}): {e}")
-                await asyncio.sleep(min(consecutive_errors * 2, 10))  # Exponential backoff
+                await asyncio.sleep(self._NET_BACKOFF[min(consecutive_errors, 5)])
                 
             except Exception as e:
                 consecutive_errors += 1
                 logger.error(f"Polling error (error {consecutive_errors}/{max_consecutive_errors}): {e}")
-                await asyncio.sleep(min(consecutive_errors, 5))
+                await asyncio.sleep(self._GEN_BACKOFF[min(consecutive_errors, 5)])
         
         if consecutive_errors >= max_consecutive_errors:
             raise Exception("Too many consecutive polling errors")
     
+    def _load_offset(self):
+        """Read the persisted update offset, if any"""
+        try:
+            with open(OFFSET_FILE) as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+    
+    def _save_offset(self):
+        """Persist the current update offset"""
+        if self.update_offset is None:
+            return
+        try:
+            with open(OFFSET_FILE, 'w') as f:
+                f.write(str(self.update_offset))
+        except OSError as e:
+            logger.error(f"Error saving update offset: {e}")
+    
+    def _dispatch_update(self, update):
+        """Queue an update for its chat, starting the chat's worker if idle"""
+        chat_id = update.effective_chat.id if update.effective_chat else None
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+            self._chat_workers[chat_id] = asyncio.create_task(self._chat_worker(chat_id, queue))
+        queue.put_nowait(update)
+    
+    async def _chat_worker(self, chat_id, queue):
+        """Process one chat's updates in order, exiting after chat_idle_timeout seconds without any"""
+        try:
+            while True:
+                try:
+                    update = await asyncio.wait_for(queue.get(), self.chat_idle_timeout)
+                except asyncio.TimeoutError:
+                    if queue.empty():
+                        return
+                    continue
+                try:
+                    async with self._update_semaphore:
+                        await self.application.process_update(update)
+                except Exception as e:
+                    logger.error(f"Error processing update {update.update_id}: {e}")
+                finally:
+                    queue.task_done()
+        finally:
+            if self._chat_queues.get(chat_id) is queue:
+                del self._chat_queues[chat_id]
+                del self._chat_workers[chat_id]
+    
+    async def _drain_chat_queues(self):
+        """Let chat workers finish the updates already fetched; cancel those still busy after chat_drain_timeout.
+        
+        Fetched updates are already confirmed to Telegram, so whatever a cancelled worker had not handled is lost.
+        """
+        joins = {chat_id: asyncio.ensure_future(queue.join()) for chat_id, queue in self._chat_queues.items()}
+        if not joins:
+            return
+        _, not_done = await asyncio.wait(joins.values(), timeout=self.chat_drain_timeout)
+        for chat_id, join in joins.items():
+            if join in not_done:
+                join.cancel()
+                worker = self._chat_workers.get(chat_id)
+                if worker:
+                    logger.warning(f"Chat {chat_id} did not finish its queued updates in time; cancelling and dropping them")
+                    worker.cancel()
+    
     async def _handle_restart(self, conflict=False, network_issue=False):
         """Handle bot restart with appropriate delays"""
         self.last_restart = datetime.now()
@@ -142,6 +258,16 @@ class BotManager:
     async def _cleanup(self):
         """Clean up bot resources"""
         self.running = False
+        await self._drain_chat_queues()
+        self._save_offset()
+        try:
+            get_character_service().flush()
+        except Exception as e:
+            logger.error(f"Error flushing character preferences: {e}")
+        try:
+            contextual_help_service.flush()
+        except Exception as e:
+            logger.error(f"Error flushing help history: {e}")
         try:
             if self.application.running:
                 await self.application.stop()
@@ -151,11 +277,14 @@ class BotManager:
             logger.error(f"Error during cleanup: {e}")
     
     def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, shutting down gracefully...")
-            self.running = False
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
\ No newline at end of file
+        """Setup signal handlers for graceful shutdown (must be called from the running loop)"""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._graceful_shutdown, signum)
+    
+    def _graceful_shutdown(self, signum):
+        """Stop polling; start_with_recovery's finally block then runs _cleanup on the loop"""
+        logger.info(f"Received signal {signum}, shutting down gracefully...")
+        self._shutting_down = True
+        if self._main_task and not self._main_task.done():
+            self._main_task.cancel()
\ No newline at end of file
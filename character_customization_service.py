@@ -1,8 +1,21 @@
 import json
 import os
+import sys
 import random
+import functools
+from collections import deque
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from utils import run_dirty_flusher
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Number of random indices drawn at once per expression/phrase pool
+CHOICE_BLOCK = 1024
 
 class CharacterCustomizationService:
     """
@@ -12,7 +25,9 @@ class CharacterCustomizationService:
     
     def __init__(self):
         self.user_characters_file = "user_characters.json"
+        self._dirty = False  # unsaved changes waiting for run_flusher/flush
         self.user_characters = self.load_user_characters()
+        self._user_info_cache: Dict[str, Dict[str, Any]] = {}  # user_id -> get_user_character_info result
         
         # Predefined character personalities with emoji expressions
         self.character_templates = {
@@ -146,21 +161,63 @@ class CharacterCustomizationService:
             "error_context": {"patience": 1.5, "humor": 1.2, "supportiveness": 1.4},
             "success_context": {"celebration": 1.5, "energy": 1.3, "positivity": 1.4}
         }
+        
+        # Immutable (character_type, kind) -> choices lookups, so picks never touch the templates
+        self._expr_index = {
+            (char_type, expr_type): tuple(map(sys.intern, emojis))
+            for char_type, template in self.character_templates.items()
+            for expr_type, emojis in template["expressions"].items()
+        }
+        self._phrase_index = {
+            (char_type, phrase_type): tuple(map(sys.intern, phrases))
+            for char_type, template in self.character_templates.items()
+            for phrase_type, phrases in template["phrases"].items()
+        }
+        
+        # Private RNG with pre-drawn index blocks per lookup key, refilled CHOICE_BLOCK at a time
+        self._rng = random.Random()
+        self._choice_cache: Dict[tuple, deque] = {}
     
     def load_user_characters(self) -> Dict[str, Any]:
         """Load user character preferences"""
-        if os.path.exists(self.user_characters_file):
-            try:
-                with open(self.user_characters_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        try:
+            with open(self.user_characters_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except Exception:
+            return {}
+    
+    def _serialize_user_characters(self) -> bytes:
+        """Serialize user character preferences to UTF-8 JSON"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.user_characters, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.user_characters, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _write_user_characters(self, data: bytes):
+        """Write serialized preferences atomically, via a temp file"""
+        tmp_file = self.user_characters_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, self.user_characters_file)
     
     def save_user_characters(self):
-        """Save user character preferences"""
-        with open(self.user_characters_file, 'w', encoding='utf-8') as f:
-            json.dump(self.user_characters, f, indent=2, ensure_ascii=False)
+        """Save user character preferences immediately"""
+        self._dirty = False
+        self._write_user_characters(self._serialize_user_characters())
+    
+    def _mark_dirty(self):
+        """Schedule the preferences for the next background flush"""
+        self._dirty = True
+    
+    def flush(self):
+        """Save pending changes, if any (called on shutdown)"""
+        if self._dirty:
+            self.save_user_characters()
+    
+    async def run_flusher(self, interval: float = 5.0):
+        """Write pending changes every interval seconds"""
+        await run_dirty_flusher(self, self._serialize_user_characters, self._write_user_characters,
+                                interval, "character preferences")
     
     def get_user_character(self, user_id: str) -> Dict[str, Any]:
         """Get user's current character settings"""
@@ -174,7 +231,7 @@ class CharacterCustomizationService:
                 "created_at": datetime.now().isoformat(),
                 "last_updated": datetime.now().isoformat()
             }
-            self.save_user_characters()
+            self._mark_dirty()
         
         return self.user_characters[user_id]
     
@@ -189,7 +246,8 @@ class CharacterCustomizationService:
         user_char["character_type"] = character_type
         user_char["last_updated"] = datetime.now().isoformat()
         
-        self.save_user_characters()
+        self._user_info_cache.pop(user_id, None)
+        self._mark_dirty()
         
         template = self.character_templates[character_type]
         return {
@@ -213,7 +271,8 @@ class CharacterCustomizationService:
         if new_emoji not in user_char["custom_expressions"][expression_type]:
             user_char["custom_expressions"][expression_type].append(new_emoji)
             user_char["last_updated"] = datetime.now().isoformat()
-            self.save_user_characters()
+            self._user_info_cache.pop(user_id, None)
+            self._mark_dirty()
             
             return {
                 "success": True,
@@ -225,41 +284,48 @@ class CharacterCustomizationService:
                 "message": f"{new_emoji} is already in your {expression_type} expressions"
             }
     
-    def get_expression(self, user_id: str, expression_type: str, context: str = None) -> str:
-        """Get appropriate emoji expression for user and context"""
-        user_char = self.get_user_character(user_id)
-        character_type = user_char.get("character_type", "cheerful")
-        template = self.character_templates[character_type]
-        
+    def _draw(self, key: tuple, pool: tuple) -> str:
+        """Pick from a fixed pool using the pre-drawn indices for key"""
+        indices = self._choice_cache.get(key)
+        if not indices:
+            indices = self._choice_cache[key] = deque(self._rng.choices(range(len(pool)), k=CHOICE_BLOCK))
+        return pool[indices.popleft()]
+    
+    def _pick_expression(self, user_char: Dict[str, Any], expression_type: str) -> str:
         # Start with template expressions
-        expressions = template["expressions"].get(expression_type, ["😊"])
+        key = ("expr", user_char.get("character_type", "cheerful"), expression_type)
+        expressions = self._expr_index.get(key[1:], ("😊",))
         
-        # Add custom expressions if any
-        custom_expressions = user_char.get("custom_expressions", {}).get(expression_type, [])
+        # Custom expressions share the draw without building a combined sequence
+        custom_expressions = user_char.get("custom_expressions", {}).get(expression_type)
         if custom_expressions:
-            expressions.extend(custom_expressions)
-        
-        # Apply context-based mood adjustments
-        if context and context in self.mood_contexts:
-            # For now, just return random from available expressions
-            # Future: implement mood multiplier logic
-            pass
-        
-        return random.choice(expressions)
+            i = self._rng.randrange(len(expressions) + len(custom_expressions))
+            return expressions[i] if i < len(expressions) else custom_expressions[i - len(expressions)]
+        if len(expressions) == 1:
+            return expressions[0]
+        return self._draw(key, expressions)
+    
+    def _pick_phrase(self, user_char: Dict[str, Any], phrase_type: str) -> str:
+        key = ("phrase", user_char.get("character_type", "cheerful"), phrase_type)
+        phrases = self._phrase_index.get(key[1:])
+        if phrases is None:
+            return "Hello there!"
+        return self._draw(key, phrases)
+    
+    def get_expression(self, user_id: str, expression_type: str, context: str = None) -> str:
+        """Get appropriate emoji expression for user and context"""
+        # Context-based mood adjustments (self.mood_contexts) are not applied yet
+        return self._pick_expression(self.get_user_character(user_id), expression_type)
     
     def get_phrase(self, user_id: str, phrase_type: str, context: str = None) -> str:
         """Get appropriate phrase for user and context"""
-        user_char = self.get_user_character(user_id)
-        character_type = user_char.get("character_type", "cheerful")
-        template = self.character_templates[character_type]
-        
-        phrases = template["phrases"].get(phrase_type, ["Hello there!"])
-        return random.choice(phrases)
+        return self._pick_phrase(self.get_user_character(user_id), phrase_type)
     
     def get_character_message(self, user_id: str, message_type: str, context: str = None) -> str:
         """Get complete character message with emoji and phrase"""
-        emoji = self.get_expression(user_id, message_type, context)
-        phrase = self.get_phrase(user_id, message_type, context)
+        user_char = self.get_user_character(user_id)
+        emoji = self._pick_expression(user_char, message_type)
+        phrase = self._pick_phrase(user_char, message_type)
         
         return f"{emoji} **BotBuddy:** '{phrase}'"
     
@@ -270,28 +336,36 @@ class CharacterCustomizationService:
     
     def get_user_character_info(self, user_id: str) -> Dict[str, Any]:
         """Get detailed info about user's current character"""
+        user_id = str(user_id)
+        cached = self._user_info_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
         user_char = self.get_user_character(user_id)
         character_type = user_char.get("character_type", "cheerful")
         template = self.character_templates[character_type]
         
-        return {
+        info = self._user_info_cache[user_id] = {
             "current_character": template,
             "custom_expressions": user_char.get("custom_expressions", {}),
             "expressions_count": sum(len(exprs) for exprs in user_char.get("custom_expressions", {}).values()),
             "character_type": character_type,
             "last_updated": user_char.get("last_updated", "Never")
         }
+        return info
     
     def reset_character(self, user_id: str) -> Dict[str, Any]:
         """Reset user's character to default"""
         user_id = str(user_id)
+        self._user_info_cache.pop(user_id, None)
         if user_id in self.user_characters:
             del self.user_characters[user_id]
-            self.save_user_characters()
+            self._mark_dirty()
         
         return {
             "success": True,
-            "message": "Character reset to default (Cheerful Buddy)!"
+            "message": "Character reset to default (Cheerful Buddy)!",
+            "greeting": self.get_character_message(user_id, 'greeting')
         }
     
     def get_character_response(self, user_id: str, message_type: str, context: str = None) -> str:
@@ -311,5 +385,13 @@ class CharacterCustomizationService:
         
         return preview
 
-# Initialize global service
-character_service = CharacterCustomizationService()
\ No newline at end of file
+@functools.cache
+def get_character_service() -> CharacterCustomizationService:
+    """Shared service instance, created (and the preferences file loaded) on first use"""
+    return CharacterCustomizationService()
+
+def __getattr__(name):
+    # Keeps `from character_customization_service import character_service` working
+    if name == "character_service":
+        return get_character_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -14,6 +14,9 @@ RATE_LIMIT_MESSAGES = 999999  # unlimited messages
 RATE_LIMIT_MEDIA_DOWNLOADS = 999999  # unlimited downloads
 RATE_LIMIT_BROADCASTS = 999999  # unlimited broadcasts
 
+# Discard updates queued while the bot was offline instead of replaying them on startup
+DROP_PENDING_UPDATES = os.getenv("DROP_PENDING_UPDATES", "true").lower() == "true"
+
 # File paths
 USER_DATABASE_FILE = "user_database.json"
 ADMIN_MESSAGES_FILE = "admin_messages.json"
@@ -1,21 +1,284 @@
 import json
 import os
+import re
+import time
 import random
+import hashlib
+import threading
+import functools
+import itertools
+from types import MappingProxyType
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from ai_services import ai_services
 import requests
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+# Runs AI calls that do not depend on the main generated content alongside it
+_AI_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="content-ai")
+
+DEJAVU_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+DEJAVU_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+@functools.lru_cache(maxsize=8)
+def _get_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to PIL's default font"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+# Pre-warm the fonts used by memes and stickers
+for _font_path, _font_size in ((DEJAVU_BOLD, 36), (DEJAVU_REGULAR, 24), (DEJAVU_BOLD, 20)):
+    _get_font(_font_path, _font_size)
+
+# Lines of the AI meme reply that carry the top / bottom caption
+_TOP_TEXT_RE = re.compile(r'top text|first panel', re.IGNORECASE)
+_BOTTOM_TEXT_RE = re.compile(r'bottom text|second panel', re.IGNORECASE)
+
+def _head(text: str, chars: int) -> str:
+    """First `chars` characters of text, cut back to a word boundary when truncated"""
+    head = text[:chars]
+    return head.rsplit(' ', 1)[0] if len(head) == chars else head
+
+# Lines of the AI sticker reply that describe a sticker
+_STICKER_RE = re.compile(r'sticker|design', re.IGNORECASE)
+
+def _caption(line: str) -> str:
+    """Caption text after the label of a top/bottom text line"""
+    return line.split(':', 1)[-1].strip().strip('"')
+
+# Caption wrappers for memes (40 columns) and sticker previews (15 columns)
+_WRAP40 = textwrap.TextWrapper(width=40)
+_WRAP15 = textwrap.TextWrapper(width=15)
+
+@functools.lru_cache(maxsize=1024)
+def _wrap40(text: str) -> str:
+    return _WRAP40.fill(text)
+
+@functools.lru_cache(maxsize=1024)
+def _wrap15(text: str) -> str:
+    return _WRAP15.fill(text)
+
+# Prompt templates for the generators; filled with str.format per request
+_MEME_PROMPT = """Create a funny meme using the "{name}" template format ({format}).
+            
+User's topic/prompt: {user_prompt}
+
+Based on the template style "{style}", generate appropriate text for this meme. 
+Make it humorous, relatable, and fitting for the template format.
+
+Provide:
+1. Top text (if applicable)
+2. Bottom text (if applicable) 
+3. Alternative text options
+4. Explanation of why this works for the template
+
+Keep it appropriate and funny."""
+
+_STORY_PROMPT = """Write a creative {genre} story based on this prompt: {prompt}
+
+Requirements:
+- Length: {length_spec}
+- Genre: {genre}
+- Include engaging characters, dialogue, and vivid descriptions
+- Create a compelling plot with conflict and resolution
+- Use creative and immersive writing style
+- Make it entertaining and original
+
+Write a complete story that captivates the reader."""
+
+_WORKOUT_PROMPT = """Create a comprehensive {duration} workout plan for this person:
+
+User Profile: {user_profile}
+Goals: {goals}
+
+Include:
+1. Weekly schedule with specific days and exercises
+2. Progressive difficulty over the time period
+3. Warm-up and cool-down routines
+4. Exercise descriptions and proper form tips
+5. Nutrition guidelines to support the goals
+6. Recovery and rest day recommendations
+7. Progress tracking suggestions
+8. Equipment needed (or bodyweight alternatives)
+
+Make it practical, safe, and achievable for the user's profile."""
+
+_RECIPE_PROMPT = """Create a delicious {cuisine_type} recipe with these specifications:
+
+Dietary restrictions: {dietary_restrictions}
+Available ingredients: {ingredients}
+
+Provide:
+1. Recipe name and brief description
+2. Complete ingredients list with measurements
+3. Step-by-step cooking instructions
+4. Prep time and cooking time
+5. Serving size
+6. Difficulty level
+7. Nutritional highlights
+8. Chef's tips for best results
+9. Possible variations or substitutions
+10. Wine or beverage pairing suggestions
+
+Make it detailed enough for a home cook to follow successfully."""
+
+_STORY_LENGTHS = MappingProxyType({
+    "short": "200-400 words, quick narrative",
+    "medium": "600-1000 words, developed plot with characters",
+    "long": "1200-2000 words, detailed story with multiple scenes"
+})
+
+_POETRY_STYLES = MappingProxyType({
+    "free verse": "no strict rhyme scheme, natural rhythm",
+    "sonnet": "14 lines with traditional rhyme scheme",
+    "haiku": "3 lines, 5-7-5 syllable pattern",
+    "limerick": "5 lines, AABBA rhyme scheme, humorous",
+    "ballad": "narrative poem with ABAB rhyme scheme",
+    "acrostic": "first letters spell out the topic word"
+})
+
+_POEM_PROMPT = """Write a beautiful {style} poem about: {topic}
+
+Style requirements: {style_description}
+Mood: {mood}
+
+Create a poem that:
+- Captures the essence and emotion of the topic
+- Uses vivid imagery and metaphors
+- Follows the {style} format correctly
+- Conveys the {mood} mood throughout
+- Is memorable and impactful
+
+Write with artistic flair and emotional depth."""
+
+_STICKER_PROMPT = """Design a custom sticker pack with the theme: {theme}
+
+Create {count} unique sticker concepts that:
+1. Are expressive and convey different emotions/reactions
+2. Work well in chat conversations
+3. Are visually appealing and memorable
+4. Fit the theme cohesively
+5. Include variety (happy, sad, excited, confused, etc.)
+
+For each sticker, provide:
+- Description of the visual design
+- Emotion/message it conveys
+- Suggested use cases in conversations
+- Color scheme and style notes
+
+Make them creative and fun for messaging apps."""
+
+# Reference (non-creative) AI content reused for an identical prompt: entry count and lifetime in seconds
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 3600
+
+_DOWNLOADS_READY = False
+
+def _ensure_downloads():
+    """Create the downloads directory once per process"""
+    global _DOWNLOADS_READY
+    if not _DOWNLOADS_READY:
+        os.makedirs("downloads", exist_ok=True)
+        _DOWNLOADS_READY = True
 
 class ContentGenerationService:
     """Advanced AI content generation for memes, stories, plans, and creative content"""
     
+    story_genres = ("fantasy", "sci-fi", "mystery", "romance", "adventure", "horror", "comedy")
+    workout_types = ("strength", "cardio", "flexibility", "hiit", "yoga", "bodyweight")
+    cuisine_types = ("italian", "asian", "mediterranean", "mexican", "indian", "american")
+    
     def __init__(self):
         self.meme_templates = self.load_meme_templates()
-        self.story_genres = ["fantasy", "sci-fi", "mystery", "romance", "adventure", "horror", "comedy"]
-        self.workout_types = ["strength", "cardio", "flexibility", "hiit", "yoga", "bodyweight"]
-        self.cuisine_types = ["italian", "asian", "mediterranean", "mexican", "indian", "american"]
+        self._template_by_name = {t["name"].lower(): t for t in self.meme_templates}
+        
+        # Pre-filled canvases; each meme/sticker starts from a copy
+        self._meme_blank = Image.new('RGB', (800, 600), color='white')
+        self._sticker_blank = Image.new('RGB', (200, 200), color='lightblue')
+        # Template name -> meme canvas with its label already drawn
+        self._meme_bases: Dict[str, Image.Image] = {}
+        
+        # sha256(tag, prompt) -> (stored_at, reply), LRU-evicted
+        self._response_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
+        # Suffix that keeps filenames unique within the same second
+        self._seq = itertools.count()
+        
+        _ensure_downloads()
+    
+    def _cached_reply(self, prompt: str, tag: str) -> Optional[str]:
+        """Unexpired cached reply for (tag, prompt), if any"""
+        key = hashlib.sha256(f"{tag}\0{prompt}".encode('utf-8')).digest()
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry and time.monotonic() - entry[0] < RESPONSE_CACHE_TTL:
+                self._response_cache.move_to_end(key)
+                return entry[1]
+        return None
+    
+    def _store_reply(self, prompt: str, tag: str, reply: str):
+        key = hashlib.sha256(f"{tag}\0{prompt}".encode('utf-8')).digest()
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic(), reply)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    def _culinary_info(self, cuisine_type: str) -> List[str]:
+        """Cooking tips and ingredient notes for a cuisine; reference content, so cached (failures are not)"""
+        prompts = [
+            f"Provide advanced cooking techniques and professional tips for mastering this type of {cuisine_type} cuisine.",
+            f"Explain the key ingredients in {cuisine_type} cooking, their origins, nutritional benefits, and how to select the best quality."
+        ]
+        cached = [self._cached_reply(prompt, "culinary_info") for prompt in prompts]
+        if None not in cached:
+            return cached
+        
+        replies = ai_services.chat_with_ai_batch(prompts, "culinary_info")
+        for prompt, reply in zip(prompts, replies):
+            if not (reply.startswith("❌") or reply == "I'm having trouble processing your request right now."):
+                self._store_reply(prompt, "culinary_info", reply)
+        return replies
+    
+    def _stream_meme(self, prompt: str, template_info: Dict, stamp: str) -> tuple:
+        """Generate meme text and image, starting to render once both captions have streamed in"""
+        lines = []
+        top_text = bottom_text = ""
+        render = None
+        try:
+            for line in ai_services.stream_chat(prompt, "meme_generation"):
+                lines.append(line)
+                if render:
+                    continue
+                if not top_text and _TOP_TEXT_RE.search(line):
+                    top_text = _caption(line)
+                elif not bottom_text and _BOTTOM_TEXT_RE.search(line):
+                    bottom_text = _caption(line)
+                if top_text and bottom_text:
+                    render = _AI_POOL.submit(self._render_meme, top_text, bottom_text, template_info, stamp)
+        except (requests.RequestException, ValueError):
+            # Streaming unavailable or cut off: fall back to a single blocking call, and
+            # re-render from its reply rather than from the abandoned stream's captions
+            if render and not render.cancel():
+                stale_path = render.result()
+                if stale_path and os.path.exists(stale_path):
+                    os.remove(stale_path)
+            render = None
+            content = ai_services.chat_with_ai(prompt, "meme_generation")
+        else:
+            content = '\n'.join(lines)
+            if not content.strip():
+                content = ai_services.chat_with_ai(prompt, "meme_generation")
+        
+        if render is None:
+            return content, self._create_text_meme(content, template_info, stamp)
+        return content, render.result()
     
     def load_meme_templates(self) -> List[Dict[str, Any]]:
         """Load meme templates and formats"""
@@ -37,30 +300,14 @@ class ContentGenerationService:
                 template = random.choice(self.meme_templates)["name"]
             
             # Find template details
-            template_info = next((t for t in self.meme_templates if t["name"].lower() == template.lower()), None)
-            if not template_info:
-                template_info = random.choice(self.meme_templates)
+            template_info = self._template_by_name.get(template.lower()) or random.choice(self.meme_templates)
             
             # Generate meme text using AI
-            meme_prompt = f"""Create a funny meme using the "{template_info['name']}" template format ({template_info['format']}).
-            
-User's topic/prompt: {user_prompt}
-
-Based on the template style "{template_info['style']}", generate appropriate text for this meme. 
-Make it humorous, relatable, and fitting for the template format.
-
-Provide:
-1. Top text (if applicable)
-2. Bottom text (if applicable) 
-3. Alternative text options
-4. Explanation of why this works for the template
-
-Keep it appropriate and funny."""
+            meme_prompt = _MEME_PROMPT.format(name=template_info['name'], format=template_info['format'], style=template_info['style'], user_prompt=user_prompt)
             
-            meme_content = ai_services.chat_with_ai(meme_prompt, "meme_generation")
-            
-            # Create simple text-based meme image
-            meme_image_path = self._create_text_meme(meme_content, template_info)
+            # Generate the text and render the meme image as the captions arrive
+            now = datetime.now()
+            meme_content, meme_image_path = self._stream_meme(meme_prompt, template_info, now.strftime('%Y%m%d_%H%M%S'))
             
             result = {
                 'template_used': template_info['name'],
@@ -68,7 +315,7 @@ Keep it appropriate and funny."""
                 'image_path': meme_image_path,
                 'format': template_info['format'],
                 'user_prompt': user_prompt,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now.isoformat()
             }
             
             return result
@@ -76,32 +323,28 @@ Keep it appropriate and funny."""
         except Exception as e:
             return {"error": f"Meme generation failed: {str(e)}"}
     
-    def _create_text_meme(self, content: str, template_info: Dict) -> Optional[str]:
+    def _meme_base(self, template_name: str) -> Image.Image:
+        """Blank meme canvas with the template label rasterized once per template"""
+        base = self._meme_bases.get(template_name)
+        if base is None:
+            base = self._meme_blank.copy()
+            ImageDraw.Draw(base).text((20, 20), f"Template: {template_name}", fill='black', font=_get_font(DEJAVU_REGULAR, 24))
+            self._meme_bases[template_name] = base
+        return base
+    
+    def _create_text_meme(self, content: str, template_info: Dict, stamp: str) -> Optional[str]:
         """Create a simple text-based meme image"""
         try:
-            # Create image
-            width, height = 800, 600
-            image = Image.new('RGB', (width, height), color='white')
-            draw = ImageDraw.Draw(image)
-            
-            # Try to load a font, fall back to default if not available
-            try:
-                font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
-                font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-            except:
-                font_large = ImageFont.load_default()
-                font_medium = ImageFont.load_default()
-            
             # Extract key text from AI content
             lines = content.split('\n')
             top_text = ""
             bottom_text = ""
             
             for line in lines:
-                if "top text" in line.lower() or "first panel" in line.lower():
-                    top_text = line.split(':', 1)[-1].strip().strip('"')
-                elif "bottom text" in line.lower() or "second panel" in line.lower():
-                    bottom_text = line.split(':', 1)[-1].strip().strip('"')
+                if _TOP_TEXT_RE.search(line):
+                    top_text = _caption(line)
+                elif _BOTTOM_TEXT_RE.search(line):
+                    bottom_text = _caption(line)
             
             # If no specific text found, use first two meaningful lines
             if not top_text and not bottom_text:
@@ -112,26 +355,34 @@ Keep it appropriate and funny."""
                 elif len(meaningful_lines) == 1:
                     top_text = meaningful_lines[0]
             
-            # Draw template name
-            draw.text((20, 20), f"Template: {template_info['name']}", fill='black', font=font_medium)
+            return self._render_meme(top_text, bottom_text, template_info, stamp)
+            
+        except Exception as e:
+            print(f"Meme image creation failed: {e}")
+            return None
+    
+    def _render_meme(self, top_text: str, bottom_text: str, template_info: Dict, stamp: str) -> Optional[str]:
+        """Draw the captions onto the template canvas and save it"""
+        try:
+            image = self._meme_base(template_info['name']).copy()
+            draw = ImageDraw.Draw(image)
+            
+            font_large = _get_font(DEJAVU_BOLD, 36)
             
             # Draw meme text
             if top_text:
-                wrapped_top = textwrap.fill(top_text, width=40)
+                wrapped_top = _wrap40(top_text)
                 draw.text((50, 100), wrapped_top, fill='black', font=font_large)
             
             if bottom_text:
-                wrapped_bottom = textwrap.fill(bottom_text, width=40)
+                wrapped_bottom = _wrap40(bottom_text)
                 draw.text((50, 400), wrapped_bottom, fill='black', font=font_large)
             
             # Save image
-            meme_filename = f"meme_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            meme_filename = f"meme_{stamp}_{next(self._seq)}.png"
             meme_path = os.path.join("downloads", meme_filename)
             
-            # Ensure downloads directory exists
-            os.makedirs("downloads", exist_ok=True)
-            
-            image.save(meme_path)
+            image.save(meme_path, format='PNG', compress_level=1)
             return meme_path
             
         except Exception as e:
@@ -157,32 +408,18 @@ Keep it appropriate and funny."""
                 genre = random.choice(self.story_genres)
             
             # Determine length parameters
-            length_params = {
-                "short": "200-400 words, quick narrative",
-                "medium": "600-1000 words, developed plot with characters",
-                "long": "1200-2000 words, detailed story with multiple scenes"
-            }
-            
-            length_spec = length_params.get(length, length_params["medium"])
+            length_spec = _STORY_LENGTHS.get(length, _STORY_LENGTHS["medium"])
             
-            story_prompt = f"""Write a creative {genre} story based on this prompt: {prompt}
-
-Requirements:
-- Length: {length_spec}
-- Genre: {genre}
-- Include engaging characters, dialogue, and vivid descriptions
-- Create a compelling plot with conflict and resolution
-- Use creative and immersive writing style
-- Make it entertaining and original
-
-Write a complete story that captivates the reader."""
+            story_prompt = _STORY_PROMPT.format(genre=genre, prompt=prompt, length_spec=length_spec)
             
             story_content = ai_services.chat_with_ai(story_prompt, "story_generation")
             
-            # Generate additional elements
-            character_analysis = ai_services.chat_with_ai(f"Analyze the main characters in this story and describe their personalities, motivations, and relationships: {story_content[:500]}...", "character_analysis")
-            
-            themes_analysis = ai_services.chat_with_ai(f"Identify the main themes, literary elements, and message of this story: {story_content[:500]}...", "themes_analysis")
+            # Generate additional elements in one round-trip
+            head = _head(story_content, 500)
+            character_analysis, themes_analysis = ai_services.chat_with_ai_batch([
+                f"Analyze the main characters in this story and describe their personalities, motivations, and relationships: {head}...",
+                f"Identify the main themes, literary elements, and message of this story: {head}..."
+            ], "story_analysis")
             
             result = {
                 'story': story_content,
@@ -203,29 +440,15 @@ Write a complete story that captivates the reader."""
     def generate_workout_plan(self, user_profile: str, goals: str, duration: str = "4 weeks") -> Dict[str, Any]:
         """Generate personalized workout plans"""
         try:
-            workout_prompt = f"""Create a comprehensive {duration} workout plan for this person:
-
-User Profile: {user_profile}
-Goals: {goals}
-
-Include:
-1. Weekly schedule with specific days and exercises
-2. Progressive difficulty over the time period
-3. Warm-up and cool-down routines
-4. Exercise descriptions and proper form tips
-5. Nutrition guidelines to support the goals
-6. Recovery and rest day recommendations
-7. Progress tracking suggestions
-8. Equipment needed (or bodyweight alternatives)
-
-Make it practical, safe, and achievable for the user's profile."""
+            workout_prompt = _WORKOUT_PROMPT.format(duration=duration, user_profile=user_profile, goals=goals)
             
             workout_plan = ai_services.chat_with_ai(workout_prompt, "workout_planning")
             
-            # Generate supplementary advice
-            nutrition_tips = ai_services.chat_with_ai(f"Provide specific nutrition advice for someone with these goals: {goals}. Include meal timing, macro ratios, and supplement recommendations if appropriate.", "nutrition_advice")
-            
-            safety_tips = ai_services.chat_with_ai(f"Provide important safety tips and injury prevention advice for this workout plan: {workout_plan[:300]}...", "safety_advice")
+            # Generate supplementary advice in one round-trip
+            nutrition_tips, safety_tips = ai_services.chat_with_ai_batch([
+                f"Provide specific nutrition advice for someone with these goals: {goals}. Include meal timing, macro ratios, and supplement recommendations if appropriate.",
+                f"Provide important safety tips and injury prevention advice for this workout plan: {_head(workout_plan, 300)}..."
+            ], "workout_advice")
             
             result = {
                 'workout_plan': workout_plan,
@@ -248,31 +471,16 @@ Make it practical, safe, and achievable for the user's profile."""
             if not cuisine_type:
                 cuisine_type = random.choice(self.cuisine_types)
             
-            recipe_prompt = f"""Create a delicious {cuisine_type} recipe with these specifications:
-
-Dietary restrictions: {dietary_restrictions if dietary_restrictions else "None"}
-Available ingredients: {ingredients if ingredients else "Use any appropriate ingredients"}
-
-Provide:
-1. Recipe name and brief description
-2. Complete ingredients list with measurements
-3. Step-by-step cooking instructions
-4. Prep time and cooking time
-5. Serving size
-6. Difficulty level
-7. Nutritional highlights
-8. Chef's tips for best results
-9. Possible variations or substitutions
-10. Wine or beverage pairing suggestions
-
-Make it detailed enough for a home cook to follow successfully."""
+            recipe_prompt = _RECIPE_PROMPT.format(
+                cuisine_type=cuisine_type,
+                dietary_restrictions=dietary_restrictions if dietary_restrictions else "None",
+                ingredients=ingredients if ingredients else "Use any appropriate ingredients")
             
-            recipe_content = ai_services.chat_with_ai(recipe_prompt, "recipe_generation")
+            # Additional culinary content only depends on the cuisine, so it runs alongside the recipe
+            culinary_info = _AI_POOL.submit(self._culinary_info, cuisine_type)
             
-            # Generate additional culinary content
-            cooking_tips = ai_services.chat_with_ai(f"Provide advanced cooking techniques and professional tips for mastering this type of {cuisine_type} cuisine.", "cooking_tips")
-            
-            ingredient_info = ai_services.chat_with_ai(f"Explain the key ingredients in {cuisine_type} cooking, their origins, nutritional benefits, and how to select the best quality.", "ingredient_education")
+            recipe_content = ai_services.chat_with_ai(recipe_prompt, "recipe_generation")
+            cooking_tips, ingredient_info = culinary_info.result()
             
             result = {
                 'recipe': recipe_content,
@@ -292,30 +500,9 @@ Make it detailed enough for a home cook to follow successfully."""
     def generate_poem(self, topic: str, style: str = "free verse", mood: str = "reflective") -> Dict[str, Any]:
         """Generate custom poetry in various styles"""
         try:
-            poetry_styles = {
-                "free verse": "no strict rhyme scheme, natural rhythm",
-                "sonnet": "14 lines with traditional rhyme scheme",
-                "haiku": "3 lines, 5-7-5 syllable pattern",
-                "limerick": "5 lines, AABBA rhyme scheme, humorous",
-                "ballad": "narrative poem with ABAB rhyme scheme",
-                "acrostic": "first letters spell out the topic word"
-            }
+            style_description = _POETRY_STYLES.get(style, _POETRY_STYLES["free verse"])
             
-            style_description = poetry_styles.get(style, poetry_styles["free verse"])
-            
-            poem_prompt = f"""Write a beautiful {style} poem about: {topic}
-
-Style requirements: {style_description}
-Mood: {mood}
-
-Create a poem that:
-- Captures the essence and emotion of the topic
-- Uses vivid imagery and metaphors
-- Follows the {style} format correctly
-- Conveys the {mood} mood throughout
-- Is memorable and impactful
-
-Write with artistic flair and emotional depth."""
+            poem_prompt = _POEM_PROMPT.format(style=style, topic=topic, style_description=style_description, mood=mood)
             
             poem_content = ai_services.chat_with_ai(poem_prompt, "poetry_generation")
             
@@ -339,41 +526,30 @@ Write with artistic flair and emotional depth."""
     def generate_custom_stickers(self, theme: str, count: int = 8) -> Dict[str, Any]:
         """Generate custom sticker pack concepts"""
         try:
-            sticker_prompt = f"""Design a custom sticker pack with the theme: {theme}
-
-Create {count} unique sticker concepts that:
-1. Are expressive and convey different emotions/reactions
-2. Work well in chat conversations
-3. Are visually appealing and memorable
-4. Fit the theme cohesively
-5. Include variety (happy, sad, excited, confused, etc.)
-
-For each sticker, provide:
-- Description of the visual design
-- Emotion/message it conveys
-- Suggested use cases in conversations
-- Color scheme and style notes
-
-Make them creative and fun for messaging apps."""
+            sticker_prompt = _STICKER_PROMPT.format(theme=theme, count=count)
             
             sticker_concepts = ai_services.chat_with_ai(sticker_prompt, "sticker_design")
             
             # Create simple text-based sticker previews
             sticker_files = []
             lines = sticker_concepts.split('\n')
-            sticker_descriptions = [line for line in lines if line.strip() and ('sticker' in line.lower() or 'design' in line.lower())]
+            # Stop scanning once enough sticker lines have been found
+            selected = list(itertools.islice((line for line in lines if line.strip() and _STICKER_RE.search(line)), count))
             
-            for i, desc in enumerate(sticker_descriptions[:count]):
-                sticker_path = self._create_text_sticker(desc, i + 1, theme)
-                if sticker_path:
-                    sticker_files.append(sticker_path)
+            # Each preview is drawn and PNG-encoded independently, so render them in parallel
+            now = datetime.now()
+            if selected:
+                stamp = now.strftime('%Y%m%d_%H%M%S')
+                with ThreadPoolExecutor(max_workers=min(8, len(selected))) as pool:
+                    paths = pool.map(lambda item: self._create_text_sticker(item[1], item[0] + 1, theme, stamp), enumerate(selected))
+                    sticker_files = [path for path in paths if path]
             
             result = {
                 'theme': theme,
                 'sticker_count': count,
                 'concepts': sticker_concepts,
                 'sticker_files': sticker_files,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now.isoformat()
             }
             
             return result
@@ -381,34 +557,28 @@ Make them creative and fun for messaging apps."""
         except Exception as e:
             return {"error": f"Sticker generation failed: {str(e)}"}
     
-    def _create_text_sticker(self, description: str, number: int, theme: str) -> Optional[str]:
+    def _create_text_sticker(self, description: str, number: int, theme: str, stamp: str) -> Optional[str]:
         """Create simple text-based sticker preview"""
         try:
             # Create small square image for sticker
-            size = 200
-            image = Image.new('RGB', (size, size), color='lightblue')
+            image = self._sticker_blank.copy()
             draw = ImageDraw.Draw(image)
             
-            # Try to load font
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-            except:
-                font = ImageFont.load_default()
+            font = _get_font(DEJAVU_BOLD, 20)
             
             # Draw theme and number
             draw.text((10, 10), f"{theme} #{number}", fill='black', font=font)
             
             # Draw simplified description
             desc_short = description[:50] + "..." if len(description) > 50 else description
-            wrapped_desc = textwrap.fill(desc_short, width=15)
+            wrapped_desc = _wrap15(desc_short)
             draw.text((10, 50), wrapped_desc, fill='darkblue', font=font)
             
             # Save sticker
-            sticker_filename = f"sticker_{theme}_{number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            sticker_filename = f"sticker_{theme}_{number}_{stamp}_{next(self._seq)}.png"
             sticker_path = os.path.join("downloads", sticker_filename)
             
-            os.makedirs("downloads", exist_ok=True)
-            image.save(sticker_path)
+            image.save(sticker_path, format='PNG', compress_level=1)
             return sticker_path
             
         except Exception as e:
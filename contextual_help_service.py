@@ -3,7 +3,29 @@ import os
 import random
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from character_customization_service import character_service
+from character_customization_service import get_character_service
+from utils import run_dirty_flusher
+
+# path -> ((st_mtime_ns, st_size), parsed data); instances loading the same unchanged file share one dict
+_JSON_CACHE: Dict[str, tuple] = {}
+
+def _load_json_cached(path: str) -> Dict[str, Any]:
+    """Parse a JSON file, reusing the previous result while its mtime and size are unchanged"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    _JSON_CACHE[path] = (key, data)
+    return data
 
 class ContextualHelpService:
     """
@@ -14,6 +36,7 @@ class ContextualHelpService:
     def __init__(self):
         self.help_triggers_file = "help_triggers.json"
         self.user_help_history_file = "user_help_history.json"
+        self._dirty = False  # unsaved history waiting for run_flusher/flush
         
         self.help_triggers = self.load_help_triggers()
         self.user_help_history = self.load_user_help_history()
@@ -255,13 +278,7 @@ class ContextualHelpService:
     
     def load_help_triggers(self) -> Dict[str, Any]:
         """Load help trigger tracking"""
-        if os.path.exists(self.help_triggers_file):
-            try:
-                with open(self.help_triggers_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        return _load_json_cached(self.help_triggers_file)
     
     def save_help_triggers(self):
         """Save help trigger tracking"""
@@ -270,18 +287,29 @@ class ContextualHelpService:
     
     def load_user_help_history(self) -> Dict[str, Any]:
         """Load user help interaction history"""
-        if os.path.exists(self.user_help_history_file):
-            try:
-                with open(self.user_help_history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        return _load_json_cached(self.user_help_history_file)
+    
+    def _write_user_help_history(self, data: str):
+        """Write serialized history atomically, via a temp file"""
+        tmp_file = self.user_help_history_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_file, self.user_help_history_file)
     
     def save_user_help_history(self):
-        """Save user help interaction history"""
-        with open(self.user_help_history_file, 'w', encoding='utf-8') as f:
-            json.dump(self.user_help_history, f, indent=2, ensure_ascii=False)
+        """Save user help interaction history immediately"""
+        self._dirty = False
+        self._write_user_help_history(json.dumps(self.user_help_history, indent=2, ensure_ascii=False))
+    
+    def flush(self):
+        """Save pending history, if any (called on shutdown)"""
+        if self._dirty:
+            self.save_user_help_history()
+    
+    async def run_flusher(self, interval: float = 30.0):
+        """Write pending history every interval seconds, coalescing bursts of help shown"""
+        await run_dirty_flusher(self, lambda: json.dumps(self.user_help_history, indent=2, ensure_ascii=False),
+                                self._write_user_help_history, interval, "help history")
     
     def should_show_help(self, user_id: str, scenario: str) -> bool:
         """Check if help should be shown based on cooldowns and user history"""
@@ -313,7 +341,7 @@ class ContextualHelpService:
             return None
         
         # Get user's character type
-        user_char = character_service.get_user_character(user_id)
+        user_char = get_character_service().get_user_character(user_id)
         character_type = user_char.get("character_type", "cheerful")
         
         # Get help scenario
@@ -348,7 +376,7 @@ class ContextualHelpService:
             'count': self.user_help_history[user_id].get(scenario, {}).get('count', 0) + 1
         }
         
-        self.save_user_help_history()
+        self._dirty = True
     
     def trigger_help_for_command_error(self, user_id: str, command: str) -> Optional[str]:
         """Show help for command not found errors"""
@@ -397,13 +425,13 @@ class ContextualHelpService:
         user_id = str(user_id)
         if user_id in self.user_help_history:
             del self.user_help_history[user_id]
-            self.save_user_help_history()
+            self._dirty = True
             return True
         return False
     
     def create_custom_help_bubble(self, user_id: str, message: str, bubble_type: str = "info") -> str:
         """Create a custom help bubble with user's character style"""
-        user_char = character_service.get_user_character(user_id)
+        user_char = get_character_service().get_user_character(user_id)
         character_type = user_char.get("character_type", "cheerful")
         
         # Get appropriate emoji for bubble type
@@ -425,6 +453,4 @@ class ContextualHelpService:
 
 # Create global instance for import
 help_service = ContextualHelpService()
-
-# Initialize global service
-contextual_help_service = ContextualHelpService()
\ No newline at end of file
+contextual_help_service = help_service
\ No newline at end of file
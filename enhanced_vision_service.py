@@ -1,6 +1,10 @@
 import base64
+import io
 import os
 import json
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from ai_services import gemini_vision_analyze
 from PIL import Image, ImageEnhance, ImageFilter
@@ -31,27 +35,38 @@ try:
 except ImportError:
     FACE_RECOGNITION_AVAILABLE = False
 
+# Maximum number of OCR results kept in memory
+OCR_CACHE_SIZE = 256
+
 class EnhancedVisionService:
     """Advanced image and video analysis with OCR, face recognition, and object detection"""
     
     def __init__(self):
-        self.ocr_cache = {}
+        # OCR results keyed by digest of the image bytes, LRU-evicted
+        self.ocr_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
         self.face_cache = {}
         self.analysis_cache = {}
     
     def extract_text_from_image(self, image_path: str) -> Dict[str, Any]:
         """Extract and analyze text from images using OCR"""
         try:
-            if not os.path.exists(image_path):
+            try:
+                with open(image_path, 'rb') as f:
+                    image_bytes = f.read()
+            except FileNotFoundError:
                 return {"error": "Image file not found"}
             
-            # Check cache first
-            cache_key = f"{image_path}_{os.path.getmtime(image_path)}"
-            if cache_key in self.ocr_cache:
-                return self.ocr_cache[cache_key]
+            # Check cache first; the same picture resent under a new path still hits
+            cache_key = hashlib.blake2b(image_bytes, digest_size=16).digest()
+            with self._ocr_cache_lock:
+                cached = self.ocr_cache.get(cache_key)
+                if cached is not None:
+                    self.ocr_cache.move_to_end(cache_key)
+                    return cached
             
             # Load and enhance image for better OCR
-            image = Image.open(image_path)
+            image = Image.open(io.BytesIO(image_bytes))
             
             # Convert to RGB if needed
             if image.mode != 'RGB':
@@ -139,7 +154,10 @@ class EnhancedVisionService:
                     }
                 
             # Cache the result
-            self.ocr_cache[cache_key] = result
+            with self._ocr_cache_lock:
+                self.ocr_cache[cache_key] = result
+                if len(self.ocr_cache) > OCR_CACHE_SIZE:
+                    self.ocr_cache.popitem(last=False)
             return result
                 
         except Exception as e:
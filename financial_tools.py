@@ -168,7 +168,7 @@ class FinancialTools:
                                 message += f"⏰ **Time**: {datetime.now().strftime('%H:%M:%S')}"
                                 
                                 try:
-                                    await self.bot.send_message(chat_id=user_id, text=message)
+                                    await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                     stock_sub["active"] = False  # Deactivate after alert
                                     self.save_subscriptions()
                                 except Exception as e:
@@ -262,7 +262,7 @@ class FinancialTools:
                                 message += f"⏰ **Time**: {datetime.now().strftime('%H:%M:%S')}"
                                 
                                 try:
-                                    await self.bot.send_message(chat_id=user_id, text=message)
+                                    await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                     forex_sub["active"] = False
                                     self.save_subscriptions()
                                 except Exception as e:
@@ -352,7 +352,7 @@ class FinancialTools:
                                 message += f"💰 **Est. EPS**: ${earning['estimate']}\n\n"
                             
                             try:
-                                await self.bot.send_message(chat_id=user_id, text=message)
+                                await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 earnings_sub["last_check"] = datetime.now().isoformat()
                                 self.save_subscriptions()
                             except Exception as e:
@@ -414,7 +414,7 @@ class FinancialTools:
                                 message += f"📊 **Forecast**: {event['forecast']}\n\n"
                             
                             try:
-                                await self.bot.send_message(chat_id=user_id, text=message)
+                                await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 economic_sub["last_check"] = datetime.now().isoformat()
                                 self.save_subscriptions()
                             except Exception as e:
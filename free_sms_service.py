@@ -1,6 +1,7 @@
 import requests
 import json
 import os
+import asyncio
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
@@ -230,6 +231,10 @@ class FreeSMSService:
                 'provider': 'SMS Gateway Bangladesh'
             }
     
+    async def send_free_sms_async(self, phone: str, message: str, country_code: str = 'US') -> Dict[str, Any]:
+        """Send SMS without blocking the event loop (providers are called via requests)"""
+        return await asyncio.to_thread(self.send_free_sms, phone, message, country_code)
+    
     def send_free_sms(self, phone: str, message: str, country_code: str = 'US') -> Dict[str, Any]:
         """Send SMS using available free services"""
         self.reset_daily_usage_if_needed()
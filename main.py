@@ -6,8 +6,10 @@ import time
 import signal
 import sys
 from flask import Flask
-from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from telegram.ext import Application, CommandHandler, MessageHandler, Defaults, filters
 from telegram import BotCommand
+from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 from telegram.error import Conflict, TimedOut, NetworkError
 from bot_handlers import BotHandlers, realtime_service, group_surveillance, admin_controls
 from realtime_service import RealTimeService
@@ -72,7 +74,7 @@ async def error_handler(update, context):
     if update and update.effective_message:
         try:
             await update.effective_message.reply_text(
-                "❌ An error occurred while processing your request. Please try again later."
+                "❌ An error occurred while processing your request. Please try again later.", parse_mode=None
             )
         except Exception as e:
             logger.error(f"Error sending error message: {e}")
@@ -90,8 +92,16 @@ def main():
     start_multi_keep_alive()
     logger.info("Enhanced multi-layer keep-alive system started for guaranteed 24/7 uptime")
     
-    # Create application with job queue
-    application = Application.builder().token(TELEGRAM_TOKEN).build()
+    # Create application with job queue; Markdown is the default parse mode for every send.
+    # Sends and uploads share one keep-alive pool, polling gets its own so it is never starved
+    application = (
+        Application.builder()
+        .token(TELEGRAM_TOKEN)
+        .defaults(Defaults(parse_mode=ParseMode.MARKDOWN))
+        .request(HTTPXRequest(connection_pool_size=64, pool_timeout=5.0))
+        .get_updates_request(HTTPXRequest(connection_pool_size=1, pool_timeout=5.0))
+        .build()
+    )
     
     # Create bot handlers instance
     handlers = BotHandlers()
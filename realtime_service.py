@@ -160,7 +160,7 @@ class RealTimeService:
                             message += f"⏰ **Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
                             
                             try:
-                                await self.bot.send_message(chat_id=user_id, text=message)
+                                await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 # Deactivate alert after sending
                                 alert["active"] = False
                                 self.save_subscriptions()
@@ -220,7 +220,7 @@ class RealTimeService:
                                 message += f"  🔗 {item['url']}\n\n"
                             
                             try:
-                                await self.bot.send_message(chat_id=user_id, text=message)
+                                await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 news_sub["last_update"] = datetime.now().isoformat()
                                 self.save_subscriptions()
                             except Exception as e:
@@ -280,7 +280,7 @@ class RealTimeService:
                                     message += f"⚠️ {alert}\n"
                                 
                                 try:
-                                    await self.bot.send_message(chat_id=user_id, text=message)
+                                    await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 except Exception as e:
                                     logger.error(f"Failed to send weather alert to {user_id}: {e}")
                 
@@ -346,7 +346,7 @@ class RealTimeService:
                     message = f"⏰ **Reminder!**\n\n📝 {reminder['message']}"
                     
                     try:
-                        await self.bot.send_message(chat_id=user_id, text=message)
+                        await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                         logger.info(f"Sent reminder to {user_id}")
                     except Exception as e:
                         logger.error(f"Failed to send reminder to {user_id}: {e}")
@@ -388,7 +388,7 @@ class RealTimeService:
             for user_id, subscriptions in self.user_subscriptions.items():
                 if alert_type in subscriptions.get("enabled_alerts", []):
                     try:
-                        await self.bot.send_message(chat_id=user_id, text=message)
+                        await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                     except Exception as e:
                         logger.error(f"Failed to broadcast to {user_id}: {e}")
                         
@@ -344,7 +344,7 @@ class SmartHomeService:
                 message += f"\n📅 Time: {datetime.now().strftime('%H:%M:%S')}"
                 
                 try:
-                    await self.bot.send_message(chat_id=user_id, text=message)
+                    await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                 except Exception as e:
                     logger.error(f"Failed to send sensor alert to {user_id}: {e}")
                     
@@ -379,7 +379,7 @@ class SmartHomeService:
                                 message += f"⏰ **Time**: {current_time.strftime('%H:%M:%S')}"
                                 
                                 try:
-                                    await self.bot.send_message(chat_id=user_id, text=message)
+                                    await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 except Exception as e:
                                     logger.error(f"Failed to send automation notification to {user_id}: {e}")
                 
@@ -475,7 +475,7 @@ class SmartHomeService:
                         message += f"\nCheck device connectivity and power status."
                         
                         try:
-                            await self.bot.send_message(chat_id=user_id, text=message)
+                            await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                         except Exception as e:
                             logger.error(f"Failed to send device health alert to {user_id}: {e}")
                 
@@ -1,12 +1,16 @@
 import os
 import json
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Callable
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioException
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of SMS requests in flight during a bulk send
+BULK_SMS_CONCURRENCY = 10
+
 class SMSService:
     def __init__(self):
         # Twilio credentials
@@ -18,6 +22,7 @@ class SMSService:
         self.client = None
         if self.account_sid and self.auth_token:
             self.client = Client(self.account_sid, self.auth_token)
+        self._configured_cache: Optional[bool] = None
         
         # SMS logs for tracking
         self.sms_logs = self.load_sms_logs()
@@ -37,6 +42,7 @@ class SMSService:
             "ER": "+291", "CF": "+236", "TD": "+235", "CM": "+237", "GQ": "+240",
             "GA": "+241", "CG": "+242", "CD": "+243", "AO": "+244", "ST": "+239"
         }
+        self.country_codes_frozen = frozenset(self.country_codes)
     
     def load_sms_logs(self) -> Dict[str, Any]:
         """Load SMS logs from file"""
@@ -119,7 +125,8 @@ class SMSService:
                 }
             
             # Send SMS via Twilio
-            sms_message = self.client.messages.create(
+            sms_message = await asyncio.to_thread(
+                self.client.messages.create,
                 body=message,
                 from_=self.phone_number,
                 to=formatted_phone
@@ -183,9 +190,11 @@ class SMSService:
                 "phone": phone_number
             }
     
-    async def send_bulk_sms(self, recipients: List[Dict[str, str]], message: str) -> Dict[str, Any]:
+    async def send_bulk_sms(self, recipients: List[Dict[str, str]], message: str,
+                            on_progress: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
         """Send SMS to multiple recipients
         recipients format: [{"phone": "+1234567890", "country": "US", "name": "Optional"}, ...]
+        on_progress is called once per finished recipient
         """
         results = {
             "total": len(recipients),
@@ -194,12 +203,24 @@ class SMSService:
             "details": []
         }
         
-        for recipient in recipients:
+        semaphore = asyncio.Semaphore(BULK_SMS_CONCURRENCY)
+        
+        async def send_one(recipient):
+            async with semaphore:
+                try:
+                    return await self.send_sms(recipient.get("phone", ""), message, recipient.get("country", ""))
+                finally:
+                    if on_progress:
+                        on_progress()
+        
+        sent = await asyncio.gather(*(send_one(r) for r in recipients), return_exceptions=True)
+        
+        for recipient, result in zip(recipients, sent):
             phone = recipient.get("phone", "")
-            country = recipient.get("country", "")
             name = recipient.get("name", "Unknown")
             
-            result = await self.send_sms(phone, message, country)
+            if isinstance(result, Exception):
+                result = {"success": False, "error": str(result)}
             
             if result["success"]:
                 results["successful"] += 1
@@ -268,7 +289,13 @@ class SMSService:
     
     def is_service_configured(self) -> bool:
         """Check if SMS service is properly configured"""
-        return bool(self.client and self.phone_number)
+        if self._configured_cache is None:
+            self._configured_cache = bool(self.client and self.phone_number)
+        return self._configured_cache
+    
+    def invalidate_config_cache(self):
+        """Forget the cached configuration state after credentials change"""
+        self._configured_cache = None
     
     def get_setup_instructions(self) -> str:
         """Get setup instructions for SMS service"""
@@ -140,7 +140,7 @@ class SocialMonitoringService:
                                 message += f"  ❤️ {mention['likes']} | 🔄 {mention['retweets']}\n\n"
                             
                             try:
-                                await self.bot.send_message(chat_id=user_id, text=message)
+                                await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 twitter_sub["last_check"] = datetime.now().isoformat()
                                 self.save_subscriptions()
                             except Exception as e:
@@ -198,7 +198,7 @@ class SocialMonitoringService:
                                 message += f"  👍 {data['upvotes']} | 💬 {data['comments']} | Sentiment: {data['sentiment']:.1f}/1.0\n\n"
                             
                             try:
-                                await self.bot.send_message(chat_id=user_id, text=message)
+                                await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 reddit_sub["last_check"] = datetime.now().isoformat()
                                 self.save_subscriptions()
                             except Exception as e:
@@ -257,7 +257,7 @@ class SocialMonitoringService:
                                 message += f"👥 {update['views']} views\n\n"
                             
                             try:
-                                await self.bot.send_message(chat_id=user_id, text=message)
+                                await self.bot.send_message(chat_id=user_id, text=message, parse_mode=None)
                                 telegram_sub["last_check"] = datetime.now().isoformat()
                                 self.save_subscriptions()
                             except Exception as e:
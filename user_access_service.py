@@ -1,11 +1,17 @@
 import json
 import os
-from typing import Dict, List, Set, Any
+import time
+from typing import Dict, List, Set, Any, Tuple
 from datetime import datetime
+from collections import OrderedDict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached check_access result stays valid, and how many (user, feature) results are kept
+ACCESS_CACHE_TTL = 30.0
+ACCESS_CACHE_SIZE = 4096
+
 class UserAccessService:
     def __init__(self):
         self.access_data = self.load_access_data()
@@ -15,6 +21,9 @@ class UserAccessService:
             'vip': ['chat', 'wiki', 'translate', 'download', 'crypto', 'accessibility', 'voice', 'advanced_features', 'free_sms', 'premium_tools'],
             'admin': ['all']  # Full access to everything
         }
+        
+        # (user_id, feature) -> (allowed, valid_until monotonic), LRU-evicted
+        self._access_cache: "OrderedDict[Tuple[str, str], Tuple[bool, float]]" = OrderedDict()
     
     def load_access_data(self) -> Dict[str, Any]:
         """Load user access data from file"""
@@ -39,6 +48,7 @@ class UserAccessService:
     
     def save_access_data(self):
         """Save user access data to file"""
+        self._access_cache.clear()
         try:
             with open('user_access.json', 'w', encoding='utf-8') as f:
                 json.dump(self.access_data, f, indent=2, ensure_ascii=False)
@@ -142,6 +152,29 @@ class UserAccessService:
         default_features = self.permission_levels.get(default_level, [])
         return feature in default_features
     
+    def check_access_cached(self, user_id: str, feature: str) -> bool:
+        """check_access with a short TTL cache; cleared whenever access data is saved"""
+        key = (user_id, feature)
+        now = time.monotonic()
+        hit = self._access_cache.get(key)
+        if hit and now < hit[1]:
+            self._access_cache.move_to_end(key)
+            return hit[0]
+        
+        allowed = self.check_access(user_id, feature)
+        ttl = ACCESS_CACHE_TTL
+        if allowed:
+            # Never keep allowing past a temporary grant's own expiry
+            expiry_time = self.access_data['temporary_access'].get(user_id, {}).get(feature)
+            if expiry_time is not None:
+                ttl = min(ttl, expiry_time - datetime.now().timestamp())
+        if ttl > 0:
+            self._access_cache[key] = (allowed, now + ttl)
+            self._access_cache.move_to_end(key)
+            if len(self._access_cache) > ACCESS_CACHE_SIZE:
+                self._access_cache.popitem(last=False)
+        return allowed
+    
     def cleanup_expired_access(self):
         """Remove expired temporary access"""
         current_time = datetime.now().timestamp()
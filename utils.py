@@ -1,13 +1,22 @@
 import json
 import os
 import time
+import asyncio
+import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from config import USER_DATABASE_FILE, ADMIN_MESSAGES_FILE, DOWNLOADS_DIR, RATE_LIMIT_MESSAGES, RATE_LIMIT_MEDIA_DOWNLOADS, RATE_LIMIT_BROADCASTS
 
+logger = logging.getLogger(__name__)
+
 class UserDatabase:
     def __init__(self):
         self.data = self.load_database()
+        self._user_count = len(self.data.get("users", {}))
+    
+    @property
+    def user_count(self) -> int:
+        return self._user_count
     
     def load_database(self) -> Dict[str, Any]:
         if os.path.exists(USER_DATABASE_FILE):
@@ -40,6 +49,7 @@ class UserDatabase:
                 }
             }
             self.data["stats"]["total_users"] += 1
+            self._user_count += 1
             self.save_database()
     
     def update_user_activity(self, user_id: str):
@@ -158,6 +168,24 @@ def clean_old_downloads():
             except Exception as e:
                 print(f"Error removing old download {filepath}: {e}")
 
+async def run_dirty_flusher(owner, serialize, write, interval: float, what: str):
+    """Every interval seconds, save owner's data if owner._dirty is set.
+    
+    serialize runs on the event loop so it sees a consistent snapshot; write runs in a thread.
+    Failures are logged and retried next round instead of ending the loop.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        if not owner._dirty:
+            continue
+        owner._dirty = False
+        try:
+            data = serialize()
+            await asyncio.to_thread(write, data)
+        except Exception as e:
+            owner._dirty = True
+            logger.error(f"Error saving {what}: {e}")
+
 def escape_markdown(text: str) -> str:
     """Escape markdown special characters"""
     special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']